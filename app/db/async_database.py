@@ -0,0 +1,97 @@
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.db.database import (
+    DATABASE_URL, apply_sqlite_tuning, pool_options, sqlite_read_only_url, read_breaker
+)
+from config import settings
+
+def to_async_url(url: str) -> str:
+    """
+    동기 DATABASE_URL을 비동기 드라이버 URL로 변환합니다.
+
+    - sqlite:///...          -> sqlite+aiosqlite:///...
+    - postgresql://...       -> postgresql+asyncpg://...
+    """
+    scheme, sep, rest = url.partition("://")
+    base = scheme.split("+")[0]
+    if base == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    if base in ("postgresql", "postgres"):
+        return f"postgresql+asyncpg{sep}{rest}"
+    return url
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+def _read_database_url() -> str:
+    """GET 라우트용 읽기 엔진 URL (database.py의 읽기 풀/복제본과 같은 조건, 없으면 빈 문자열)"""
+    if DATABASE_URL.startswith("sqlite"):
+        database_file = make_url(DATABASE_URL).database
+        if settings.sqlite_read_pool and database_file and database_file != ":memory:":
+            return sqlite_read_only_url(DATABASE_URL)
+        return ""
+    return settings.database_read_url
+
+# 비동기 엔진은 실제로 사용할 때 생성 (aiosqlite/asyncpg가 없는 환경에서도 import 가능하도록)
+_async_engine = None
+_async_read_engine = None
+_AsyncSessionLocal = None
+_AsyncReadSessionLocal = None
+
+def _create_engine(url: str, read_only: bool = False):
+    if url.startswith("sqlite"):
+        # aiosqlite 기본값(NullPool)은 요청마다 커넥션과 스레드를 새로 만들므로 동기 엔진처럼 풀 사용
+        engine = create_async_engine(to_async_url(url), poolclass=AsyncAdaptedQueuePool)
+        apply_sqlite_tuning(engine.sync_engine, read_only=read_only)
+        return engine
+    connect_args = {"timeout": settings.database_read_connect_timeout} if read_only else {}
+    return create_async_engine(to_async_url(url), connect_args=connect_args, **pool_options())
+
+def get_async_engine():
+    global _async_engine, _async_read_engine, _AsyncSessionLocal, _AsyncReadSessionLocal
+    if _async_engine is None:
+        _async_engine = _create_engine(DATABASE_URL)
+        _AsyncSessionLocal = async_sessionmaker(
+            _async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+        read_url = _read_database_url()
+        if read_url:
+            _async_read_engine = _create_engine(read_url, read_only=True)
+            _AsyncReadSessionLocal = async_sessionmaker(
+                _async_read_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+            )
+    return _async_engine
+
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    """
+    GET 라우트용 비동기 세션 (get_read_db와 같은 동작)
+    읽기 전용 풀/복제본이 없거나 연결할 수 없으면 기본 엔진을 사용하며,
+    연결 실패는 database.read_breaker에 기록해 잠시 동안 복제본 시도를 건너뜁니다.
+    """
+    get_async_engine()
+    if _AsyncReadSessionLocal is not None and read_breaker.available():
+        db = _AsyncReadSessionLocal()
+        try:
+            await db.connection()
+            read_breaker.record_success()
+        except OperationalError:
+            await db.close()
+            read_breaker.record_failure()
+            db = _AsyncSessionLocal()
+    else:
+        db = _AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+async def dispose_async_engine():
+    for engine in (_async_read_engine, _async_engine):
+        if engine is not None:
+            await engine.dispose()
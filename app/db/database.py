@@ -1,18 +1,107 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.models.models import Base
+from config import settings
+from threading import Lock
+import logging
 import os
+import time
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # SQLite를 기본으로 사용 (파일 기반 데이터베이스)
 DATABASE_URL = os.getenv(
     "DATABASE_URL", 
     "sqlite:///./yapper_dash.db"  # 현재 디렉토리에 yapper_dash.db 파일 생성
 )
 
+def sqlite_pragmas() -> list:
+    """config.Settings의 SQLite 튜닝 프로필을 PRAGMA 문 목록으로 변환합니다."""
+    pragmas = [
+        ("journal_mode", settings.sqlite_journal_mode),
+        ("synchronous", settings.sqlite_synchronous),
+        ("mmap_size", settings.sqlite_mmap_size),
+        ("cache_size", settings.sqlite_cache_size),
+        ("busy_timeout", settings.sqlite_busy_timeout),
+        ("temp_store", settings.sqlite_temp_store),
+    ]
+    return [f"PRAGMA {name}={value}" for name, value in pragmas if value not in (None, "")]
+
+def apply_sqlite_tuning(target_engine, read_only: bool = False) -> None:
+    """
+    새 SQLite 커넥션이 만들어질 때마다 튜닝 PRAGMA를 적용하는 connect 이벤트를 등록합니다.
+    journal_mode는 DB 파일에 기록되는 설정이므로 읽기 전용 커넥션에서는 생략합니다.
+    """
+    statements = [
+        statement for statement in sqlite_pragmas()
+        if not (read_only and statement.startswith("PRAGMA journal_mode"))
+    ]
+
+    @event.listens_for(target_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+def sqlite_read_only_url(url: str) -> str:
+    """sqlite:///path 를 읽기 전용 URI(file:path?mode=ro&uri=true)로 변환합니다."""
+    database = make_url(url).database
+    return f"sqlite:///file:{database}?mode=ro&uri=true"
+
+def pool_options() -> dict:
+    """서버 DB(PostgreSQL 등)용 커넥션 풀 설정 (config.Settings)"""
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+def read_connect_args(url: str) -> dict:
+    """읽기 복제본 연결 제한 시간 (복제본이 응답하지 않을 때 GET 요청이 오래 막히지 않도록)"""
+    if make_url(url).get_backend_name() == "postgresql":
+        return {"connect_timeout": settings.database_read_connect_timeout}
+    return {}
+
+class ReadReplicaBreaker:
+    """
+    읽기 복제본 상태 캐시 (간단한 서킷 브레이커)
+
+    연결에 실패하면 retry_interval초 동안은 복제본을 시도하지 않고 바로 기본 DB를 사용해,
+    복제본 장애 중에 GET 요청마다 연결 제한 시간만큼 기다리지 않도록 합니다.
+    """
+
+    def __init__(self, retry_interval: float, clock=time.monotonic):
+        self.retry_interval = retry_interval
+        self.clock = clock
+        self._open_until = 0.0
+        self._lock = Lock()
+
+    def available(self) -> bool:
+        """복제본을 시도해도 되는지 (실패 후 retry_interval이 지났으면 다시 시도)"""
+        return self.clock() >= self._open_until
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._open_until = self.clock() + self.retry_interval
+        logger.warning("읽기 복제본에 연결할 수 없어 %.0f초 동안 기본 DB를 사용합니다", self.retry_interval)
+
+    def record_success(self) -> None:
+        if self._open_until:
+            with self._lock:
+                self._open_until = 0.0
+
+read_engine = None
+read_breaker = ReadReplicaBreaker(settings.database_read_retry_interval)
+
 # SQLite 연결 설정
 if DATABASE_URL.startswith("sqlite"):
     # SQLite는 check_same_thread=False 필요 (FastAPI 멀티스레드 환경)
@@ -20,11 +109,30 @@ if DATABASE_URL.startswith("sqlite"):
         DATABASE_URL, 
         connect_args={"check_same_thread": False}
     )
+    apply_sqlite_tuning(engine)
+    
+    # GET 라우트용 읽기 전용 커넥션 풀 (파일 DB만 가능)
+    database_file = make_url(DATABASE_URL).database
+    if settings.sqlite_read_pool and database_file and database_file != ":memory:":
+        read_engine = create_engine(
+            sqlite_read_only_url(DATABASE_URL),
+            connect_args={"check_same_thread": False}
+        )
+        apply_sqlite_tuning(read_engine, read_only=True)
 else:
     # PostgreSQL 등 다른 DB 사용시
-    engine = create_engine(DATABASE_URL)
+    engine = create_engine(DATABASE_URL, **pool_options())
+    
+    # GET 라우트용 읽기 복제본
+    if settings.database_read_url:
+        read_engine = create_engine(
+            settings.database_read_url,
+            connect_args=read_connect_args(settings.database_read_url),
+            **pool_options()
+        )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine or engine)
 
 def get_db():
     db = SessionLocal()
@@ -33,5 +141,59 @@ def get_db():
     finally:
         db.close()
 
-def create_tables():
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+def get_read_db():
+    """
+    GET 라우트용 세션
+    읽기 전용 풀/복제본이 없거나 연결할 수 없으면 기본 엔진을 사용합니다.
+    연결에 실패하면 read_breaker가 잠시 동안 복제본 시도를 건너뜁니다.
+    """
+    if read_engine is None or not read_breaker.available():
+        db = SessionLocal()
+    else:
+        db = ReadSessionLocal()
+        try:
+            db.connection()
+            read_breaker.record_success()
+        except OperationalError:
+            db.close()
+            read_breaker.record_failure()
+            db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def run_migrations(revision: str = "head", bind=None):
+    """Alembic 마이그레이션을 지정한 리비전까지 적용합니다 (migrations/)."""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PROJECT_ROOT, "migrations"))
+    with (bind or engine).begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+def create_tables(bind=None):
+    """
+    마이그레이션, 전문 검색 인덱스, 통계 카운터를 준비합니다 (서버 시작, init_db.py).
+
+    Args:
+        bind: 사용할 엔진 (기본값: DATABASE_URL 엔진)
+    """
+    from app.utils.search import setup_search_index
+    from app.utils.counters import ensure_counters
+
+    bind = bind or engine
+    # 테이블과 인덱스는 마이그레이션으로 관리 (create_all로 만든 기존 DB도 업그레이드됨)
+    run_migrations(bind=bind)
+    setup_search_index(bind)
+
+    # 기존 DB에 통계 카운터가 없으면 원본 테이블에서 계산
+    db = sessionmaker(autocommit=False, autoflush=False, bind=bind)()
+    try:
+        ensure_counters(db)
+    finally:
+        db.close()
\ No newline at end of file
@@ -0,0 +1,69 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class QueryStats:
+    """한 요청(또는 블록) 동안 실행된 SQL 수와 DB 시간"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # 초
+        self.statements = []
+
+    @property
+    def duration_ms(self) -> float:
+        return round(self.duration * 1000, 2)
+
+# 현재 요청의 통계 (요청 밖에서 실행된 쿼리는 집계하지 않음)
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+_installed = False
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += time.perf_counter() - started
+        stats.statements.append(statement)
+
+def install_query_instrumentation() -> None:
+    """
+    모든 엔진(동기/비동기의 sync_engine, 읽기 전용 풀 포함)에 SQL 실행 훅을 등록합니다.
+    여러 번 호출해도 한 번만 등록됩니다.
+    """
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    _installed = True
+
+@contextmanager
+def track_queries():
+    """
+    블록 안에서 실행된 SQL을 집계합니다. 미들웨어와 테스트에서 사용합니다.
+
+    Example:
+        with track_queries() as stats:
+            client.get("/api/tweets")
+        assert stats.count <= 3
+    """
+    install_query_instrumentation()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Table
+from sqlalchemy import Column, Integer, String, DateTime, Date, Boolean, Text, ForeignKey, Table, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from app.models.types import CompactUUID
 from datetime import datetime
 import uuid
 
@@ -10,8 +10,10 @@ Base = declarative_base()
 tweet_tags = Table(
     'tweet_tags',
     Base.metadata,
-    Column('tweet_id', UUID(as_uuid=True), ForeignKey('tweets.id'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True)
+    Column('tweet_id', CompactUUID(), ForeignKey('tweets.id'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    # 기본키는 tweet_id가 앞이므로 태그 기준 조회용 역방향 인덱스
+    Index('ix_tweet_tags_tag_id_tweet_id', 'tag_id', 'tweet_id')
 )
 
 class User(Base):
@@ -28,7 +30,7 @@ class User(Base):
 class Tweet(Base):
     __tablename__ = "tweets"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(CompactUUID(), primary_key=True, default=uuid.uuid4, index=True)
     user_id = Column(Integer, ForeignKey("users.telegram_id"), index=True)
     tweet_url = Column(String(500), nullable=False)
     tweet_id = Column(String(50), unique=True, index=True)
@@ -40,6 +42,13 @@ class Tweet(Base):
     
     user = relationship("User", back_populates="tweets")
     tags = relationship("Tag", secondary=tweet_tags, back_populates="tweets")
+    
+    __table_args__ = (
+        # 최신순/오래된순 목록과 (created_at, id) keyset 커서
+        Index("ix_tweets_created_at_id", "created_at", "id"),
+        # 사용자별 트윗 목록
+        Index("ix_tweets_user_id_created_at", "user_id", "created_at", "id"),
+    )
 
 class Tag(Base):
     __tablename__ = "tags"
@@ -47,10 +56,86 @@ class Tag(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), unique=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
-    tweet_count = Column(Integer, default=0)
+    tweet_count = Column(Integer, default=0)  # 트윗 연결/해제 시 트랜잭션 안에서 갱신
     is_active = Column(Boolean, default=True)  # 활성/비활성 상태
     is_core = Column(Boolean, default=False)  # 핵심 태그 여부 (초기 태그)
     created_by = Column(Integer, ForeignKey("users.telegram_id"), nullable=True)  # 생성한 사용자
     
     tweets = relationship("Tweet", secondary=tweet_tags, back_populates="tags")
-    creator = relationship("User", foreign_keys=[created_by])
\ No newline at end of file
+    creator = relationship("User", foreign_keys=[created_by])
+    
+    __table_args__ = (
+        # sort_by=popular (활성 태그를 tweet_count 내림차순) 인덱스 스캔용
+        Index("ix_tags_active_tweet_count", "is_active", "tweet_count"),
+    )
+
+class StatCounter(Base):
+    """전체 통계 카운터 (tweets, users, tags) - 쓰기 트랜잭션에서 함께 갱신"""
+    __tablename__ = "stat_counters"
+    
+    name = Column(String(50), primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
+
+class DailyTweetCount(Base):
+    """일별 트윗 수 (created_at 날짜 기준)"""
+    __tablename__ = "daily_tweet_counts"
+    
+    day = Column(Date, primary_key=True)
+    tweet_count = Column(Integer, nullable=False, default=0)
+
+class UserTweetCount(Base):
+    """사용자별 트윗 수 - most_active_user 조회용"""
+    __tablename__ = "user_tweet_counts"
+    
+    user_id = Column(Integer, ForeignKey("users.telegram_id"), primary_key=True)
+    tweet_count = Column(Integer, nullable=False, default=0, index=True)
+
+class TagRollup(Base):
+    """
+    태그별 시간 버킷 트윗 수 - 인기 태그, 타임시리즈용
+    period는 hour(시 단위) 또는 day(일 단위), bucket은 구간 시작 시각 (created_at 기준)
+    """
+    __tablename__ = "tag_rollups"
+    
+    period = Column(String(8), primary_key=True)
+    bucket = Column(DateTime, primary_key=True)
+    tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True)
+    tweet_count = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        # 특정 태그의 타임시리즈 조회용 (기본키는 기간별 전체 태그 집계용)
+        Index("ix_tag_rollups_tag_id_period_bucket", "tag_id", "period", "bucket"),
+    )
+
+class UserRollup(Base):
+    """사용자별 시간 버킷 트윗 수 - 상위 기여자, 타임시리즈용 (TagRollup과 같은 구조)"""
+    __tablename__ = "user_rollups"
+    
+    period = Column(String(8), primary_key=True)
+    bucket = Column(DateTime, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.telegram_id"), primary_key=True)
+    tweet_count = Column(Integer, nullable=False, default=0)
+    
+    __table_args__ = (
+        Index("ix_user_rollups_user_id_period_bucket", "user_id", "period", "bucket"),
+    )
+
+class EnrichmentJob(Base):
+    """
+    트윗 미리보기(content_preview, image_url) 수집 대기열
+    트윗 등록 트랜잭션에서 함께 추가되고, 백그라운드 워커가 처리 후 삭제합니다.
+    """
+    __tablename__ = "enrichment_queue"
+    
+    tweet_id = Column(String(50), primary_key=True)  # 트위터 status ID (Tweet.tweet_id)
+    status = Column(String(16), nullable=False, default="pending")  # pending 또는 failed
+    attempts = Column(Integer, nullable=False, default=0)
+    # 이 시각 이후에 처리 (재시도 대기, 처리 중인 작업의 임대 만료 시각)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error = Column(Text)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # 처리할 작업을 오래된 순으로 꺼내는 조회용
+        Index("ix_enrichment_queue_status_available_at", "status", "available_at"),
+    )
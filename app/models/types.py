@@ -0,0 +1,37 @@
+from sqlalchemy.types import TypeDecorator, LargeBinary
+from sqlalchemy.dialects import postgresql
+import uuid
+
+class CompactUUID(TypeDecorator):
+    """
+    UUID 컬럼 타입
+
+    PostgreSQL에서는 네이티브 UUID, SQLite 등에서는 16바이트 BLOB으로 저장합니다.
+    (기존 postgresql.UUID는 SQLite에서 32자 hex 문자열이 되어 키와 인덱스가 두 배로 커짐)
+    BLOB의 바이트 순서는 hex 문자열 순서와 같으므로 정렬/범위 조회 결과는 동일합니다.
+    애플리케이션에서는 항상 uuid.UUID로 다룹니다.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, (bytes, memoryview)):
+            return uuid.UUID(bytes=bytes(value))
+        # 마이그레이션 전의 32자 hex 문자열
+        return uuid.UUID(str(value))
@@ -0,0 +1,165 @@
+from fastapi import APIRouter, Depends, Response
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.db.async_database import get_async_read_db
+from app.models.models import Tweet
+from app.routers import tweets, users, tags, stats
+from app.schemas.schemas import StatsResponse
+from app.utils import counters
+from app.utils.cache import response_cache, cached_count_async, cached_response_async, filter_key
+from app.utils.loaders import load_tweet_page_async
+from app.utils.projection import parse_fields, fetch_tweet_fields_async
+from app.utils.serialization import serialize_tag, serialize_tweets, fast_response
+from app.utils.tag_filters import normalize_tag_names, resolve_tag_ids_async
+import functools
+import inspect
+
+def asyncify_endpoint(endpoint, response_model=None):
+    """
+    네이티브 async 구현이 없는 동기 엔드포인트(쓰기, 상세 조회 등)를 async 엔드포인트로 감쌉니다.
+
+    쿼리 로직과 DB 의존성(get_db / get_read_db)은 그대로 두고,
+    핸들러와 response_model 검증을 run_in_threadpool()로 스레드풀에서 한 번에 실행합니다.
+
+    Args:
+        endpoint: 동기 엔드포인트 함수
+        response_model: 라우트의 response_model (있으면 스레드풀 안에서 검증)
+
+    Returns:
+        async 엔드포인트 함수 (시그니처와 의존성은 원래 엔드포인트와 같음)
+    """
+    if inspect.iscoroutinefunction(endpoint):
+        return endpoint
+    adapter = TypeAdapter(response_model) if response_model is not None else None
+
+    def run(kwargs):
+        result = endpoint(**kwargs)
+        # 이미 직렬화된 응답(orjson/msgpack)은 그대로 반환
+        if adapter is not None and not isinstance(result, Response):
+            return adapter.validate_python(result, from_attributes=True)
+        return result
+
+    @functools.wraps(endpoint)
+    async def wrapper(**kwargs):
+        return await run_in_threadpool(run, kwargs)
+
+    wrapper.__signature__ = inspect.signature(endpoint)
+    return wrapper
+
+def native_endpoint(endpoint, implementation):
+    """
+    동기 엔드포인트의 시그니처(쿼리 파라미터, 검증)를 그대로 쓰고 db만 AsyncSession으로 바꾼
+    async 엔드포인트를 만듭니다. 쿼리는 implementation 안에서 이벤트 루프에서 await됩니다.
+
+    Args:
+        endpoint: 같은 경로의 동기 엔드포인트 (파라미터 정의와 문서에 사용)
+        implementation: 같은 파라미터를 받는 코루틴 함수 (db는 AsyncSession)
+    """
+    signature = inspect.signature(endpoint)
+
+    @functools.wraps(endpoint)
+    async def wrapper(**kwargs):
+        return await implementation(**kwargs)
+
+    wrapper.__signature__ = signature.replace(parameters=[
+        param.replace(default=Depends(get_async_read_db)) if param.name == "db" else param
+        for param in signature.parameters.values()
+    ])
+    return wrapper
+
+async def get_tweets(request, skip: int, limit: int, cursor, include_total: bool, fields,
+                     db: AsyncSession, **filters):
+    """GET /api/tweets (tweets.get_tweets와 같은 응답, 쿼리는 AsyncSession으로 실행)"""
+    selected_fields = parse_fields(fields)
+
+    # 첫 페이지 응답 캐시 조회
+    cache_key = None
+    if skip == 0 and not cursor:
+        cache_key = tweets.tweet_list_cache_key(limit, include_total, selected_fields, **filters)
+        cache_generation = response_cache.generation
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return fast_response(request, cached)
+
+    # exact 태그 필터의 태그 ID는 미리 조회 (filter_tweets는 세션 없이 문장만 만듦)
+    tag_ids = None
+    names = normalize_tag_names(tweets.list_tag_names(filters["tag"], filters["tags"]))
+    if names and filters["tag_match"] == "exact":
+        tag_ids = await resolve_tag_ids_async(db, names)
+    statement, by_relevance = tweets.filter_tweets(select(Tweet), None, tag_ids=tag_ids, **filters)
+
+    total = None
+    if include_total:
+        async def count():
+            return (await db.execute(select(func.count()).select_from(statement.subquery()))).scalar_one()
+        total = await cached_count_async(count, tweets.tweet_count_key(**filters))
+
+    statement = tweets.paginate_tweets(statement, skip, limit, None if by_relevance else cursor, filters["sort_by"])
+    if selected_fields:
+        tweet_data, page = await fetch_tweet_fields_async(db, statement, selected_fields)
+    else:
+        page = await load_tweet_page_async(db, statement)
+        tweet_data = serialize_tweets(page)
+
+    payload = tweets.tweet_page_payload(tweet_data, page, total, skip, limit, by_relevance)
+    if cache_key:
+        response_cache.set(cache_key, payload, generation=cache_generation)
+    return fast_response(request, payload)
+
+async def get_tags(request, skip: int, limit: int, search, sort_by, db: AsyncSession):
+    """GET /api/tags (tags.get_tags와 같은 응답)"""
+    async def query():
+        result = await db.execute(tags.tags_statement(skip, limit, search, sort_by))
+        return [serialize_tag(tag) for tag in result.scalars()]
+
+    return fast_response(request, await cached_response_async(
+        filter_key("tags", skip=skip, limit=limit, search=search, sort_by=sort_by), query
+    ))
+
+async def get_stats(db: AsyncSession):
+    """GET /api/stats (stats.get_stats와 같은 응답)"""
+    async def query():
+        row = (await db.execute(counters.stats_snapshot_statement())).one()
+        return StatsResponse(**counters.stats_snapshot_from_row(row))
+
+    return await cached_response_async(("stats",), query)
+
+# 대시보드가 계속 호출하는 목록/통계 GET은 AsyncSession으로 직접 실행 (메서드, 경로) -> 구현
+NATIVE_ENDPOINTS = {
+    ("GET", "/tweets"): get_tweets,
+    ("GET", "/tags"): get_tags,
+    ("GET", "/stats"): get_stats,
+}
+
+def build_async_router(sync_router: APIRouter) -> APIRouter:
+    """동기 라우터의 모든 라우트를 같은 경로/응답 모델의 async 라우트로 복제합니다."""
+    router = APIRouter()
+    for route in sync_router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        implementation = next(
+            (NATIVE_ENDPOINTS[(method, route.path)] for method in route.methods if (method, route.path) in NATIVE_ENDPOINTS),
+            None
+        )
+        if implementation is not None:
+            endpoint = native_endpoint(route.endpoint, implementation)
+        else:
+            endpoint = asyncify_endpoint(route.endpoint, route.response_model)
+        router.add_api_route(
+            route.path,
+            endpoint,
+            methods=list(route.methods),
+            response_model=route.response_model,
+            status_code=route.status_code,
+            name=route.name,
+        )
+    return router
+
+# ASYNC_DB 사용 시 main.py에서 동기 라우터 대신 포함
+tweets_router = build_async_router(tweets.router)
+users_router = build_async_router(users.router)
+tags_router = build_async_router(tags.router)
+stats_router = build_async_router(stats.router)
@@ -1,15 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.db.database import get_db
-from app.models.models import Tweet, User, Tag
-from app.schemas.schemas import StatsResponse
+from app.db.database import get_read_db
+from app.models.models import Tag
+from app.schemas.schemas import StatsResponse, TimeseriesResponse
+from app.utils.cache import cached_response, cache_stats
+from app.utils.tag_filters import normalize_tag_name
+from app.utils import counters
+from app.utils import enrichment
 from datetime import datetime, timedelta
+from typing import Optional
 
 router = APIRouter()
 
 @router.get("/stats", response_model=StatsResponse)
-def get_stats(db: Session = Depends(get_db)):
+def get_stats(db: Session = Depends(get_read_db)):
     """
     전체 통계 정보를 조회합니다.
     
@@ -17,38 +21,90 @@ def get_stats(db: Session = Depends(get_db)):
         db: 데이터베이스 세션
     
     Returns:
-        StatsResponse: 전체 통계 정보
-    """
-    # 전체 트윗 수
-    total_tweets = db.query(Tweet).count()
-    
-    # 전체 사용자 수
-    total_users = db.query(User).count()
-    
-    # 전체 태그 수
-    total_tags = db.query(Tag).count()
-    
-    # 오늘 등록된 트윗 수
-    today = datetime.now().date()
-    tweets_today = db.query(Tweet)\
-        .filter(func.date(Tweet.created_at) == today)\
-        .count()
-    
-    # 가장 활발한 사용자 (가장 많은 트윗을 공유한 사용자)
-    most_active_user_query = db.query(
-        User.telegram_username,
-        func.count(Tweet.id).label('tweet_count')
-    ).join(Tweet)\
-    .group_by(User.telegram_id, User.telegram_username)\
-    .order_by(func.count(Tweet.id).desc())\
-    .first()
-    
-    most_active_user = most_active_user_query[0] if most_active_user_query else None
-    
-    return StatsResponse(
-        total_tweets=total_tweets,
-        total_users=total_users,
-        total_tags=total_tags,
-        tweets_today=tweets_today,
-        most_active_user=most_active_user
-    )
\ No newline at end of file
+        StatsResponse: 전체 통계 정보 (응답 캐시 사용, 쓰기 시 무효화)
+    """
+    return cached_response(("stats",), lambda: _query_stats(db))
+
+@router.get("/stats/cache")
+def get_cache_stats():
+    """
+    응답 캐시와 개수 캐시의 hit/miss 통계를 조회합니다.
+    
+    Returns:
+        dict: 캐시별 크기, hit/miss 수, hit rate
+    """
+    return cache_stats()
+
+@router.get("/stats/enrichment")
+def get_enrichment_stats(db: Session = Depends(get_read_db)):
+    """
+    트윗 미리보기 수집 대기열 상태를 조회합니다.
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        dict: 대기 중(pending), 실패(failed) 작업 수
+    """
+    return enrichment.queue_stats(db)
+
+@router.get("/stats/timeseries", response_model=TimeseriesResponse)
+def get_timeseries(
+    period: str = Query("day", description="버킷 단위: hour, day"),
+    days: int = Query(30, ge=1, le=365, description="최근 N일"),
+    tag: Optional[str] = Query(None, description="특정 태그의 공유 수"),
+    user_id: Optional[int] = Query(None, description="특정 사용자의 공유 수"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    시/일 단위 공유 수 추이를 조회합니다 (차트용). 빈 구간은 0으로 채웁니다.
+    
+    예시:
+    - /api/stats/timeseries - 최근 30일 일별 전체 공유 수
+    - /api/stats/timeseries?tag=eth&period=hour&days=2 - eth 태그의 최근 48시간 시간별 공유 수
+    - /api/stats/timeseries?user_id=12345 - 특정 사용자의 일별 공유 수
+    
+    Args:
+        period: hour 또는 day
+        days: 조회 기간 (hour는 최대 31일)
+        tag: 태그 이름 (user_id와 함께 지정할 수 없음)
+        user_id: 사용자의 텔레그램 ID
+        db: 데이터베이스 세션
+    
+    Returns:
+        TimeseriesResponse: 버킷별 공유 수
+    
+    Raises:
+        HTTPException: 파라미터가 잘못되었거나 태그를 찾을 수 없는 경우
+    """
+    if period not in counters.PERIODS:
+        raise HTTPException(status_code=400, detail="period는 hour 또는 day만 가능합니다.")
+    if period == counters.PERIOD_HOUR and days > 31:
+        raise HTTPException(status_code=400, detail="시간 단위는 최대 31일까지 조회할 수 있습니다.")
+    if tag and user_id is not None:
+        raise HTTPException(status_code=400, detail="tag와 user_id는 함께 지정할 수 없습니다.")
+    
+    tag_id = None
+    if tag:
+        tag_row = db.query(Tag.id).filter(Tag.name == normalize_tag_name(tag)).first()
+        if not tag_row:
+            raise HTTPException(status_code=404, detail=f"태그 '{tag}'을(를) 찾을 수 없습니다.")
+        tag_id = tag_row[0]
+    
+    # 트윗 created_at과 같은 UTC 기준
+    until = datetime.utcnow()
+    points = counters.get_timeseries(
+        db, period, until - timedelta(days=days), until, tag_id=tag_id, user_id=user_id
+    )
+    
+    return TimeseriesResponse(
+        period=period,
+        days=days,
+        tag=normalize_tag_name(tag) if tag else None,
+        user_id=user_id,
+        points=points
+    )
+
+def _query_stats(db: Session) -> StatsResponse:
+    # 집계 쿼리 대신 쓰기 시 함께 갱신되는 카운터 테이블에서 조회
+    return StatsResponse(**counters.get_stats_snapshot(db))
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
-from app.db.database import get_db
+from sqlalchemy import select
+from app.db.database import get_db, get_read_db
 from app.models.models import Tag, Tweet, tweet_tags
 from app.schemas.schemas import TagCreate, Tag as TagSchema
+from app.utils import counters
+from app.utils.pagination import apply_cursor, next_cursor
+from app.utils.cache import filter_key, cached_count, cached_response, invalidate_responses
+from app.utils.serialization import serialize_tag, serialize_tweets, fast_response
+from app.utils.loaders import load_tweet_page
+from app.utils.tag_filters import normalize_tag_name
 from typing import List, Optional
 
 router = APIRouter()
@@ -23,8 +29,8 @@ def create_tag(tag_data: dict, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 태그가 이미 존재하는 경우
     """
-    # 태그명 정규화 (소문자 변환)
-    tag_name = tag_data.get("name", "").lower().strip()
+    # 태그명 정규화 (소문자 변환, # 제거)
+    tag_name = normalize_tag_name(tag_data.get("name", ""))
     created_by = tag_data.get("created_by")
     
     if not tag_name:
@@ -36,8 +42,10 @@ def create_tag(tag_data: dict, db: Session = Depends(get_db)):
         # 비활성화된 태그면 다시 활성화
         if not existing_tag.is_active:
             existing_tag.is_active = True
+            counters.bump_data_version(db)
             db.commit()
             db.refresh(existing_tag)
+            invalidate_responses()
             return existing_tag
         else:
             raise HTTPException(
@@ -52,18 +60,21 @@ def create_tag(tag_data: dict, db: Session = Depends(get_db)):
         is_core=False  # 사용자가 추가한 태그
     )
     db.add(new_tag)
+    counters.on_tag_created(db)
     db.commit()
     db.refresh(new_tag)
+    invalidate_responses()
     
     return new_tag
 
 @router.get("/tags", response_model=List[TagSchema])
 def get_tags(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     search: Optional[str] = Query(None, description="태그명 검색"),
     sort_by: Optional[str] = Query("popular", description="정렬: popular, newest, alphabetical"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     태그 목록을 조회합니다.
@@ -76,48 +87,50 @@ def get_tags(
         db: 데이터베이스 세션
     
     Returns:
-        List[Tag]: 태그 목록
+        List[Tag]: 태그 목록 (응답 캐시 사용, 태그/트윗 쓰기 시 무효화)
     """
-    # 기본 쿼리 - 트윗 개수와 함께 조회 (활성 태그만)
-    query = db.query(
-        Tag,
-        func.count(tweet_tags.c.tweet_id).label('tweet_count')
-    ).filter(Tag.is_active == True)\
-    .outerjoin(tweet_tags)\
-    .group_by(Tag.id)
+    return fast_response(request, cached_response(
+        filter_key("tags", skip=skip, limit=limit, search=search, sort_by=sort_by),
+        lambda: _query_tags(db, skip, limit, search, sort_by)
+    ))
+
+def _query_tags(db: Session, skip: int, limit: int, search: Optional[str], sort_by: Optional[str]) -> List[dict]:
+    # 캐시에 저장할 수 있도록 dict로 변환
+    tags = db.execute(tags_statement(skip, limit, search, sort_by)).scalars().all()
+    return [serialize_tag(tag) for tag in tags]
+
+def tags_statement(skip: int, limit: int, search: Optional[str], sort_by: Optional[str]):
+    """태그 목록 SELECT (동기/async 라우트 공용)"""
+    # 기본 쿼리 - 활성 태그만 (tweet_count는 쓰기 시 갱신되는 컬럼 사용)
+    statement = select(Tag).where(Tag.is_active == True)
     
     # 검색 필터
     if search:
-        query = query.filter(Tag.name.ilike(f"%{search}%"))
+        statement = statement.where(Tag.name.ilike(f"%{search}%"))
     
     # 정렬
     if sort_by == "popular":
-        # 사용 빈도순 (트윗 개수가 많은 순)
-        query = query.order_by(desc('tweet_count'))
+        # 사용 빈도순 (트윗 개수가 많은 순) - ix_tags_active_tweet_count 인덱스 스캔
+        statement = statement.order_by(Tag.tweet_count.desc())
     elif sort_by == "newest":
         # 최신순
-        query = query.order_by(Tag.created_at.desc())
+        statement = statement.order_by(Tag.created_at.desc())
     else:  # alphabetical
         # 알파벳순
-        query = query.order_by(Tag.name.asc())
+        statement = statement.order_by(Tag.name.asc())
     
     # 페이징 적용
-    results = query.offset(skip).limit(limit).all()
-    
-    # 태그 객체에 tweet_count 업데이트
-    tags = []
-    for tag, tweet_count in results:
-        tag.tweet_count = tweet_count
-        tags.append(tag)
-    
-    return tags
+    return statement.offset(skip).limit(limit)
 
 @router.get("/tags/{tag_name}/tweets")
 def get_tag_tweets(
+    request: Request,
     tag_name: str,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(True, description="전체 개수(total) 포함 여부"),
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 태그의 트윗 목록을 조회합니다.
@@ -126,50 +139,55 @@ def get_tag_tweets(
         tag_name: 태그 이름
         skip: 건너뛸 트윗 수
         limit: 조회할 트윗 수
+        cursor: keyset 페이징 커서 (지정 시 skip 무시)
+        include_total: False면 전체 개수 count 쿼리 생략
         db: 데이터베이스 세션
     
     Returns:
-        dict: 태그 정보와 트윗 목록
+        dict: 태그 정보, 트윗 목록, 다음 페이지 커서
     
     Raises:
         HTTPException: 태그를 찾을 수 없는 경우
     """
     # 태그 조회
-    tag = db.query(Tag).filter(Tag.name == tag_name.lower()).first()
+    tag = db.query(Tag).filter(Tag.name == normalize_tag_name(tag_name)).first()
     if not tag:
         raise HTTPException(
             status_code=404,
             detail=f"태그 '{tag_name}'을(를) 찾을 수 없습니다."
         )
     
-    # 해당 태그의 트윗 조회
-    tweets = db.query(Tweet)\
-        .join(Tweet.tags)\
-        .filter(Tag.id == tag.id)\
-        .order_by(Tweet.created_at.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    # 해당 태그의 트윗 조회 (tweet_tags 세미조인, 태그 정보는 페이지 로딩 시 일괄 로딩)
+    query = db.query(Tweet).filter(Tweet.id.in_(
+        select(tweet_tags.c.tweet_id).where(tweet_tags.c.tag_id == tag.id)
+    ))
+    query = apply_cursor(query, cursor)
+    if not cursor:
+        query = query.offset(skip)
+    tweets = load_tweet_page(db, query.limit(limit))
     
     # 전체 트윗 수
-    total = db.query(Tweet)\
-        .join(Tweet.tags)\
-        .filter(Tag.id == tag.id)\
-        .count()
-    
-    return {
-        "tag": tag,
-        "tweets": tweets,
+    total = None
+    if include_total:
+        total = cached_count(
+            db.query(Tweet).join(Tweet.tags).filter(Tag.id == tag.id),
+            filter_key("tag_tweets", tag_id=tag.id)
+        )
+    
+    return fast_response(request, {
+        "tag": {**serialize_tag(tag), "created_by": tag.created_by},
+        "tweets": serialize_tweets(tweets),
         "total": total,
         "page": (skip // limit) + 1,
-        "size": limit
-    }
+        "size": limit,
+        "next_cursor": next_cursor(tweets, limit)
+    })
 
 @router.get("/tags/popular")
 def get_popular_tags(
-    days: int = Query(7, description="최근 N일간의 인기 태그"),
+    days: int = Query(7, ge=1, le=365, description="최근 N일간의 인기 태그"),
     limit: int = Query(10, ge=1, le=50, description="조회할 태그 수"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     최근 인기 태그를 조회합니다.
@@ -182,22 +200,8 @@ def get_popular_tags(
     Returns:
         List[dict]: 인기 태그 목록
     """
-    from datetime import datetime, timedelta
-    
-    # 집계 시작 날짜
-    since_date = datetime.now() - timedelta(days=days)
-    
-    # 최근 N일간 가장 많이 사용된 태그
-    popular_tags = db.query(
-        Tag.name,
-        func.count(Tweet.id).label('usage_count')
-    ).join(tweet_tags)\
-    .join(Tweet)\
-    .filter(Tweet.created_at >= since_date)\
-    .group_by(Tag.id, Tag.name)\
-    .order_by(desc('usage_count'))\
-    .limit(limit)\
-    .all()
+    # 최근 N일간 가장 많이 사용된 태그 (트윗 등록/삭제 시 갱신되는 시/일 단위 롤업에서 집계)
+    popular_tags = counters.get_top_tags(db, days, limit)
     
     return [
         {
@@ -228,7 +232,7 @@ def delete_tag(
         HTTPException: 태그를 찾을 수 없는 경우
     """
     # 태그 조회
-    tag = db.query(Tag).filter(Tag.name == tag_name.lower()).first()
+    tag = db.query(Tag).filter(Tag.name == normalize_tag_name(tag_name)).first()
     if not tag:
         raise HTTPException(
             status_code=404,
@@ -237,6 +241,8 @@ def delete_tag(
     
     # 비활성화
     tag.is_active = False
+    counters.bump_data_version(db)
     db.commit()
+    invalidate_responses()
     
     return {"message": f"태그 '{tag_name}'이(가) 비활성화되었습니다."}
\ No newline at end of file
@@ -1,17 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_, and_, func
-from app.db.database import get_db
-from app.models.models import Tweet, User, Tag, tweet_tags
-from app.schemas.schemas import TweetCreate, Tweet as TweetSchema, TweetResponse
-from app.utils.database_utils import get_or_create_user, get_or_create_tag
+from app.db.database import get_db, get_read_db
+from app.models.models import Tweet, User
+from app.schemas.schemas import TweetCreate, Tweet as TweetSchema, TweetResponse, BulkTweetResult, BulkTweetResponse
+from app.utils.database_utils import get_or_create_user, get_or_create_tags, find_tweets_by_id_prefix
 from app.utils.twitter_utils import extract_tweet_id_from_url, validate_twitter_url, normalize_twitter_url
+from app.utils.pagination import apply_cursor, next_cursor
+from app.utils.search import apply_search
+from app.utils.tag_filters import apply_tag_filter, normalize_tag_names
+from app.utils import counters
+from app.utils import enrichment
+from app.utils.serialization import serialize_tweets, fast_response
+from app.utils.projection import parse_fields, fetch_tweet_fields
+from app.utils.loaders import load_tweet_page
+from app.utils.events import publish_tweet_created, publish_tweet_deleted, publish_stats
+from app.utils.cache import filter_key, versioned_key, cached_count, invalidate_tweet_counts, response_cache, invalidate_responses
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
+# 벌크 등록 제한
+BULK_MAX_ITEMS = 5000
+BULK_BATCH_SIZE = 500
+
 @router.post("/tweets", response_model=TweetSchema)
 def create_tweet(tweet: TweetCreate, db: Session = Depends(get_db)):
     """
@@ -73,37 +86,161 @@ def create_tweet(tweet: TweetCreate, db: Session = Depends(get_db)):
         tweet_url=normalized_url,
         tweet_id=tweet_id,
         comment=tweet.comment,
-        content_preview="",  # 나중에 Twitter API로 가져올 예정
-        image_url=""  # 나중에 Twitter API로 가져올 예정
+        content_preview="",  # 미리보기 수집 워커가 채움 (enrichment_queue)
+        image_url=""
     )
     
-    # 7. 태그 처리
+    # 7. 태그 처리 - IN 조회 + INSERT ON CONFLICT로 한 번에 (commit 없음)
     if tweet.tags:
-        for tag_name in tweet.tags:
-            if tag_name.strip():  # 빈 태그 제외
-                tag = get_or_create_tag(db, tag_name.strip())
-                new_tweet.tags.append(tag)
+        new_tweet.tags.extend(get_or_create_tags(db, tweet.tags))
     
-    # 8. 데이터베이스에 저장
+    # 8. 데이터베이스에 저장 - 트윗/태그/통계 카운터를 하나의 트랜잭션으로
     db.add(new_tweet)
+    db.flush()
+    counters.on_tweet_created(db, new_tweet)
+    # 미리보기는 응답을 기다리게 하지 않고 백그라운드 워커가 가져옴
+    enrichment.enqueue(db, [tweet_id])
     db.commit()
     db.refresh(new_tweet)
+    invalidate_tweet_counts()
+    invalidate_responses()
+    # 열려 있는 대시보드에 새 트윗과 통계 델타 전송
+    publish_tweet_created(db, new_tweet)
     
     return new_tweet
 
+@router.post("/tweets/bulk", response_model=BulkTweetResponse)
+def create_tweets_bulk(items: List[TweetCreate], db: Session = Depends(get_db)):
+    """
+    여러 트윗을 한 번에 등록합니다 (과거 공유 백필, 다른 트래커에서 이전 등).
+    
+    기존 트윗 중복 확인과 사용자 확인은 각각 IN 쿼리 한 번, 태그는 전체를 한 번에
+    찾거나 생성하고, 트윗은 BULK_BATCH_SIZE개씩 트랜잭션으로 나눠 저장합니다.
+    
+    Args:
+        items: 트윗 생성 데이터 목록 (최대 BULK_MAX_ITEMS개)
+        db: 데이터베이스 세션
+    
+    Returns:
+        BulkTweetResponse: 항목별 결과 (created, duplicate, invalid)와 합계
+    
+    Raises:
+        HTTPException: 항목이 너무 많은 경우
+    """
+    if len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {BULK_MAX_ITEMS}개까지 등록할 수 있습니다."
+        )
+    
+    results: List[Optional[BulkTweetResult]] = [None] * len(items)
+    pending = []  # (index, item, tweet_id)
+    seen_tweet_ids = set()
+    
+    # 1. URL 검증, 트윗 ID 추출, 요청 내 중복 제거
+    for index, item in enumerate(items):
+        if not validate_twitter_url(item.tweet_url):
+            results[index] = BulkTweetResult(index=index, status="invalid", detail="유효하지 않은 트위터 URL입니다.")
+            continue
+        tweet_id = extract_tweet_id_from_url(item.tweet_url)
+        if not tweet_id:
+            results[index] = BulkTweetResult(index=index, status="invalid", detail="트위터 URL에서 트윗 ID를 추출할 수 없습니다.")
+            continue
+        if tweet_id in seen_tweet_ids:
+            results[index] = BulkTweetResult(index=index, status="duplicate", tweet_id=tweet_id, detail="요청 안에서 중복된 트윗입니다.")
+            continue
+        seen_tweet_ids.add(tweet_id)
+        pending.append((index, item, tweet_id))
+    
+    # 2. 기존 트윗 중복 확인 (IN 쿼리, 배치 단위)
+    existing_ids = set()
+    candidate_ids = [tweet_id for _, _, tweet_id in pending]
+    for start in range(0, len(candidate_ids), BULK_BATCH_SIZE):
+        chunk = candidate_ids[start:start + BULK_BATCH_SIZE]
+        existing_ids.update(
+            row[0] for row in db.query(Tweet.tweet_id).filter(Tweet.tweet_id.in_(chunk)).all()
+        )
+    
+    # 3. 사용자 확인 (IN 쿼리 한 번)
+    user_ids = {item.user_id for _, item, _ in pending}
+    known_users = {
+        row[0] for row in db.query(User.telegram_id).filter(User.telegram_id.in_(user_ids)).all()
+    } if user_ids else set()
+    
+    valid = []
+    for index, item, tweet_id in pending:
+        if tweet_id in existing_ids:
+            results[index] = BulkTweetResult(index=index, status="duplicate", tweet_id=tweet_id, detail="이미 등록된 트윗입니다.")
+        elif item.user_id not in known_users:
+            results[index] = BulkTweetResult(index=index, status="invalid", tweet_id=tweet_id, detail="사용자를 찾을 수 없습니다.")
+        else:
+            valid.append((index, item, tweet_id))
+    
+    # 4. 태그 일괄 처리 (전체 태그를 한 번에 찾거나 생성)
+    all_tag_names = [name for _, item, _ in valid for name in (item.tags or [])]
+    tags_by_name = {tag.name: tag for tag in get_or_create_tags(db, all_tag_names)}
+    
+    # 5. 배치 단위 트랜잭션으로 저장
+    for start in range(0, len(valid), BULK_BATCH_SIZE):
+        batch = valid[start:start + BULK_BATCH_SIZE]
+        new_tweets = []
+        for index, item, tweet_id in batch:
+            new_tweet = Tweet(
+                user_id=item.user_id,
+                tweet_url=normalize_twitter_url(item.tweet_url),
+                tweet_id=tweet_id,
+                comment=item.comment,
+                content_preview="",
+                image_url=""
+            )
+            tag_names = normalize_tag_names(item.tags or [])
+            new_tweet.tags.extend(tags_by_name[name] for name in tag_names if name in tags_by_name)
+            new_tweets.append(new_tweet)
+        
+        db.add_all(new_tweets)
+        db.flush()
+        counters.on_tweets_created(db, new_tweets)
+        enrichment.enqueue(db, [new_tweet.tweet_id for new_tweet in new_tweets])
+        db.commit()
+        
+        for (index, _, tweet_id), new_tweet in zip(batch, new_tweets):
+            results[index] = BulkTweetResult(index=index, status="created", tweet_id=tweet_id, id=new_tweet.id)
+    
+    # 태그만 생성되고 저장할 트윗이 없는 경우도 커밋
+    db.commit()
+    
+    if valid:
+        invalidate_tweet_counts()
+        publish_stats(db)
+    invalidate_responses()
+    
+    return BulkTweetResponse(
+        results=results,
+        created=sum(1 for r in results if r.status == "created"),
+        duplicates=sum(1 for r in results if r.status == "duplicate"),
+        invalid=sum(1 for r in results if r.status == "invalid")
+    )
+
 @router.get("/tweets", response_model=TweetResponse)
 def get_tweets(
+    request: Request,
     skip: int = Query(0, ge=0, description="건너뛸 트윗 수"),
     limit: int = Query(20, ge=1, le=100, description="한 페이지당 트윗 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 skip 대신 사용)"),
     user_id: Optional[int] = Query(None, description="특정 사용자의 트윗만 조회"),
     username: Optional[str] = Query(None, description="사용자명으로 필터링"),
     tag: Optional[str] = Query(None, description="특정 태그의 트윗만 조회"),
-    tags: Optional[List[str]] = Query(None, description="여러 태그로 필터링 (OR 조건)"),
+    tags: Optional[List[str]] = Query(None, description="여러 태그로 필터링 (tag_mode에 따라 OR/AND)"),
+    tag_mode: Optional[str] = Query("any", description="여러 태그 조건: any(OR), all(AND)"),
+    tag_match: Optional[str] = Query("partial", description="태그 매칭: partial(부분 일치), exact(정확히 일치)"),
     search: Optional[str] = Query(None, description="트윗 내용 검색"),
+    search_mode: Optional[str] = Query("fulltext", description="검색 방식: fulltext(전문 검색 인덱스), substring"),
     date_from: Optional[datetime] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     date_to: Optional[datetime] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
-    sort_by: Optional[str] = Query("newest", description="정렬 기준: newest, oldest"),
-    db: Session = Depends(get_db)
+    sort_by: Optional[str] = Query("newest", description="정렬 기준: newest, oldest, relevance (search 사용 시)"),
+    include_total: bool = Query(True, description="전체 개수(total) 포함 여부 (false면 count 쿼리 생략)"),
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (콤마 구분, 예: tweet_url,comment,created_at,user,tags)"),
+    db: Session = Depends(get_read_db)
 ):
     """
     트윗 목록을 조회합니다. 다양한 필터링과 정렬 옵션을 제공합니다.
@@ -112,41 +249,109 @@ def get_tweets(
     - /api/tweets?user_id=12345 - 특정 사용자의 트윗
     - /api/tweets?tag=crypto - crypto 태그가 있는 트윗
     - /api/tweets?tags=crypto&tags=bitcoin - crypto 또는 bitcoin 태그
+    - /api/tweets?tags=crypto&tags=bitcoin&tag_mode=all&tag_match=exact - 두 태그 모두 (정확히 일치)
     - /api/tweets?search=좋은정보 - 코멘트에 "좋은정보" 포함
+    - /api/tweets?search=좋은정보&sort_by=relevance - 관련도순 검색 결과
+    - /api/tweets?search=좋은정보&search_mode=substring - 인덱스 없이 ilike 검색
     - /api/tweets?date_from=2024-01-01&date_to=2024-01-31 - 특정 기간
+    - /api/tweets?cursor=<next_cursor> - 이전 페이지 다음부터 (keyset 페이징)
+    - /api/tweets?include_total=false - total 없이 조회 (count 쿼리 생략)
+    - /api/tweets?fields=tweet_url,comment,tags - 선택한 필드만 조회 (user/tags는 요청 시에만 로딩)
+    
+    첫 페이지(skip=0, cursor 없음)는 응답 캐시를 사용하며 트윗 생성/삭제 시 무효화됩니다.
+    응답은 orjson으로 직렬화되며, Accept: application/msgpack이면 msgpack으로 응답합니다.
     """
-    # 기본 쿼리 - eager loading으로 N+1 문제 방지
-    query = db.query(Tweet)\
-        .options(joinedload(Tweet.user))\
-        .options(joinedload(Tweet.tags))
+    selected_fields = parse_fields(fields)
+    filters = dict(
+        user_id=user_id, username=username, tag=tag, tags=tags, tag_mode=tag_mode, tag_match=tag_match,
+        search=search, search_mode=search_mode, date_from=date_from, date_to=date_to, sort_by=sort_by
+    )
     
+    # 첫 페이지 응답 캐시 조회
+    cache_key = None
+    if skip == 0 and not cursor:
+        cache_key = tweet_list_cache_key(limit, include_total, selected_fields, **filters)
+        # 조회 전에 읽어 둔 generation - 조회 중 쓰기로 캐시가 비워지면 이 응답은 저장하지 않음
+        cache_generation = response_cache.generation
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return fast_response(request, cached)
+    
+    # 기본 쿼리 - 관계는 페이지를 정한 뒤 load_tweet_page()/fetch_tweet_fields()에서 일괄 로딩
+    query, by_relevance = filter_tweets(db.query(Tweet), db, **filters)
+    
+    # 전체 개수 계산 - 같은 필터 조합은 트윗 생성/삭제 전까지 캐시된 값 사용
+    total = cached_count(query, tweet_count_key(**filters)) if include_total else None
+    
+    query = paginate_tweets(query, skip, limit, None if by_relevance else cursor, sort_by)
+    if selected_fields:
+        tweet_data, tweets = fetch_tweet_fields(db, query, selected_fields)
+    else:
+        tweets = load_tweet_page(db, query)
+        tweet_data = serialize_tweets(tweets)
+    
+    payload = tweet_page_payload(tweet_data, tweets, total, skip, limit, by_relevance)
+    if cache_key:
+        response_cache.set(cache_key, payload, generation=cache_generation)
+    
+    return fast_response(request, payload)
+
+def tweet_list_cache_key(limit: int, include_total: bool, selected_fields: Optional[List[str]], **filters) -> tuple:
+    """트윗 목록 첫 페이지의 응답 캐시 키 (요청의 데이터 버전 포함)"""
+    return versioned_key(filter_key("tweets", limit=limit, include_total=include_total, fields=selected_fields, **filters))
+
+def tweet_count_key(user_id=None, username=None, tag=None, tags=None, tag_mode=None, tag_match=None,
+                    search=None, search_mode=None, date_from=None, date_to=None, sort_by=None) -> tuple:
+    """트윗 목록 total의 개수 캐시 키 (결과 행 집합에 영향을 주는 필터만 포함)"""
+    return filter_key(
+        "tweets",
+        user_id=user_id,
+        username=None if user_id else username,
+        tag=None if tags else tag,
+        tags=tags,
+        tag_mode=tag_mode if tags else None,
+        tag_match=tag_match if (tag or tags) else None,
+        search=search,
+        search_mode=search_mode if search else None,
+        date_from=date_from,
+        date_to=date_to
+    )
+
+def list_tag_names(tag: Optional[str], tags: Optional[List[str]]) -> List[str]:
+    """tags가 있으면 tags, 없으면 단일 tag (태그 필터 대상)"""
+    if tags:
+        return tags
+    return [tag] if tag else []
+
+def filter_tweets(query, db: Optional[Session], user_id=None, username=None, tag=None, tags=None,
+                  tag_mode="any", tag_match="partial", search=None, search_mode="fulltext",
+                  date_from=None, date_to=None, sort_by="newest", tag_ids=None):
+    """
+    트윗 목록 필터를 쿼리에 적용합니다. 동기(db.query(Tweet))와 async 라우트(select(Tweet))가 함께 사용합니다.
+
+    Args:
+        query: Tweet 쿼리 (Query 또는 select(Tweet))
+        db: 데이터베이스 세션 (tag_ids를 넘기면 사용하지 않음)
+        tag_ids: tag_match=exact일 때 미리 조회한 태그명 -> ID
+
+    Returns:
+        (쿼리, 관련도순 여부)
+    """
     # 사용자 필터
     if user_id:
         query = query.filter(Tweet.user_id == user_id)
     elif username:
         query = query.join(User).filter(User.telegram_username.ilike(f"%{username}%"))
     
-    # 태그 필터
-    if tags and len(tags) > 0:
-        # 여러 태그 중 하나라도 있으면 (OR 조건)
-        tag_filters = []
-        for tag_name in tags:
-            tag_filters.append(Tag.name.ilike(f"%{tag_name.lower()}%"))
-        query = query.join(Tweet.tags).filter(or_(*tag_filters))
-    elif tag:
-        # 단일 태그 필터
-        query = query.join(Tweet.tags).filter(Tag.name.ilike(f"%{tag.lower()}%"))
-    
-    # 검색 필터
+    # 태그 필터 - JOIN 대신 EXISTS/세미조인이라 distinct() 불필요 (여러 태그는 tag_mode에 따라 OR/AND)
+    names = list_tag_names(tag, tags)
+    if names:
+        query = apply_tag_filter(query, db, names, mode=tag_mode if tags else "any", match=tag_match, tag_ids=tag_ids)
+    
+    # 검색 필터 (전문 검색 인덱스, 불가능하면 substring)
+    by_relevance = bool(search) and sort_by == "relevance"
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                Tweet.comment.ilike(search_term),
-                Tweet.content_preview.ilike(search_term),
-                Tweet.tweet_url.ilike(search_term)
-            )
-        )
+        query = apply_search(query, search, mode=search_mode, rank=by_relevance)
     
     # 날짜 필터
     if date_from:
@@ -156,34 +361,31 @@ def get_tweets(
         date_to_end = date_to + timedelta(days=1) - timedelta(seconds=1)
         query = query.filter(Tweet.created_at <= date_to_end)
     
-    # 중복 제거 (태그 조인 시 필요)
-    if tag or tags:
-        query = query.distinct()
-    
-    # 전체 개수 계산
-    total = query.count()
-    
-    # 정렬
-    if sort_by == "oldest":
-        query = query.order_by(Tweet.created_at.asc())
-    else:  # newest (기본값)
-        query = query.order_by(Tweet.created_at.desc())
-    
-    # 페이징 적용
-    tweets = query.offset(skip).limit(limit).all()
-    
-    # 현재 페이지 계산
-    current_page = (skip // limit) + 1 if limit > 0 else 1
-    
-    return TweetResponse(
-        tweets=tweets,
-        total=total,
-        page=current_page,
-        size=limit
-    )
+    return query, by_relevance
+
+def paginate_tweets(query, skip: int, limit: int, cursor: Optional[str], sort_by: Optional[str]):
+    """
+    정렬 + 커서 조건 (newest: 기본값, oldest)과 페이징을 적용합니다.
+    관련도순은 (created_at, id) 순서가 아니므로 호출한 쪽에서 cursor=None으로 offset 페이징합니다.
+    """
+    query = apply_cursor(query, cursor, oldest=(sort_by == "oldest"))
+    # 커서가 있으면 offset 없이 keyset으로 이어서 조회
+    return query.limit(limit) if cursor else query.offset(skip).limit(limit)
+
+def tweet_page_payload(tweet_data: list, tweets: list, total: Optional[int], skip: int, limit: int,
+                       by_relevance: bool) -> dict:
+    """TweetResponse 스키마와 같은 형태를 Pydantic 검증 없이 바로 생성"""
+    return {
+        "tweets": tweet_data,
+        "total": total,
+        # 현재 페이지
+        "page": (skip // limit) + 1 if limit > 0 else 1,
+        "size": limit,
+        "next_cursor": None if by_relevance else next_cursor(tweets, limit)
+    }
 
 @router.get("/tweets/{tweet_id}", response_model=TweetSchema)
-def get_tweet(tweet_id: UUID, db: Session = Depends(get_db)):
+def get_tweet(tweet_id: UUID, db: Session = Depends(get_read_db)):
     """
     특정 트윗의 상세 정보를 조회합니다.
     
@@ -197,7 +399,12 @@ def get_tweet(tweet_id: UUID, db: Session = Depends(get_db)):
     Raises:
         HTTPException: 트윗을 찾을 수 없는 경우
     """
-    tweet = db.query(Tweet).filter(Tweet.id == tweet_id).first()
+    # user와 tags를 같은 쿼리에서 로딩 (직렬화 시 지연 로딩 방지)
+    tweet = db.query(Tweet)\
+        .options(joinedload(Tweet.user))\
+        .options(joinedload(Tweet.tags))\
+        .filter(Tweet.id == tweet_id)\
+        .first()
     
     if not tweet:
         raise HTTPException(
@@ -236,6 +443,28 @@ def delete_tweet(
             detail="트윗을 찾을 수 없습니다."
         )
     
+    _delete_owned_tweet(db, tweet, user_id)
+    
+    return {"message": "트윗이 성공적으로 삭제되었습니다."}
+
+def _resolve_short_id(db: Session, short_id: str, user_id: int) -> Tweet:
+    """사용자의 트윗 중 짧은 ID로 시작하는 트윗 하나를 찾습니다 (없거나 모호하면 예외)."""
+    matches = find_tweets_by_id_prefix(db, short_id, user_id=user_id)
+    
+    if not matches:
+        raise HTTPException(
+            status_code=404,
+            detail=f"짧은 ID '{short_id}'에 해당하는 트윗을 찾을 수 없습니다."
+        )
+    if len(matches) > 1:
+        raise HTTPException(
+            status_code=409,
+            detail=f"짧은 ID '{short_id}'에 해당하는 트윗이 여러 개입니다. 더 긴 ID를 입력해주세요."
+        )
+    return matches[0]
+
+def _delete_owned_tweet(db: Session, tweet: Tweet, user_id: int) -> None:
+    """본인 트윗인지 확인한 뒤 삭제합니다."""
     # 권한 확인 (본인이 작성한 트윗만 삭제 가능)
     if tweet.user_id != user_id:
         raise HTTPException(
@@ -243,8 +472,65 @@ def delete_tweet(
             detail="본인이 작성한 트윗만 삭제할 수 있습니다."
         )
     
-    # 트윗 삭제
+    # commit 후에는 만료되므로 이벤트에 보낼 값을 미리 읽어 둠
+    deleted = {"id": str(tweet.id), "tweet_id": tweet.tweet_id}
+    tag_ids = [tag.id for tag in tweet.tags]
+    
+    # 트윗 삭제 (통계 카운터도 같은 트랜잭션에서 갱신)
+    counters.on_tweet_deleted(db, tweet)
     db.delete(tweet)
     db.commit()
+    invalidate_tweet_counts()
+    invalidate_responses()
+    publish_tweet_deleted(db, deleted, tag_ids)
+
+@router.get("/tweets/resolve/{short_id}", response_model=TweetSchema)
+def resolve_tweet(
+    short_id: str,
+    user_id: int = Query(..., description="트윗을 공유한 사용자 ID"),
+    db: Session = Depends(get_read_db)
+):
+    """
+    짧은 ID(UUID 앞부분)로 사용자의 트윗을 찾습니다.
+    
+    tweets.id 기본키 범위 조회이므로 사용자의 트윗 수와 관계없이 빠릅니다.
+    
+    Args:
+        short_id: UUID 앞 4자리 이상 (/mytweets에 표시되는 8자리)
+        user_id: 트윗을 공유한 사용자의 텔레그램 ID
+        db: 데이터베이스 세션
+    
+    Returns:
+        Tweet: 트윗 상세 정보
+    
+    Raises:
+        HTTPException: 트윗이 없거나(404) 여러 개가 일치하는 경우(409)
+    """
+    return _resolve_short_id(db, short_id, user_id)
+
+@router.delete("/tweets/resolve/{short_id}")
+def delete_tweet_by_short_id(
+    short_id: str,
+    user_id: int = Query(..., description="삭제를 요청하는 사용자 ID"),
+    db: Session = Depends(get_db)
+):
+    """
+    짧은 ID로 트윗을 찾아 한 번의 요청으로 삭제합니다 (텔레그램 /delete 명령).
+    
+    Args:
+        short_id: UUID 앞 4자리 이상
+        user_id: 삭제를 요청하는 사용자의 텔레그램 ID
+        db: 데이터베이스 세션
+    
+    Returns:
+        dict: 삭제 성공 메시지와 삭제된 트윗 정보
+    
+    Raises:
+        HTTPException: 트윗이 없거나(404) 여러 개가 일치하는 경우(409)
+    """
+    tweet = _resolve_short_id(db, short_id, user_id)
+    deleted = {"id": str(tweet.id), "tweet_url": tweet.tweet_url}
+    
+    _delete_owned_tweet(db, tweet, user_id)
     
-    return {"message": "트윗이 성공적으로 삭제되었습니다."}
\ No newline at end of file
+    return {"message": "트윗이 성공적으로 삭제되었습니다.", **deleted}
\ No newline at end of file
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from app.db.database import get_db
-from app.models.models import User, Tweet
+from app.db.database import get_db, get_read_db
+from app.models.models import User, Tweet, UserTweetCount
 from app.schemas.schemas import UserCreate, User as UserSchema
 from app.utils.database_utils import get_or_create_user
+from app.utils import counters
+from app.utils.pagination import apply_cursor, next_cursor
+from app.utils.cache import filter_key, cached_count, invalidate_responses
+from app.utils.serialization import serialize_user, serialize_tweets, fast_response
+from app.utils.loaders import load_tweet_page
 from typing import List, Optional
 
 router = APIRouter()
@@ -26,6 +31,7 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
         telegram_username=user.telegram_username,
         display_name=user.display_name
     )
+    invalidate_responses()
     return created_user
 
 @router.get("/users", response_model=List[UserSchema])
@@ -34,7 +40,7 @@ def get_users(
     limit: int = Query(100, ge=1, le=500),
     search: Optional[str] = Query(None, description="사용자명 검색"),
     sort_by: Optional[str] = Query("active", description="정렬: active, newest, alphabetical"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     사용자 목록을 조회합니다.
@@ -66,17 +72,12 @@ def get_users(
     
     # 정렬
     if sort_by == "active":
-        # 활동순 (트윗 수가 많은 순) - 서브쿼리 사용
-        tweet_count_subquery = db.query(
-            Tweet.user_id,
-            func.count(Tweet.id).label('tweet_count')
-        ).group_by(Tweet.user_id).subquery()
-        
+        # 활동순 (트윗 수가 많은 순) - 쓰기 시 갱신되는 사용자별 카운터 사용
         query = query.outerjoin(
-            tweet_count_subquery,
-            User.telegram_id == tweet_count_subquery.c.user_id
+            UserTweetCount,
+            User.telegram_id == UserTweetCount.user_id
         ).order_by(
-            func.coalesce(tweet_count_subquery.c.tweet_count, 0).desc()
+            func.coalesce(UserTweetCount.tweet_count, 0).desc()
         )
     elif sort_by == "newest":
         # 최신 가입순
@@ -91,7 +92,7 @@ def get_users(
     return users
 
 @router.get("/users/{user_id}", response_model=UserSchema)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(user_id: int, db: Session = Depends(get_read_db)):
     """
     특정 사용자의 정보를 조회합니다.
     
@@ -117,9 +118,9 @@ def get_user(user_id: int, db: Session = Depends(get_db)):
 
 @router.get("/users/stats/top-contributors")
 def get_top_contributors(
-    days: int = Query(30, description="최근 N일간의 기여자"),
+    days: int = Query(30, ge=1, le=365, description="최근 N일간의 기여자"),
     limit: int = Query(10, ge=1, le=50, description="조회할 사용자 수"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     최근 가장 활발한 기여자 목록을 조회합니다.
@@ -132,24 +133,8 @@ def get_top_contributors(
     Returns:
         List[dict]: 상위 기여자 목록
     """
-    from sqlalchemy import func
-    from datetime import datetime, timedelta
-    
-    # 집계 시작 날짜
-    since_date = datetime.now() - timedelta(days=days)
-    
-    # 최근 N일간 가장 많은 트윗을 공유한 사용자
-    top_contributors = db.query(
-        User.telegram_id,
-        User.telegram_username,
-        User.display_name,
-        func.count(Tweet.id).label('tweet_count')
-    ).join(Tweet)\
-    .filter(Tweet.created_at >= since_date)\
-    .group_by(User.telegram_id, User.telegram_username, User.display_name)\
-    .order_by(func.count(Tweet.id).desc())\
-    .limit(limit)\
-    .all()
+    # 최근 N일간 가장 많은 트윗을 공유한 사용자 (시/일 단위 롤업에서 집계)
+    top_contributors = counters.get_top_users(db, days, limit)
     
     return [
         {
@@ -164,10 +149,13 @@ def get_top_contributors(
 
 @router.get("/users/{user_id}/tweets")
 def get_user_tweets(
+    request: Request,
     user_id: int, 
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    include_total: bool = Query(True, description="전체 개수(total) 포함 여부"),
+    db: Session = Depends(get_read_db)
 ):
     """
     특정 사용자가 공유한 트윗 목록을 조회합니다.
@@ -176,10 +164,12 @@ def get_user_tweets(
         user_id: 사용자의 텔레그램 ID
         skip: 건너뛸 트윗 수
         limit: 한 페이지당 트윗 수
+        cursor: keyset 페이징 커서 (지정 시 skip 무시)
+        include_total: False면 전체 개수 count 쿼리 생략
         db: 데이터베이스 세션
     
     Returns:
-        List[Tweet]: 사용자의 트윗 목록 (최신순)
+        dict: 사용자 정보, 트윗 목록 (최신순), 다음 페이지 커서
     
     Raises:
         HTTPException: 사용자를 찾을 수 없는 경우
@@ -193,15 +183,21 @@ def get_user_tweets(
         )
     
     # 사용자의 트윗 조회
-    tweets = db.query(Tweet)\
-        .filter(Tweet.user_id == user_id)\
-        .order_by(Tweet.created_at.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
-    
-    return {
-        "user": user,
-        "tweets": tweets,
-        "total": db.query(Tweet).filter(Tweet.user_id == user_id).count()
-    }
\ No newline at end of file
+    query = apply_cursor(db.query(Tweet).filter(Tweet.user_id == user_id), cursor)
+    if not cursor:
+        query = query.offset(skip)
+    tweets = load_tweet_page(db, query.limit(limit))
+    
+    total = None
+    if include_total:
+        total = cached_count(
+            db.query(Tweet).filter(Tweet.user_id == user_id),
+            filter_key("user_tweets", user_id=user_id)
+        )
+    
+    return fast_response(request, {
+        "user": serialize_user(user),
+        "tweets": serialize_tweets(tweets),
+        "total": total,
+        "next_cursor": next_cursor(tweets, limit)
+    })
\ No newline at end of file
@@ -56,15 +56,40 @@ class Tweet(TweetBase):
     class Config:
         from_attributes = True
 
+class BulkTweetResult(BaseModel):
+    index: int  # 요청 배열에서의 위치
+    status: str  # created, duplicate, invalid
+    tweet_id: Optional[str] = None
+    id: Optional[UUID] = None
+    detail: Optional[str] = None
+
+class BulkTweetResponse(BaseModel):
+    results: List[BulkTweetResult]
+    created: int
+    duplicates: int
+    invalid: int
+
 class TweetResponse(BaseModel):
     tweets: List[Tweet]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
+    next_cursor: Optional[str] = None
 
 class StatsResponse(BaseModel):
     total_tweets: int
     total_users: int
     total_tags: int
     tweets_today: int
-    most_active_user: Optional[str]
\ No newline at end of file
+    most_active_user: Optional[str]
+
+class TimeseriesPoint(BaseModel):
+    bucket: datetime
+    count: int
+
+class TimeseriesResponse(BaseModel):
+    period: str
+    days: int
+    tag: Optional[str] = None
+    user_id: Optional[int] = None
+    points: List[TimeseriesPoint]
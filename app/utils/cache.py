@@ -0,0 +1,236 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+import secrets
+import time
+
+class TTLCache:
+    """
+    LRU + TTL 방식의 프로세스 내 캐시
+
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터, ttl(초)이 지나면
+    조회 시점에 항목을 제거합니다. hits/misses로 캐시 효과를 확인할 수 있습니다.
+
+    clear()마다 generation이 증가합니다. 값을 계산하기 전에 읽어 둔 generation을
+    set()에 넘기면, 계산하는 동안 무효화된 경우 (쓰기 전에 읽은 이전 데이터) 저장하지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> bool:
+        """
+        값을 저장합니다. generation이 현재 값과 다르면 (그 사이 clear됨) 저장하지 않습니다.
+
+        Returns:
+            bool: 저장했으면 True
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return True
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """캐시에 있으면 반환하고, 없으면 factory()로 계산해 저장합니다"""
+        sentinel = object()
+        generation = self.generation
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = factory()
+            self.set(key, value, generation=generation)
+        return value
+
+    async def get_or_set_async(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_set()의 async 버전 (factory는 코루틴 함수)"""
+        sentinel = object()
+        generation = self.generation
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = await factory()
+            self.set(key, value, generation=generation)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.generation += 1
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+class DataVersion:
+    """
+    읽기 API 데이터 버전의 프로세스 내 사본 (conditional_get 미들웨어가 사용)
+
+    이 프로세스의 쓰기는 bump()로 바로 반영하고, 다른 프로세스(스크립트, 다른 워커)의 쓰기는
+    ttl초마다 DB의 데이터 버전(counters.get_data_version)을 다시 읽어 반영합니다.
+    TTL 안의 요청은 DB 조회 없이 버전을 얻으므로, ETag가 같으면 쿼리 없이 304로 응답합니다.
+
+    버전 문자열은 마지막으로 읽은 DB 버전 + 그 조회를 시작한 뒤 이 프로세스의 쓰기 수입니다.
+    쓰기 수에는 프로세스 토큰을 붙여 다른 워커가 같은 문자열을 만들지 않도록 합니다.
+    """
+
+    def __init__(self, ttl: float = 2.0, clock=time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._token = secrets.token_hex(4)
+        self._base: Optional[str] = None
+        self._base_writes = 0
+        self._writes = 0
+        self._expires_at = 0.0
+        self._started = 0
+        self._applied = 0
+        self._lock = Lock()
+
+    def current(self) -> Optional[str]:
+        """TTL 안이면 현재 버전, DB에서 다시 읽어야 하면 None"""
+        with self._lock:
+            if self._base is None or self.clock() >= self._expires_at:
+                return None
+            return self._format()
+
+    def begin_refresh(self) -> Tuple[int, int]:
+        """
+        DB 조회 전에 호출합니다. 조회하는 동안 다른 요청은 기존 버전을 계속 사용합니다.
+
+        Returns:
+            finish_refresh()에 넘길 (조회 번호, 조회 시작 시점의 쓰기 수)
+        """
+        with self._lock:
+            self._started += 1
+            if self._base is not None:
+                self._expires_at = self.clock() + self.ttl
+            return self._started, self._writes
+
+    def finish_refresh(self, ticket: Tuple[int, int], base: str) -> str:
+        """
+        DB에서 읽은 버전을 반영하고 현재 버전을 반환합니다.
+        먼저 시작한 조회가 늦게 끝나면 (더 오래된 값) 반영하지 않습니다.
+        """
+        started, writes = ticket
+        with self._lock:
+            if started > self._applied:
+                self._applied = started
+                self._base = base
+                # 조회를 시작한 뒤의 쓰기는 읽은 값에 없을 수 있으므로 계속 이 프로세스의 쓰기 수로 더함
+                self._base_writes = writes
+                self._expires_at = self.clock() + self.ttl
+            return self._format()
+
+    def bump(self) -> None:
+        """이 프로세스의 쓰기 후 호출 (commit 후, invalidate_responses)"""
+        with self._lock:
+            self._writes += 1
+
+    def reset(self) -> None:
+        """다음 요청에서 DB 버전을 다시 읽도록 합니다 (DB를 바꾼 테스트 등)"""
+        with self._lock:
+            self._base = None
+            self._expires_at = 0.0
+
+    def _format(self) -> str:
+        local = self._writes - self._base_writes
+        return self._base if not local else f"{self._base}.{self._token}.{local}"
+
+# 읽기 API 데이터 버전 (이 프로세스의 쓰기는 즉시, 다른 프로세스의 쓰기는 2초 안에 반영)
+data_version = DataVersion(ttl=2.0)
+
+# 현재 요청의 데이터 버전 (conditional_get 미들웨어가 data_version에서 읽어 설정)
+# 응답/개수 캐시 키에 포함되므로 다른 프로세스의 쓰기 후에는 이전 캐시 항목을 쓰지 않음
+request_data_version: ContextVar[Optional[str]] = ContextVar("request_data_version", default=None)
+
+def versioned_key(key: tuple) -> tuple:
+    """캐시 키에 현재 요청의 데이터 버전을 붙입니다 (요청 밖이면 그대로)"""
+    version = request_data_version.get()
+    return key if version is None else (key, version)
+
+# 목록 API의 전체 개수 캐시 (정규화된 필터 조합 -> count)
+# 트윗 생성/삭제 시 invalidate_tweet_counts()로 비움
+count_cache = TTLCache(maxsize=512, ttl=300)
+
+# 대시보드가 매번 호출하는 읽기 API의 응답 캐시 (/stats, /tags, /tweets 첫 페이지)
+# 트윗/태그/사용자 쓰기 시 invalidate_responses()로 비움
+response_cache = TTLCache(maxsize=256, ttl=60)
+
+def filter_key(scope: str, **filters) -> tuple:
+    """
+    필터 조합을 정규화해 캐시 키를 만듭니다.
+    값이 없는 필터는 제외하고, 리스트는 정렬해 순서와 무관하게 같은 키가 되도록 합니다.
+    """
+    normalized = []
+    for name, value in sorted(filters.items()):
+        if value is None or value == "" or value == []:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = tuple(sorted(str(v).lower().strip() for v in value))
+        elif isinstance(value, str):
+            value = value.strip()
+        normalized.append((name, value))
+    return (scope, tuple(normalized))
+
+def cached_count(query, key: tuple) -> int:
+    """쿼리의 count()를 캐시를 거쳐 반환합니다"""
+    return count_cache.get_or_set(versioned_key(key), query.count)
+
+async def cached_count_async(count: Callable[[], Awaitable[int]], key: tuple) -> int:
+    """cached_count()의 async 버전 (count는 개수를 조회하는 코루틴 함수)"""
+    return await count_cache.get_or_set_async(versioned_key(key), count)
+
+def invalidate_tweet_counts() -> None:
+    count_cache.clear()
+
+def cached_response(key: tuple, factory: Callable[[], Any]) -> Any:
+    """
+    응답을 캐시를 거쳐 반환합니다.
+
+    factory는 ORM 객체가 아닌 직렬화된 값(dict, Pydantic 모델 등)을 반환해야 합니다.
+    세션이 닫힌 뒤에도 캐시된 값을 재사용하기 때문입니다.
+    """
+    return response_cache.get_or_set(versioned_key(key), factory)
+
+async def cached_response_async(key: tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """cached_response()의 async 버전 (factory는 코루틴 함수)"""
+    return await response_cache.get_or_set_async(versioned_key(key), factory)
+
+def invalidate_responses() -> None:
+    """쓰기 후 호출: 응답 캐시를 비우고 데이터 버전을 올립니다 (ETag가 바뀜)"""
+    data_version.bump()
+    response_cache.clear()
+
+def cache_stats() -> dict:
+    return {
+        "responses": response_cache.stats(),
+        "counts": count_cache.stats()
+    }
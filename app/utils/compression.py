@@ -0,0 +1,164 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+import zlib
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성, 없으면 gzip만 사용
+    brotli = None
+
+# 이보다 작은 응답은 압축하지 않음 (헤더/CPU 비용이 절약분보다 큼)
+DEFAULT_MINIMUM_SIZE = 500
+
+# 압축하지 않는 Content-Type
+# - text/event-stream: 압축기가 이벤트를 버퍼링해 실시간 전달이 늦어짐
+# - 이미지/폰트/아카이브 등: 이미 압축된 형식
+UNCOMPRESSIBLE_TYPES = (
+    "text/event-stream",
+    "image/", "video/", "audio/", "font/woff",
+    "application/zip", "application/gzip", "application/x-brotli",
+)
+
+class _GzipEncoder:
+    def __init__(self, level: int):
+        # wbits=31: gzip 헤더/트레일러 포함
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+class _BrotliEncoder:
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
+
+def choose_encoding(accept_encoding: str) -> str:
+    """
+    Accept-Encoding에서 사용할 인코딩을 고릅니다.
+    brotli 모듈이 있고 클라이언트가 br을 받으면 br, 아니면 gzip, 둘 다 아니면 빈 문자열
+    """
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip())
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return ""
+
+class CompressionMiddleware:
+    """
+    gzip / brotli 응답 압축 미들웨어
+
+    Starlette GZipMiddleware와 같은 방식으로 첫 body 메시지를 보고 압축 여부를
+    결정하며, 다음 응답은 그대로 전달합니다.
+    - minimum_size보다 작은 단일 body 응답
+    - 이미 Content-Encoding이 있는 응답 (하위 앱이 압축한 경우 등)
+    - UNCOMPRESSIBLE_TYPES (SSE 스트림, 이미지 등)
+
+    Args:
+        app: ASGI 앱
+        minimum_size: 압축할 최소 응답 크기 (바이트)
+        gzip_level: gzip 압축 레벨 (1-9)
+        brotli_quality: brotli 품질 (0-11), 동적 응답이므로 낮은 값 사용
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = DEFAULT_MINIMUM_SIZE,
+                 gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def _encoder(self, encoding: str):
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.encoder = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 첫 body를 보기 전까지 헤더를 보류 (압축 여부에 따라 헤더가 바뀜)
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            content_length = headers.get("content-length", "")
+            self.passthrough = "content-encoding" in headers \
+                or content_type.startswith(UNCOMPRESSIBLE_TYPES) \
+                or (content_length.isdigit() and int(content_length) < self.middleware.minimum_size)
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            if not self.started:
+                self.started = True
+                await self._send(self.initial_message)
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send(self.initial_message)
+                await self._send(message)
+                return
+
+            self.encoder = self.middleware._encoder(self.encoding)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                body = self.encoder.process(body) + self.encoder.flush()
+                headers["Content-Length"] = str(len(body))
+                await self._send(self.initial_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            # 스트리밍 응답: 전체 길이를 알 수 없음
+            del headers["Content-Length"]
+            await self._send(self.initial_message)
+
+        chunk = self.encoder.process(body)
+        if not more_body:
+            chunk += self.encoder.flush()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -0,0 +1,422 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, func, select
+from app.models.models import User, Tweet, Tag, tweet_tags, StatCounter, DailyTweetCount, UserTweetCount, TagRollup, UserRollup
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+
+TOTAL_TWEETS = "tweets"
+TOTAL_USERS = "users"
+TOTAL_TAGS = "tags"
+# 읽기 API 데이터 버전 - 쓰기 트랜잭션마다 1 증가 (ETag, 응답 캐시 키에 사용)
+DATA_VERSION = "data_version"
+
+# 롤업 버킷 단위
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+PERIODS = (PERIOD_HOUR, PERIOD_DAY)
+
+# 이 기간(일) 이하의 집계는 시 단위 버킷, 그보다 길면 일 단위 버킷을 읽음
+HOURLY_WINDOW_DAYS = 7
+
+def _bump(db: Session, model, key_column, key, value_column, delta: int) -> None:
+    """
+    카운터 행을 delta만큼 증감합니다. 행이 없으면 새로 만듭니다.
+    호출한 쪽의 트랜잭션 안에서 실행되며 commit은 호출한 쪽에서 합니다.
+    """
+    _bump_row(db, model, {key_column: key}, value_column, delta)
+
+def _dialect_insert(db: Session):
+    """DB 종류에 맞는 INSERT ... ON CONFLICT를 지원하는 insert 함수 (지원하지 않으면 None)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert
+
+def _bump_row(db: Session, model, keys: dict, value_column, delta: int) -> None:
+    """복합 키(컬럼 -> 값)로 식별되는 카운터 행을 delta만큼 증감합니다."""
+    _bump_rows(db, model, list(keys), value_column, {tuple(keys.values()): delta})
+
+def _bump_rows(db: Session, model, key_columns: list, value_column, deltas: dict) -> None:
+    """
+    여러 카운터 행을 한 번에 증감합니다.
+
+    INSERT ... ON CONFLICT DO UPDATE 한 문장(executemany)으로 처리해, 동시에 같은 행을
+    처음 만드는 트랜잭션이 있어도 기본 키 충돌(IntegrityError) 없이 증감됩니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: 카운터 모델
+        key_columns: 기본 키 컬럼 목록
+        value_column: 증감할 컬럼
+        deltas: 키 값 튜플(key_columns 순서) -> 증감량
+    """
+    if not deltas:
+        return
+    insert = _dialect_insert(db)
+    if insert is None:
+        for key, delta in deltas.items():
+            updated = db.query(model)\
+                .filter(*[column == value for column, value in zip(key_columns, key)])\
+                .update({value_column: value_column + delta}, synchronize_session=False)
+            if not updated:
+                db.add(model(**{column.key: value for column, value in zip(key_columns, key)},
+                             **{value_column.key: max(delta, 0)}))
+        db.flush()
+        return
+    table = model.__table__
+    statement = insert(table).values(
+        **{column.key: bindparam(column.key) for column in key_columns},
+        **{value_column.key: bindparam("initial")}
+    ).on_conflict_do_update(
+        index_elements=[column.key for column in key_columns],
+        set_={value_column.key: table.c[value_column.key] + bindparam("delta")}
+    )
+    db.execute(statement, [
+        {**{column.key: value for column, value in zip(key_columns, key)}, "initial": max(delta, 0), "delta": delta}
+        for key, delta in deltas.items()
+    ])
+
+def _bump_total(db: Session, name: str, delta: int) -> None:
+    _bump(db, StatCounter, StatCounter.name, name, StatCounter.value, delta)
+
+def bump_data_version(db: Session) -> None:
+    """
+    읽기 API 데이터 버전을 올립니다 (쓰기 트랜잭션 안에서, commit 전에 호출).
+    트윗/사용자/태그 생성·삭제 훅은 직접 호출하므로 그 밖의 쓰기에서만 부르면 됩니다.
+    DB에 저장되므로 다른 프로세스(스크립트, 다른 워커)의 쓰기도 ETag에 반영됩니다
+    (cache.data_version의 TTL마다 다시 읽음).
+    """
+    _bump_total(db, DATA_VERSION, 1)
+
+def get_data_version(db: Session) -> str:
+    """
+    현재 데이터 버전 문자열 (쿼리 한 번)
+
+    데이터 버전 카운터와 최신 트윗 created_at을 함께 사용해, 카운터를 거치지 않고
+    직접 넣은 트윗(create_test_data.py 등)도 버전을 바꾸도록 합니다.
+    """
+    counter, latest = db.query(
+        db.query(StatCounter.value).filter(StatCounter.name == DATA_VERSION).scalar_subquery(),
+        db.query(func.max(Tweet.created_at)).scalar_subquery()
+    ).one()
+    if isinstance(latest, str):  # SQLite 스칼라 서브쿼리는 문자열을 반환할 수 있음
+        latest = datetime.fromisoformat(latest)
+    return f"{counter or 0}-{int(latest.timestamp() * 1000000) if latest else 0:x}"
+
+def bump_tag_counts(db: Session, tag_ids: List[int], delta: int) -> None:
+    """태그가 트윗에 연결(+1)/해제(-1)될 때 Tag.tweet_count 갱신 (commit 전에 호출)"""
+    if not tag_ids:
+        return
+    db.query(Tag)\
+        .filter(Tag.id.in_(tag_ids))\
+        .update({Tag.tweet_count: func.coalesce(Tag.tweet_count, 0) + delta}, synchronize_session=False)
+
+def on_tweet_created(db: Session, tweet: Tweet) -> None:
+    """트윗 생성 시 전체/일별/사용자별/태그별 카운터 증가 (flush 후 commit 전에 호출)"""
+    on_tweets_created(db, [tweet])
+
+def on_tweets_created(db: Session, tweets: List[Tweet]) -> None:
+    """
+    여러 트윗을 한 번에 생성했을 때 카운터를 묶어서 증가시킵니다.
+    날짜/사용자/태그별로 합산해 키마다 UPDATE 한 번만 실행합니다.
+    """
+    if not tweets:
+        return
+    days = Counter(tweet.created_at.date() if tweet.created_at else date.today() for tweet in tweets)
+    users = Counter(tweet.user_id for tweet in tweets)
+    tags = Counter(tag.id for tweet in tweets for tag in tweet.tags)
+
+    _bump_total(db, TOTAL_TWEETS, len(tweets))
+    bump_data_version(db)
+    for day, count in days.items():
+        _bump(db, DailyTweetCount, DailyTweetCount.day, day, DailyTweetCount.tweet_count, count)
+    for user_id, count in users.items():
+        _bump(db, UserTweetCount, UserTweetCount.user_id, user_id, UserTweetCount.tweet_count, count)
+    by_delta = {}
+    for tag_id, count in tags.items():
+        by_delta.setdefault(count, []).append(tag_id)
+    for count, tag_ids in by_delta.items():
+        bump_tag_counts(db, tag_ids, count)
+    _bump_rollups(db, tweets, 1)
+
+def on_tweet_deleted(db: Session, tweet: Tweet) -> None:
+    """트윗 삭제 시 전체/일별/사용자별/태그별 카운터 감소 (commit 전에 호출)"""
+    _bump_total(db, TOTAL_TWEETS, -1)
+    bump_data_version(db)
+    if tweet.created_at:
+        _bump(db, DailyTweetCount, DailyTweetCount.day, tweet.created_at.date(), DailyTweetCount.tweet_count, -1)
+    _bump(db, UserTweetCount, UserTweetCount.user_id, tweet.user_id, UserTweetCount.tweet_count, -1)
+    bump_tag_counts(db, [tag.id for tag in tweet.tags], -1)
+    _bump_rollups(db, [tweet], -1)
+
+def bucket_start(value: datetime, period: str) -> datetime:
+    """시각이 속한 버킷의 시작 시각 (hour: 정시, day: 자정)"""
+    if period == PERIOD_DAY:
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+def _rollup_keys(tweets: List[Tweet]):
+    """트윗 목록을 (period, bucket, user_id) / (period, bucket, tag_id)별 개수로 합산"""
+    users, tags = Counter(), Counter()
+    for tweet in tweets:
+        created_at = tweet.created_at or datetime.utcnow()
+        for period in PERIODS:
+            bucket = bucket_start(created_at, period)
+            if tweet.user_id is not None:
+                users[(period, bucket, tweet.user_id)] += 1
+            for tag in tweet.tags:
+                tags[(period, bucket, tag.id)] += 1
+    return users, tags
+
+def _bump_rollups(db: Session, tweets: List[Tweet], sign: int) -> None:
+    """트윗 생성(+1)/삭제(-1) 시 시/일 단위 태그별, 사용자별 롤업 갱신"""
+    users, tags = _rollup_keys(tweets)
+    _bump_rows(db, UserRollup, [UserRollup.period, UserRollup.bucket, UserRollup.user_id], UserRollup.tweet_count,
+               {key: sign * count for key, count in users.items()})
+    _bump_rows(db, TagRollup, [TagRollup.period, TagRollup.bucket, TagRollup.tag_id], TagRollup.tweet_count,
+               {key: sign * count for key, count in tags.items()})
+
+def on_user_created(db: Session) -> None:
+    """사용자 생성 시 전체 사용자 수 증가 (commit 전에 호출)"""
+    _bump_total(db, TOTAL_USERS, 1)
+    bump_data_version(db)
+
+def on_tag_created(db: Session) -> None:
+    """태그 생성 시 전체 태그 수 증가 (commit 전에 호출)"""
+    _bump_total(db, TOTAL_TAGS, 1)
+    bump_data_version(db)
+
+def bump_total_tags(db: Session, created: int) -> None:
+    """태그를 여러 개 한 번에 생성했을 때 전체 태그 수 증가 (commit 전에 호출)"""
+    _bump_total(db, TOTAL_TAGS, created)
+    bump_data_version(db)
+
+def get_stats_snapshot(db: Session) -> dict:
+    """대시보드 통계 (StatsResponse와 같은 필드)를 카운터 테이블에서 읽습니다."""
+    return stats_snapshot_from_row(db.execute(stats_snapshot_statement()).one())
+
+def stats_snapshot_statement():
+    """
+    대시보드 통계를 한 번에 읽는 SELECT (스칼라 서브쿼리 5개, 모두 기본키/인덱스 조회)
+    AsyncSession에서도 같은 문장을 실행합니다.
+    """
+    def total(name):
+        return select(StatCounter.value).where(StatCounter.name == name).scalar_subquery()
+
+    # 오늘 등록된 트윗 수 (일별 카운터의 기본키 조회)
+    today = select(DailyTweetCount.tweet_count)\
+        .where(DailyTweetCount.day == datetime.now().date()).scalar_subquery()
+    # 트윗이 가장 많은 사용자의 사용자명 (user_tweet_counts 인덱스 사용)
+    most_active = select(User.telegram_username)\
+        .join(UserTweetCount, UserTweetCount.user_id == User.telegram_id)\
+        .where(UserTweetCount.tweet_count > 0)\
+        .order_by(UserTweetCount.tweet_count.desc())\
+        .limit(1).scalar_subquery()
+    return select(
+        total(TOTAL_TWEETS).label("total_tweets"),
+        total(TOTAL_USERS).label("total_users"),
+        total(TOTAL_TAGS).label("total_tags"),
+        today.label("tweets_today"),
+        most_active.label("most_active_user"),
+    )
+
+def stats_snapshot_from_row(row) -> dict:
+    return {
+        "total_tweets": row.total_tweets or 0,
+        "total_users": row.total_users or 0,
+        "total_tags": row.total_tags or 0,
+        "tweets_today": row.tweets_today or 0,
+        "most_active_user": row.most_active_user,
+    }
+
+def rollup_window(days: int):
+    """
+    최근 N일 집계에 사용할 버킷 단위와 시작 버킷을 반환합니다.
+    짧은 기간은 시 단위로 정확하게, 긴 기간은 일 단위로 읽는 행 수를 줄입니다.
+    """
+    period = PERIOD_HOUR if days <= HOURLY_WINDOW_DAYS else PERIOD_DAY
+    since = bucket_start(datetime.utcnow() - timedelta(days=days), period)
+    return period, since
+
+def get_top_tags(db: Session, days: int, limit: int):
+    """최근 N일간 트윗이 많은 태그 (tag_rollups 기간 스캔, tweets 테이블 미사용)"""
+    period, since = rollup_window(days)
+    usage = func.sum(TagRollup.tweet_count)
+    return db.query(Tag.name, usage.label("usage_count"))\
+        .select_from(TagRollup)\
+        .join(Tag, Tag.id == TagRollup.tag_id)\
+        .filter(TagRollup.period == period, TagRollup.bucket >= since)\
+        .group_by(TagRollup.tag_id, Tag.name)\
+        .having(usage > 0)\
+        .order_by(usage.desc())\
+        .limit(limit)\
+        .all()
+
+def get_top_users(db: Session, days: int, limit: int):
+    """최근 N일간 트윗이 많은 사용자 (user_rollups 기간 스캔, tweets 테이블 미사용)"""
+    period, since = rollup_window(days)
+    usage = func.sum(UserRollup.tweet_count)
+    return db.query(User.telegram_id, User.telegram_username, User.display_name, usage.label("tweet_count"))\
+        .select_from(UserRollup)\
+        .join(User, User.telegram_id == UserRollup.user_id)\
+        .filter(UserRollup.period == period, UserRollup.bucket >= since)\
+        .group_by(User.telegram_id, User.telegram_username, User.display_name)\
+        .having(usage > 0)\
+        .order_by(usage.desc())\
+        .limit(limit)\
+        .all()
+
+def get_timeseries(db: Session, period: str, since: datetime, until: datetime,
+                   tag_id: Optional[int] = None, user_id: Optional[int] = None) -> List[dict]:
+    """
+    버킷별 트윗 수를 빈 구간은 0으로 채워 반환합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        period: hour 또는 day
+        since: 시작 시각 (버킷 시작으로 내림)
+        until: 종료 시각 (포함)
+        tag_id: 지정하면 해당 태그의 트윗 수
+        user_id: 지정하면 해당 사용자의 트윗 수 (둘 다 없으면 전체)
+
+    Returns:
+        List[dict]: [{"bucket": 구간 시작 시각, "count": 트윗 수}, ...]
+    """
+    start = bucket_start(since, period)
+    if tag_id is not None:
+        model, filters = TagRollup, [TagRollup.tag_id == tag_id]
+    else:
+        # 트윗마다 사용자는 하나이므로 사용자 롤업의 합이 전체 트윗 수
+        model, filters = UserRollup, [UserRollup.user_id == user_id] if user_id is not None else []
+    rows = db.query(model.bucket, func.sum(model.tweet_count))\
+        .filter(model.period == period, model.bucket >= start, model.bucket <= until, *filters)\
+        .group_by(model.bucket)\
+        .all()
+    counts = dict(rows)
+
+    step = timedelta(days=1) if period == PERIOD_DAY else timedelta(hours=1)
+    points = []
+    bucket = start
+    while bucket <= until:
+        points.append({"bucket": bucket, "count": int(counts.get(bucket) or 0)})
+        bucket += step
+    return points
+
+def rebuild_rollups(db: Session) -> int:
+    """
+    tweets / tweet_tags에서 시/일 단위 롤업을 다시 계산합니다 (commit은 호출한 쪽에서).
+
+    버킷 계산(시/일 내림)이 DB마다 다르므로 (created_at, user_id), (created_at, tag_id)를
+    나눠 읽어 파이썬에서 합산합니다.
+
+    Returns:
+        int: 생성된 롤업 행 수
+    """
+    db.query(TagRollup).delete(synchronize_session=False)
+    db.query(UserRollup).delete(synchronize_session=False)
+
+    users, tags = Counter(), Counter()
+    for created_at, user_id in db.query(Tweet.created_at, Tweet.user_id)\
+            .filter(Tweet.created_at.isnot(None), Tweet.user_id.isnot(None)).yield_per(5000):
+        for period in PERIODS:
+            users[(period, bucket_start(created_at, period), user_id)] += 1
+    for created_at, tag_id in db.query(Tweet.created_at, tweet_tags.c.tag_id)\
+            .join(tweet_tags, tweet_tags.c.tweet_id == Tweet.id)\
+            .filter(Tweet.created_at.isnot(None)).yield_per(5000):
+        for period in PERIODS:
+            tags[(period, bucket_start(created_at, period), tag_id)] += 1
+
+    db.bulk_insert_mappings(UserRollup, [
+        {"period": period, "bucket": bucket, "user_id": user_id, "tweet_count": count}
+        for (period, bucket, user_id), count in users.items()
+    ])
+    db.bulk_insert_mappings(TagRollup, [
+        {"period": period, "bucket": bucket, "tag_id": tag_id, "tweet_count": count}
+        for (period, bucket, tag_id), count in tags.items()
+    ])
+    return len(users) + len(tags)
+
+def rebuild_counters(db: Session) -> dict:
+    """
+    원본 테이블에서 모든 카운터를 다시 계산합니다.
+    스크립트로 직접 데이터를 넣었거나 카운터가 어긋난 경우 사용합니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        dict: 재계산된 전체 카운터 값
+    """
+    # 데이터 버전은 이전 값으로 돌아가면 안 되므로 지우지 않고 올림
+    db.query(StatCounter).filter(StatCounter.name != DATA_VERSION).delete(synchronize_session=False)
+    db.query(DailyTweetCount).delete(synchronize_session=False)
+    db.query(UserTweetCount).delete(synchronize_session=False)
+
+    totals = {
+        TOTAL_TWEETS: db.query(func.count(Tweet.id)).scalar(),
+        TOTAL_USERS: db.query(func.count(User.telegram_id)).scalar(),
+        TOTAL_TAGS: db.query(func.count(Tag.id)).scalar(),
+    }
+    db.add_all(StatCounter(name=name, value=value) for name, value in totals.items())
+
+    daily = db.query(func.date(Tweet.created_at), func.count(Tweet.id))\
+        .filter(Tweet.created_at.isnot(None))\
+        .group_by(func.date(Tweet.created_at))\
+        .all()
+    for day, count in daily:
+        if isinstance(day, str):  # SQLite의 date()는 문자열을 반환
+            day = date.fromisoformat(day)
+        db.add(DailyTweetCount(day=day, tweet_count=count))
+
+    per_user = db.query(Tweet.user_id, func.count(Tweet.id))\
+        .filter(Tweet.user_id.isnot(None))\
+        .group_by(Tweet.user_id)\
+        .all()
+    db.add_all(UserTweetCount(user_id=user_id, tweet_count=count) for user_id, count in per_user)
+    rebuild_rollups(db)
+    bump_data_version(db)
+
+    db.commit()
+    return totals
+
+def reconcile_tag_counts(db: Session) -> int:
+    """
+    Tag.tweet_count를 tweet_tags의 실제 연결 수와 비교해 어긋난 값을 바로잡습니다.
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        int: 값이 수정된 태그 수
+    """
+    actual = dict(
+        db.query(tweet_tags.c.tag_id, func.count(tweet_tags.c.tweet_id))
+        .group_by(tweet_tags.c.tag_id)
+        .all()
+    )
+    fixed = 0
+    for tag in db.query(Tag).all():
+        count = actual.get(tag.id, 0)
+        if tag.tweet_count != count:
+            tag.tweet_count = count
+            fixed += 1
+    if fixed:
+        bump_data_version(db)
+    db.commit()
+    return fixed
+
+def ensure_counters(db: Session) -> None:
+    """카운터가 한 번도 계산되지 않은 DB(기존 DB 포함)라면 재계산합니다."""
+    if db.query(StatCounter).filter(StatCounter.name == TOTAL_TWEETS).first() is None:
+        rebuild_counters(db)
+        # 이전 버전은 Tag.tweet_count를 갱신하지 않았으므로 함께 보정
+        reconcile_tag_counts(db)
+    elif db.query(UserRollup).first() is None and db.query(Tweet.id).first() is not None:
+        # 롤업 테이블이 추가되기 전의 DB
+        rebuild_rollups(db)
+        db.commit()
@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 from app.models.models import User, Tweet, Tag, tweet_tags
 from app.schemas.schemas import UserCreate
-from typing import Optional
+from app.utils import counters
+from app.utils.tag_filters import normalize_tag_name, normalize_tag_names
+from typing import Optional, List, Tuple
+from uuid import UUID
+import re
 
 def get_or_create_user(db: Session, telegram_id: int, telegram_username: str, display_name: str) -> User:
     """
@@ -22,6 +26,7 @@ def get_or_create_user(db: Session, telegram_id: int, telegram_username: str, di
         if user.telegram_username != telegram_username or user.display_name != display_name:
             user.telegram_username = telegram_username
             user.display_name = display_name
+            counters.bump_data_version(db)
             db.commit()
             db.refresh(user)
         return user
@@ -32,6 +37,7 @@ def get_or_create_user(db: Session, telegram_id: int, telegram_username: str, di
         display_name=display_name
     )
     db.add(new_user)
+    counters.on_user_created(db)
     db.commit()
     db.refresh(new_user)
     return new_user
@@ -47,13 +53,109 @@ def get_or_create_tag(db: Session, tag_name: str) -> Tag:
     Returns:
         Tag: 태그 객체
     """
-    tag = db.query(Tag).filter(Tag.name == tag_name.lower()).first()
+    tag_name = normalize_tag_name(tag_name)
+    tag = db.query(Tag).filter(Tag.name == tag_name).first()
     
     if tag:
         return tag
     
-    new_tag = Tag(name=tag_name.lower())
+    new_tag = Tag(name=tag_name)
     db.add(new_tag)
+    counters.on_tag_created(db)
     db.commit()
     db.refresh(new_tag)
-    return new_tag
\ No newline at end of file
+    return new_tag
+
+def _insert_ignore(db: Session):
+    """DB 종류에 맞는 INSERT ... ON CONFLICT DO NOTHING 구문 (지원하지 않으면 None)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert(Tag).on_conflict_do_nothing(index_elements=[Tag.name])
+
+def get_or_create_tags(db: Session, tag_names: List[str]) -> List[Tag]:
+    """
+    여러 태그를 한 번에 찾거나 생성합니다. commit하지 않으므로 호출한 쪽의
+    트랜잭션에 포함됩니다.
+
+    기존 태그는 IN 쿼리 한 번으로 조회하고, 없는 이름만 INSERT ... ON CONFLICT DO NOTHING
+    한 번으로 추가합니다. 이미 있는 이름은 INSERT하지 않으므로 PostgreSQL 시퀀스 값을 쓰지 않습니다.
+
+    Args:
+        db: 데이터베이스 세션
+        tag_names: 태그 이름 목록
+
+    Returns:
+        List[Tag]: 요청한 순서대로 정렬된 태그 객체 목록 (중복 제거)
+    """
+    names = normalize_tag_names(tag_names)
+    if not names:
+        return []
+
+    tags = db.query(Tag).filter(Tag.name.in_(names)).all()
+    existing = {tag.name for tag in tags}
+    missing = [name for name in names if name not in existing]
+    if missing:
+        statement = _insert_ignore(db)
+        if statement is not None:
+            # 실제로 추가된 행만 RETURNING으로 돌아옴
+            created = db.scalars(statement.returning(Tag), [{"name": name} for name in missing]).all()
+            if created:
+                counters.bump_total_tags(db, len(created))
+            tags.extend(created)
+            if len(created) < len(missing):
+                # 조회와 INSERT 사이에 다른 트랜잭션이 추가한 태그
+                added = {tag.name for tag in created}
+                tags.extend(db.query(Tag).filter(Tag.name.in_([name for name in missing if name not in added])).all())
+        else:
+            new_tags = [Tag(name=name) for name in missing]
+            db.add_all(new_tags)
+            db.flush()
+            counters.bump_total_tags(db, len(new_tags))
+            tags.extend(new_tags)
+
+    by_name = {tag.name: tag for tag in tags}
+    return [by_name[name] for name in names if name in by_name]
+
+SHORT_ID_PATTERN = re.compile(r'^[0-9a-f]{4,32}$')
+
+def tweet_id_prefix_range(short_id: str) -> Optional[Tuple[UUID, UUID]]:
+    """
+    UUID 앞부분(짧은 ID)을 기본키 범위 [prefix000..., prefixfff...]로 변환합니다.
+    LIKE 'prefix%' 대신 범위 조건을 쓰므로 tweets.id 인덱스를 그대로 사용합니다.
+
+    Args:
+        short_id: UUID의 앞 4~32자리 hex (하이픈 허용, 대소문자 무시)
+
+    Returns:
+        Optional[Tuple[UUID, UUID]]: (하한, 상한), 형식이 잘못되면 None
+    """
+    prefix = short_id.replace("-", "").lower()
+    if not SHORT_ID_PATTERN.match(prefix):
+        return None
+    return UUID(prefix.ljust(32, "0")), UUID(prefix.ljust(32, "f"))
+
+def find_tweets_by_id_prefix(db: Session, short_id: str, user_id: Optional[int] = None, limit: int = 2) -> List[Tweet]:
+    """
+    짧은 ID로 시작하는 트윗을 찾습니다. 모호한지 판단할 수 있도록 기본 2개까지 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        short_id: UUID 앞부분
+        user_id: 지정하면 해당 사용자의 트윗만
+        limit: 최대 조회 개수
+
+    Returns:
+        List[Tweet]: 일치하는 트윗 목록 (형식이 잘못되면 빈 목록)
+    """
+    id_range = tweet_id_prefix_range(short_id)
+    if id_range is None:
+        return []
+    query = db.query(Tweet).filter(Tweet.id >= id_range[0], Tweet.id <= id_range[1])
+    if user_id is not None:
+        query = query.filter(Tweet.user_id == user_id)
+    return query.limit(limit).all()
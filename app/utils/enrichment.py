@@ -0,0 +1,378 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, func, bindparam, or_
+from app.models.models import Tweet, EnrichmentJob
+from app.utils.preview_providers import PreviewProvider, RateLimited, TweetPreview
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts
+from app.utils import counters
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Callable, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_FAILED = "failed"
+
+# 꺼낸 작업의 임대 시간 (워커가 처리 중 죽으면 이 시간 뒤 다시 처리됨)
+LEASE_SECONDS = 300
+# 조회 실패 시 재시도 대기 (attempts마다 2배, 최대 RETRY_MAX_SECONDS)
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+MAX_ATTEMPTS = 5
+
+class TokenBucket:
+    """
+    제공자 요청 한도용 토큰 버킷
+
+    초당 rate개씩 최대 capacity개까지 토큰이 쌓이고, 요청마다 하나를 씁니다.
+    제공자가 한도 초과를 알려 오면 pause()로 지정한 시간 동안 토큰을 비웁니다.
+
+    Args:
+        rate: 초당 토큰 수 (예: 15분에 300회면 300 / 900)
+        capacity: 최대 토큰 수 (연속으로 보낼 수 있는 요청 수)
+        clock: 현재 시각 함수 (테스트에서 교체)
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """토큰을 쓸 수 있을 때까지 남은 시간 (초, 0이면 바로 사용 가능)"""
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """토큰이 있으면 쓰고 True, 없으면 False"""
+        with self._lock:
+            self._refill()
+            if self.tokens < tokens:
+                return False
+            self.tokens -= tokens
+            return True
+
+    def pause(self, seconds: float) -> None:
+        """seconds초 동안 토큰이 없도록 비웁니다 (Retry-After / 한도 초기화 시각)"""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+def _insert_ignore(db: Session):
+    """DB 종류에 맞는 대기열 INSERT ... ON CONFLICT DO NOTHING 구문 (지원하지 않으면 None)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return None
+    return insert(EnrichmentJob).on_conflict_do_nothing(index_elements=[EnrichmentJob.tweet_id])
+
+def enqueue(db: Session, tweet_ids: List[str]) -> None:
+    """
+    트윗을 미리보기 수집 대기열에 추가합니다 (commit 전에 호출, 트윗 등록과 같은 트랜잭션).
+    이미 대기열에 있는 트윗은 건너뜁니다.
+
+    Args:
+        db: 데이터베이스 세션
+        tweet_ids: 트위터 status ID 목록
+    """
+    tweet_ids = [tweet_id for tweet_id in dict.fromkeys(tweet_ids) if tweet_id]
+    if not tweet_ids:
+        return
+    now = datetime.utcnow()
+    rows = [
+        {"tweet_id": tweet_id, "status": STATUS_PENDING, "attempts": 0, "available_at": now, "created_at": now}
+        for tweet_id in tweet_ids
+    ]
+    statement = _insert_ignore(db)
+    if statement is not None:
+        db.execute(statement, rows)
+        return
+
+    existing = set(db.scalars(select(EnrichmentJob.tweet_id).where(EnrichmentJob.tweet_id.in_(tweet_ids))))
+    db.add_all(EnrichmentJob(**row) for row in rows if row["tweet_id"] not in existing)
+
+def enqueue_missing(db: Session, batch_size: int = 1000) -> int:
+    """
+    미리보기가 비어 있고 대기열에 없는 기존 트윗을 모두 대기열에 넣습니다.
+
+    Returns:
+        int: 추가한 트윗 수
+    """
+    added = 0
+    last_id = ""
+    while True:
+        tweet_ids = db.scalars(
+            select(Tweet.tweet_id)
+            .where(
+                Tweet.tweet_id > last_id,
+                or_(Tweet.content_preview.is_(None), Tweet.content_preview == ""),
+                ~select(EnrichmentJob.tweet_id).where(EnrichmentJob.tweet_id == Tweet.tweet_id).exists()
+            )
+            .order_by(Tweet.tweet_id)
+            .limit(batch_size)
+        ).all()
+        if not tweet_ids:
+            break
+        enqueue(db, tweet_ids)
+        db.commit()
+        added += len(tweet_ids)
+        last_id = tweet_ids[-1]
+    return added
+
+def claim_batch(db: Session, limit: int) -> List[str]:
+    """
+    처리할 작업을 오래된 순으로 최대 limit개 꺼내고 LEASE_SECONDS 동안 임대합니다.
+    PostgreSQL에서는 SKIP LOCKED로 여러 워커가 같은 작업을 꺼내지 않습니다.
+
+    Returns:
+        List[str]: 트위터 status ID 목록
+    """
+    now = datetime.utcnow()
+    tweet_ids = db.scalars(
+        select(EnrichmentJob.tweet_id)
+        .where(EnrichmentJob.status == STATUS_PENDING, EnrichmentJob.available_at <= now)
+        .order_by(EnrichmentJob.available_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if tweet_ids:
+        db.execute(
+            update(EnrichmentJob)
+            .where(EnrichmentJob.tweet_id.in_(tweet_ids))
+            .values(available_at=now + timedelta(seconds=LEASE_SECONDS))
+        )
+    db.commit()
+    return list(tweet_ids)
+
+def complete_batch(db: Session, tweet_ids: List[str], previews: Dict[str, TweetPreview]) -> int:
+    """
+    가져온 미리보기를 tweets에 저장하고 작업을 대기열에서 지웁니다.
+    결과에 없는 트윗(삭제/비공개)은 failed로 남겨 다시 조회하지 않습니다.
+
+    Returns:
+        int: 미리보기를 저장한 트윗 수
+    """
+    found = [tweet_id for tweet_id in tweet_ids if tweet_id in previews]
+    missing = [tweet_id for tweet_id in tweet_ids if tweet_id not in previews]
+
+    if found:
+        tweets = Tweet.__table__
+        db.execute(
+            tweets.update()
+            .where(tweets.c.tweet_id == bindparam("b_tweet_id"))
+            .values(
+                content_preview=bindparam("b_text"),
+                image_url=bindparam("b_image_url"),
+                updated_at=datetime.utcnow()
+            ),
+            [
+                {"b_tweet_id": tweet_id, "b_text": previews[tweet_id].text, "b_image_url": previews[tweet_id].image_url}
+                for tweet_id in found
+            ]
+        )
+        db.execute(delete(EnrichmentJob).where(EnrichmentJob.tweet_id.in_(found)))
+        counters.bump_data_version(db)
+    if missing:
+        db.execute(
+            update(EnrichmentJob)
+            .where(EnrichmentJob.tweet_id.in_(missing))
+            .values(status=STATUS_FAILED, attempts=EnrichmentJob.attempts + 1, last_error="not found")
+        )
+    db.commit()
+    return len(found)
+
+def retry_batch(db: Session, tweet_ids: List[str], error: str) -> None:
+    """
+    조회에 실패한 작업을 지수 백오프 후 다시 처리하도록 돌려놓습니다.
+    MAX_ATTEMPTS번 실패한 작업은 failed로 바꿉니다.
+    """
+    now = datetime.utcnow()
+    jobs = db.query(EnrichmentJob).filter(EnrichmentJob.tweet_id.in_(tweet_ids)).all()
+    for job in jobs:
+        job.attempts += 1
+        job.last_error = error[:1000]
+        if job.attempts >= MAX_ATTEMPTS:
+            job.status = STATUS_FAILED
+        else:
+            delay = min(RETRY_BASE_SECONDS * 2 ** (job.attempts - 1), RETRY_MAX_SECONDS)
+            job.available_at = now + timedelta(seconds=delay)
+    db.commit()
+
+def release_batch(db: Session, tweet_ids: List[str], available_at: datetime) -> None:
+    """임대를 풀어 available_at 이후 다시 처리하도록 합니다 (시도 횟수는 그대로)"""
+    db.execute(
+        update(EnrichmentJob)
+        .where(EnrichmentJob.tweet_id.in_(tweet_ids))
+        .values(available_at=available_at)
+    )
+    db.commit()
+
+def queue_stats(db: Session) -> dict:
+    """상태별 대기열 작업 수"""
+    counts = dict(db.query(EnrichmentJob.status, func.count()).group_by(EnrichmentJob.status).all())
+    return {"pending": counts.get(STATUS_PENDING, 0), "failed": counts.get(STATUS_FAILED, 0)}
+
+class EnrichmentWorker:
+    """
+    트윗 미리보기 수집 워커
+
+    대기열에서 최대 batch_size개씩 꺼내 제공자에 한 번의 조회로 요청하고, 결과를
+    tweets.content_preview / image_url에 채웁니다. 요청 전에 토큰 버킷으로 제공자
+    한도를 지키며, DB와 제공자 호출은 스레드에서 실행해 API 서버의 이벤트 루프를
+    막지 않습니다. 트윗 등록 경로는 대기열에 한 행을 추가하는 것 외에 기다리지 않습니다.
+
+    Args:
+        session_factory: 세션 생성 함수 (SessionLocal)
+        provider: 미리보기 제공자
+        bucket: 제공자 요청 한도 토큰 버킷
+        batch_size: 조회 한 번에 보낼 최대 트윗 수 (provider.max_batch_size 이하로 제한)
+        poll_interval: 대기열이 비었을 때 다시 확인하는 간격 (초)
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], provider: PreviewProvider,
+                 bucket: TokenBucket, batch_size: int = 100, poll_interval: float = 5.0):
+        self.session_factory = session_factory
+        self.provider = provider
+        self.bucket = bucket
+        self.batch_size = max(1, min(batch_size, provider.max_batch_size))
+        self.poll_interval = poll_interval
+        self.processed = 0
+        self.enriched = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def process_batch(self) -> Optional[int]:
+        """
+        토큰이 있으면 작업 한 배치를 처리합니다 (동기, 스레드에서 호출).
+
+        Returns:
+            Optional[int]: 처리한 작업 수 (대기열이 비었으면 0), 토큰이 없으면 None
+        """
+        if self.bucket.wait_time() > 0:
+            return None
+
+        db = self.session_factory()
+        try:
+            tweet_ids = claim_batch(db, self.batch_size)
+            if not tweet_ids:
+                return 0
+            # claim 이후에 토큰을 씀 (대기열이 비어 있을 때는 토큰을 쓰지 않음)
+            self.bucket.try_acquire()
+
+            try:
+                previews = self.provider.lookup(tweet_ids)
+            except RateLimited as e:
+                logger.warning(f"미리보기 제공자 한도 초과, {e.retry_after:.0f}초 대기")
+                self.bucket.pause(e.retry_after)
+                release_batch(db, tweet_ids, datetime.utcnow() + timedelta(seconds=e.retry_after))
+                return len(tweet_ids)
+            except Exception as e:
+                logger.warning(f"미리보기 조회 실패 ({len(tweet_ids)}개): {e}")
+                retry_batch(db, tweet_ids, str(e))
+                return len(tweet_ids)
+
+            enriched = complete_batch(db, tweet_ids, previews)
+            if enriched:
+                # 미리보기는 search= 검색 대상이므로 개수 캐시도 비움
+                invalidate_tweet_counts()
+                invalidate_responses()
+            self.processed += len(tweet_ids)
+            self.enriched += enriched
+            return len(tweet_ids)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def run_once(self, sleep: Callable[[float], None] = time.sleep) -> int:
+        """
+        대기열을 비울 때까지 처리합니다 (스크립트, 테스트용 동기 실행).
+        토큰이 없으면 sleep으로 기다립니다.
+
+        Returns:
+            int: 처리한 작업 수
+        """
+        total = 0
+        while True:
+            handled = self.process_batch()
+            if handled is None:
+                sleep(self.bucket.wait_time())
+                continue
+            if handled == 0:
+                return total
+            total += handled
+
+    async def run(self) -> None:
+        """API 서버의 이벤트 루프에서 실행되는 처리 루프 (stop()까지 계속)"""
+        logger.info(f"미리보기 수집 워커 시작 (provider={self.provider.name}, batch={self.batch_size})")
+        while True:
+            try:
+                handled = await asyncio.to_thread(self.process_batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"미리보기 수집 워커 오류: {e}")
+                handled = 0
+            if handled is None:
+                await asyncio.sleep(self.bucket.wait_time())
+            elif handled == 0:
+                await asyncio.sleep(self.poll_interval)
+
+    def start(self) -> asyncio.Task:
+        """실행 중인 이벤트 루프에 처리 루프를 띄웁니다"""
+        self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+def create_worker(settings, session_factory: Callable[[], Session],
+                  provider: Optional[PreviewProvider] = None) -> EnrichmentWorker:
+    """
+    설정값으로 워커를 만듭니다.
+
+    Args:
+        settings: config.settings
+        session_factory: 세션 생성 함수
+        provider: 제공자 (없으면 settings.enrichment_provider로 생성)
+
+    Returns:
+        EnrichmentWorker: 워커
+    """
+    from app.utils.preview_providers import create_provider
+
+    if provider is None:
+        provider = create_provider(settings.enrichment_provider, settings)
+    rate = settings.enrichment_requests_per_window / settings.enrichment_window_seconds
+    # 한도 창 전체를 한 번에 쓰지 않도록 연속 요청은 창의 1/30까지만 허용
+    capacity = max(1, settings.enrichment_requests_per_window // 30)
+    return EnrichmentWorker(
+        session_factory,
+        provider,
+        TokenBucket(rate, capacity),
+        batch_size=settings.enrichment_batch_size,
+        poll_interval=settings.enrichment_poll_interval,
+    )
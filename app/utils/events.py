@@ -0,0 +1,123 @@
+from sqlalchemy.orm import Session
+from app.models.models import Tweet, Tag
+from app.utils import counters
+from app.utils.serialization import serialize_tweet
+from threading import Lock
+from typing import Dict, List
+import asyncio
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 구독자별 대기 메시지 수 (넘으면 밀린 메시지를 버리고 resync 이벤트 전송)
+SUBSCRIBER_QUEUE_SIZE = 100
+
+def format_event(event: str, data: dict) -> str:
+    """SSE 메시지 형식 (event: ...\\ndata: ...\\n\\n)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+class BroadcastHub:
+    """
+    프로세스 내 SSE 브로드캐스트 허브
+
+    구독자마다 asyncio.Queue를 두고, publish()는 메시지를 한 번만 직렬화해
+    모든 구독자 큐에 넣습니다. 동기 엔드포인트(스레드풀)에서도 호출할 수 있도록
+    각 구독자의 이벤트 루프에 call_soon_threadsafe로 전달합니다.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[asyncio.Queue, asyncio.AbstractEventLoop] = {}
+        self._lock = Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """이벤트 루프 안에서 호출합니다."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers.pop(queue, None)
+
+    def publish(self, event: str, data: dict) -> None:
+        """모든 구독자에게 이벤트를 보냅니다 (구독자가 없으면 아무것도 하지 않음)."""
+        if not self._subscribers:
+            return
+        message = format_event(event, data)
+        with self._lock:
+            subscribers = list(self._subscribers.items())
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._offer, queue, message)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘
+                self.unsubscribe(queue)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, message: str) -> None:
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # 느린 구독자: 밀린 델타를 버리고 전체 다시 불러오기를 요청
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(format_event("resync", {}))
+
+hub = BroadcastHub()
+
+def _tag_counts(db: Session, tag_ids: List[int]) -> dict:
+    if not tag_ids:
+        return {}
+    return dict(db.query(Tag.name, Tag.tweet_count).filter(Tag.id.in_(tag_ids)).all())
+
+def publish_tweet_created(db: Session, tweet: Tweet) -> None:
+    """
+    트윗 생성 commit 후 호출합니다. 새 트윗, 갱신된 통계, 연결된 태그의 트윗 수를 보냅니다.
+    구독자가 없으면 추가 쿼리 없이 반환합니다.
+    """
+    if not hub.subscriber_count:
+        return
+    try:
+        hub.publish("tweet_created", {
+            "tweet": serialize_tweet(tweet),
+            "stats": counters.get_stats_snapshot(db),
+            "tags": _tag_counts(db, [tag.id for tag in tweet.tags]),
+        })
+    except Exception as e:
+        logger.warning(f"tweet_created 이벤트 전송 실패: {e}")
+
+def publish_tweet_deleted(db: Session, deleted: dict, tag_ids: List[int]) -> None:
+    """
+    트윗 삭제 commit 후 호출합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        deleted: 삭제된 트윗의 id, tweet_id (commit 전에 읽어 둔 값)
+        tag_ids: 삭제된 트윗에 연결되어 있던 태그 ID
+    """
+    if not hub.subscriber_count:
+        return
+    try:
+        hub.publish("tweet_deleted", {
+            **deleted,
+            "stats": counters.get_stats_snapshot(db),
+            "tags": _tag_counts(db, tag_ids),
+        })
+    except Exception as e:
+        logger.warning(f"tweet_deleted 이벤트 전송 실패: {e}")
+
+def publish_stats(db: Session) -> None:
+    """벌크 등록처럼 트윗 단위 델타를 보내지 않는 쓰기 후 통계만 보냅니다."""
+    if not hub.subscriber_count:
+        return
+    try:
+        hub.publish("stats", {"stats": counters.get_stats_snapshot(db)})
+    except Exception as e:
+        logger.warning(f"stats 이벤트 전송 실패: {e}")
@@ -0,0 +1,102 @@
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, Response
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterable, Tuple
+import hashlib
+import os
+
+class CachedPage:
+    """렌더링이 끝난 HTML (본문 바이트 + 내용 해시 기반 강한 ETag)"""
+
+    __slots__ = ("body", "etag", "mtimes")
+
+    def __init__(self, html: str, mtimes: Tuple[float, ...]):
+        self.body = html.encode("utf-8")
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:16] + '"'
+        self.mtimes = mtimes
+
+def _mtimes(sources: Tuple[str, ...]) -> Tuple[float, ...]:
+    mtimes = []
+    for path in sources:
+        try:
+            mtimes.append(os.path.getmtime(path))
+        except OSError:
+            mtimes.append(0.0)
+    return tuple(mtimes)
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match에 etag(또는 *)가 있는지 확인합니다 (약한 비교)"""
+    if_none_match = request.headers.get("if-none-match", "")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+class HTMLPageCache:
+    """
+    HTML 페이지 메모리 캐시
+
+    요청마다 템플릿을 렌더링하거나 파일을 읽는 대신 첫 요청에 렌더링한 결과를
+    보관합니다. auto_reload가 켜져 있으면 (개발 모드) 요청마다 sources 파일의
+    mtime을 확인해 바뀐 경우에만 다시 렌더링합니다.
+
+    Args:
+        auto_reload: sources 파일 변경 시 다시 렌더링할지 여부
+    """
+
+    def __init__(self, auto_reload: bool = False):
+        self.auto_reload = auto_reload
+        self._pages: Dict[Hashable, CachedPage] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable, render: Callable[[], str],
+            sources: Iterable[str] = ()) -> CachedPage:
+        """
+        캐시된 페이지를 반환하고, 없거나 sources가 바뀌었으면 render()로 다시 만듭니다.
+
+        Args:
+            key: 페이지 키
+            render: HTML 문자열을 반환하는 함수
+            sources: 페이지를 만드는 데 사용한 파일 (템플릿, 정적 파일 등)
+
+        Returns:
+            CachedPage: 캐시된 페이지
+        """
+        page = self._pages.get(key)
+        if page is not None and not self.auto_reload:
+            return page
+
+        sources = tuple(sources)
+        mtimes = _mtimes(sources)
+        if page is not None and page.mtimes == mtimes:
+            return page
+
+        page = CachedPage(render(), mtimes)
+        with self._lock:
+            self._pages[key] = page
+        return page
+
+    def response(self, request: Request, key: Hashable, render: Callable[[], str],
+                 sources: Iterable[str] = (), cache_control: str = "no-cache") -> Response:
+        """
+        캐시된 페이지로 응답합니다. If-None-Match가 ETag와 같으면 본문 없이 304.
+
+        Args:
+            request: 요청 (If-None-Match 확인용)
+            key, render, sources: get()과 같음
+            cache_control: Cache-Control 헤더 (기본: 캐시하되 매번 재검증)
+
+        Returns:
+            Response: HTMLResponse 또는 304 응답
+        """
+        page = self.get(key, render, sources)
+        headers = {"ETag": page.etag, "Cache-Control": cache_control}
+        if etag_matches(request, page.etag):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(page.body, headers=headers)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
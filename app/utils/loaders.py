@@ -0,0 +1,52 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Tweet
+from typing import List
+
+def load_tweet_page(db: Session, query, relations: bool = True) -> List[Tweet]:
+    """
+    필터/정렬/페이징이 적용된 트윗 쿼리를 id 페이지 -> 엔티티 순서로 로딩합니다.
+
+    1. 페이지의 트윗 id만 조회 ((created_at, id) 인덱스만으로 offset/limit 처리)
+    2. 해당 id의 트윗을 IN 쿼리로 로딩하고 user/tags는 selectinload로 일괄 로딩
+
+    joinedload + offset/limit처럼 서브쿼리로 감싸거나 태그 수만큼 행이 늘어나지 않으며,
+    쿼리 수는 페이지 크기와 무관하게 일정합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        query: eager loading 옵션이 없는 Tweet 쿼리 (정렬과 offset/limit 적용 후)
+        relations: True면 user와 tags도 로딩
+
+    Returns:
+        List[Tweet]: 쿼리 정렬 순서 그대로의 트윗 목록
+    """
+    ids = [tweet_id for (tweet_id,) in query.with_entities(Tweet.id).all()]
+    if not ids:
+        return []
+
+    entity_query = db.query(Tweet).filter(Tweet.id.in_(ids))
+    if relations:
+        entity_query = entity_query.options(selectinload(Tweet.user), selectinload(Tweet.tags))
+    by_id = {tweet.id: tweet for tweet in entity_query.all()}
+    return [by_id[tweet_id] for tweet_id in ids if tweet_id in by_id]
+
+async def load_tweet_page_async(db: AsyncSession, statement, relations: bool = True) -> List[Tweet]:
+    """
+    load_tweet_page()의 AsyncSession 버전
+
+    Args:
+        db: 비동기 세션
+        statement: select(Tweet)에 필터/정렬/offset/limit을 적용한 문장
+        relations: True면 user와 tags도 로딩
+    """
+    ids = (await db.execute(statement.with_only_columns(Tweet.id))).scalars().all()
+    if not ids:
+        return []
+
+    entity_statement = select(Tweet).where(Tweet.id.in_(ids))
+    if relations:
+        entity_statement = entity_statement.options(selectinload(Tweet.user), selectinload(Tweet.tags))
+    by_id = {tweet.id: tweet for tweet in (await db.execute(entity_statement)).scalars().all()}
+    return [by_id[tweet_id] for tweet_id in ids if tweet_id in by_id]
@@ -0,0 +1,80 @@
+from sqlalchemy import or_, and_
+from fastapi import HTTPException
+from app.models.models import Tweet
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+import base64
+import json
+
+def encode_cursor(tweet: Tweet) -> str:
+    """
+    트윗의 (created_at, id)를 불투명한 커서 문자열로 인코딩합니다.
+
+    Args:
+        tweet: 페이지의 마지막 트윗
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    payload = json.dumps([tweet.created_at.isoformat(), str(tweet.id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    커서 문자열을 (created_at, id) 튜플로 디코딩합니다.
+
+    Args:
+        cursor: encode_cursor로 만든 커서
+
+    Returns:
+        Tuple[datetime, UUID]: 마지막 트윗의 생성 시각과 ID
+
+    Raises:
+        HTTPException: 커서 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, tweet_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), UUID(tweet_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+
+def apply_cursor(query, cursor: Optional[str], oldest: bool = False):
+    """
+    (created_at, id) 기준 keyset 페이징 조건과 정렬을 쿼리에 적용합니다.
+
+    offset과 달리 앞 페이지의 행을 스캔하지 않고 마지막 위치 다음부터 읽습니다.
+
+    Args:
+        query: Tweet 쿼리
+        cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+        oldest: True면 오래된 순, False면 최신순
+
+    Returns:
+        Query: 커서 조건과 정렬이 적용된 쿼리
+    """
+    if cursor:
+        created_at, tweet_id = decode_cursor(cursor)
+        if oldest:
+            query = query.filter(or_(
+                Tweet.created_at > created_at,
+                and_(Tweet.created_at == created_at, Tweet.id > tweet_id)
+            ))
+        else:
+            query = query.filter(or_(
+                Tweet.created_at < created_at,
+                and_(Tweet.created_at == created_at, Tweet.id < tweet_id)
+            ))
+
+    if oldest:
+        return query.order_by(Tweet.created_at.asc(), Tweet.id.asc())
+    return query.order_by(Tweet.created_at.desc(), Tweet.id.desc())
+
+def next_cursor(tweets: list, limit: int) -> Optional[str]:
+    """
+    페이지가 가득 찼으면 다음 페이지 커서를, 아니면 None을 반환합니다.
+    """
+    if len(tweets) < limit:
+        return None
+    return encode_cursor(tweets[-1])
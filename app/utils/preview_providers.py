@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional
+import time
+
+# X API v2 GET /2/tweets가 한 번에 받는 최대 ID 수
+MAX_LOOKUP_IDS = 100
+
+# image_url 컬럼 길이 (String(500))
+MAX_IMAGE_URL_LENGTH = 500
+
+class TweetPreview:
+    """트윗 한 개의 미리보기 (content_preview, image_url 컬럼에 저장)"""
+
+    __slots__ = ("text", "image_url")
+
+    def __init__(self, text: str, image_url: str = ""):
+        self.text = text or ""
+        self.image_url = (image_url or "")[:MAX_IMAGE_URL_LENGTH]
+
+    def __repr__(self) -> str:
+        return f"TweetPreview(text={self.text[:30]!r}, image_url={self.image_url!r})"
+
+class RateLimited(Exception):
+    """제공자가 요청 한도를 초과했다고 응답한 경우 (retry_after초 뒤 재시도)"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"rate limited, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+class PreviewProvider(ABC):
+    """
+    트윗 미리보기 제공자 인터페이스
+
+    lookup()은 최대 max_batch_size개의 트윗 ID를 한 번의 조회로 가져옵니다.
+    결과에 없는 ID는 삭제/비공개 등으로 가져올 수 없는 트윗으로 처리됩니다.
+    한도 초과는 RateLimited, 그 밖의 실패는 일반 예외로 알립니다 (배치 전체 재시도).
+    """
+
+    name = "base"
+    max_batch_size = MAX_LOOKUP_IDS
+
+    @abstractmethod
+    def lookup(self, tweet_ids: List[str]) -> Dict[str, TweetPreview]:
+        """트윗 ID 목록 -> 가져온 미리보기 (tweet_id -> TweetPreview)"""
+
+class TwitterPreviewProvider(PreviewProvider):
+    """
+    X(Twitter) API v2 기반 제공자 (tweepy)
+
+    bearer_token이 있으면 앱 인증, 없으면 API 키/액세스 토큰으로 사용자 인증을 사용합니다.
+    """
+
+    name = "twitter"
+
+    def __init__(self, bearer_token: str = "", consumer_key: str = "", consumer_secret: str = "",
+                 access_token: str = "", access_token_secret: str = ""):
+        try:
+            import tweepy
+        except ImportError:
+            raise RuntimeError("twitter 미리보기 제공자를 사용하려면 tweepy를 설치해야 합니다.")
+        self._tweepy = tweepy
+        self._user_auth = not bearer_token
+        self.client = tweepy.Client(
+            bearer_token=bearer_token or None,
+            consumer_key=consumer_key or None,
+            consumer_secret=consumer_secret or None,
+            access_token=access_token or None,
+            access_token_secret=access_token_secret or None,
+        )
+
+    def lookup(self, tweet_ids: List[str]) -> Dict[str, TweetPreview]:
+        try:
+            response = self.client.get_tweets(
+                ids=tweet_ids[:self.max_batch_size],
+                tweet_fields=["text", "attachments"],
+                expansions=["attachments.media_keys"],
+                media_fields=["url", "preview_image_url"],
+                user_auth=self._user_auth,
+            )
+        except self._tweepy.TooManyRequests as e:
+            reset = e.response.headers.get("x-rate-limit-reset") if e.response is not None else None
+            retry_after = float(reset) - time.time() if reset else 60.0
+            raise RateLimited(max(retry_after, 1.0))
+
+        media = {}
+        for item in (response.includes or {}).get("media", []):
+            media[item.media_key] = item.url or item.preview_image_url or ""
+
+        previews = {}
+        for tweet in response.data or []:
+            media_keys = (tweet.attachments or {}).get("media_keys", [])
+            image_url = next((media[key] for key in media_keys if media.get(key)), "")
+            previews[str(tweet.id)] = TweetPreview(tweet.text, image_url)
+        return previews
+
+class FakePreviewProvider(PreviewProvider):
+    """
+    네트워크 없이 결정적인 미리보기를 돌려주는 로컬 제공자 (테스트, 개발용)
+
+    Args:
+        missing: 찾을 수 없는 트윗으로 처리할 ID
+        fail_times: 처음 몇 번의 조회를 예외로 실패시킬지
+        rate_limit_after: 이 횟수만큼 조회한 뒤 RateLimited를 발생 (None이면 사용 안 함)
+    """
+
+    name = "fake"
+
+    def __init__(self, missing: Iterable[str] = (), fail_times: int = 0,
+                 rate_limit_after: Optional[int] = None, retry_after: float = 60.0):
+        self.missing = set(missing)
+        self.fail_times = fail_times
+        self.rate_limit_after = rate_limit_after
+        self.retry_after = retry_after
+        self.calls: List[List[str]] = []
+
+    def lookup(self, tweet_ids: List[str]) -> Dict[str, TweetPreview]:
+        if self.rate_limit_after is not None and len(self.calls) >= self.rate_limit_after:
+            raise RateLimited(self.retry_after)
+        self.calls.append(list(tweet_ids))
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("fake provider failure")
+        return {
+            tweet_id: TweetPreview(f"미리보기 {tweet_id}", f"https://pbs.twimg.com/media/{tweet_id}.jpg")
+            for tweet_id in tweet_ids if tweet_id not in self.missing
+        }
+
+# 제공자 이름 -> 생성 함수 (settings를 받아 제공자를 만듦)
+_PROVIDERS: Dict[str, Callable[..., PreviewProvider]] = {}
+
+def register_provider(name: str, factory: Callable[..., PreviewProvider]) -> None:
+    """ENRICHMENT_PROVIDER로 선택할 수 있는 제공자를 등록합니다"""
+    _PROVIDERS[name] = factory
+
+def create_provider(name: str, settings) -> PreviewProvider:
+    """
+    이름으로 제공자를 만듭니다.
+
+    Args:
+        name: 등록된 제공자 이름 (twitter, fake 등)
+        settings: config.settings (API 키 등)
+
+    Returns:
+        PreviewProvider: 제공자
+
+    Raises:
+        ValueError: 등록되지 않은 이름인 경우
+    """
+    factory = _PROVIDERS.get(name)
+    if factory is None:
+        raise ValueError(f"알 수 없는 미리보기 제공자입니다: {name} (사용 가능: {', '.join(sorted(_PROVIDERS))})")
+    return factory(settings)
+
+register_provider("twitter", lambda settings: TwitterPreviewProvider(
+    bearer_token=settings.twitter_bearer_token,
+    consumer_key=settings.twitter_api_key,
+    consumer_secret=settings.twitter_api_secret,
+    access_token=settings.twitter_access_token,
+    access_token_secret=settings.twitter_access_token_secret,
+))
+register_provider("fake", lambda settings: FakePreviewProvider())
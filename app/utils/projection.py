@@ -0,0 +1,116 @@
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.models import Tweet, User, Tag, tweet_tags
+from app.utils.serialization import serialize_user, serialize_tag, serialize_tweet_row
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# fields= 로 선택할 수 있는 트윗 컬럼 (응답 필드 순서와 같음)
+TWEET_COLUMN_FIELDS = (
+    "tweet_url", "comment", "id", "user_id", "tweet_id",
+    "content_preview", "image_url", "created_at", "updated_at",
+)
+# 별도 쿼리로 일괄 로딩하는 관계 필드
+TWEET_RELATION_FIELDS = ("user", "tags")
+
+# 커서 생성(created_at, id)과 관계 로딩(id, user_id)에 항상 필요한 컬럼
+_REQUIRED_COLUMNS = ("id", "user_id", "created_at")
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    콤마로 구분된 fields 파라미터를 검증해 필드 목록으로 변환합니다.
+
+    Args:
+        fields: 예) "tweet_url,comment,created_at,tags"
+
+    Returns:
+        Optional[List[str]]: 응답 필드 순서로 정렬된 필드 목록 (지정하지 않으면 None)
+
+    Raises:
+        HTTPException: 지원하지 않는 필드가 포함된 경우
+    """
+    if not fields:
+        return None
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    if not names:
+        return None
+    allowed = TWEET_COLUMN_FIELDS + TWEET_RELATION_FIELDS
+    unknown = sorted(names - set(allowed))
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(allowed)})"
+        )
+    return [name for name in allowed if name in names]
+
+def _users_statement(user_ids: set):
+    return select(User).where(User.telegram_id.in_(user_ids))
+
+def _tags_statement(tweet_ids: list):
+    return select(tweet_tags.c.tweet_id, Tag)\
+        .join(Tag, Tag.id == tweet_tags.c.tag_id)\
+        .where(tweet_tags.c.tweet_id.in_(tweet_ids))
+
+def _column_names(fields: List[str]) -> List[str]:
+    return [name for name in TWEET_COLUMN_FIELDS if name in fields or name in _REQUIRED_COLUMNS]
+
+def _columns(fields: List[str]) -> list:
+    return [getattr(Tweet, name).label(name) for name in _column_names(fields)]
+
+def _group_tags(rows) -> Dict[object, List[Tag]]:
+    tags_by_tweet = defaultdict(list)
+    for tweet_id, tag in rows:
+        tags_by_tweet[tweet_id].append(tag)
+    return tags_by_tweet
+
+def _serialize_rows(rows, fields: List[str], users: Optional[Dict[int, User]], tags) -> List[dict]:
+    tweets = []
+    for row in rows:
+        data = serialize_tweet_row(row._mapping, fields)
+        if users is not None:
+            data["user"] = serialize_user(users.get(row.user_id))
+        if tags is not None:
+            data["tags"] = [serialize_tag(tag) for tag in tags.get(row.id, [])]
+        tweets.append(data)
+    return tweets
+
+def fetch_tweet_fields(db: Session, query, fields: List[str]):
+    """
+    필터/정렬/페이징이 적용된 트윗 쿼리를 선택한 컬럼만 읽는 Core select()로 실행합니다.
+
+    ORM 엔티티를 만들지 않고, user/tags는 요청된 경우에만 페이지 단위
+    IN 쿼리 한 번씩으로 로딩합니다 (joinedload 없음).
+
+    Args:
+        db: 데이터베이스 세션
+        query: eager loading 옵션이 없는 Tweet 쿼리
+        fields: parse_fields()로 검증된 필드 목록
+
+    Returns:
+        Tuple[List[dict], list]: 직렬화된 트윗 목록, 커서 생성용 Row 목록
+    """
+    rows = db.execute(query.with_entities(*_columns(fields)).statement).all()
+
+    users = tags = None
+    if "user" in fields:
+        user_ids = {row.user_id for row in rows}
+        users = {user.telegram_id: user for user in db.execute(_users_statement(user_ids)).scalars()} if user_ids else {}
+    if "tags" in fields:
+        tweet_ids = [row.id for row in rows]
+        tags = _group_tags(db.execute(_tags_statement(tweet_ids)).all() if tweet_ids else [])
+    return _serialize_rows(rows, fields, users, tags), rows
+
+async def fetch_tweet_fields_async(db: AsyncSession, statement, fields: List[str]):
+    """fetch_tweet_fields()의 AsyncSession 버전 (statement는 select(Tweet) 기반 문장)"""
+    rows = (await db.execute(statement.with_only_columns(*_columns(fields)))).all()
+
+    users = tags = None
+    if "user" in fields:
+        user_ids = {row.user_id for row in rows}
+        users = {user.telegram_id: user for user in (await db.execute(_users_statement(user_ids))).scalars()} if user_ids else {}
+    if "tags" in fields:
+        tweet_ids = [row.id for row in rows]
+        tags = _group_tags((await db.execute(_tags_statement(tweet_ids))).all() if tweet_ids else [])
+    return _serialize_rows(rows, fields, users, tags), rows
@@ -0,0 +1,144 @@
+from sqlalchemy import text, select, func, or_, literal_column
+from sqlalchemy.engine import Engine
+from app.models.models import Tweet
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 검색 대상 컬럼 (substring 모드와 전문 검색 인덱스가 같은 컬럼을 사용)
+SEARCH_COLUMNS = ("comment", "content_preview", "tweet_url")
+
+# trigram 토크나이저는 3글자 미만의 검색어를 매칭할 수 없음
+MIN_FULLTEXT_LENGTH = 3
+
+# 엔진별 전문 검색 인덱스 사용 가능 여부 ("sqlite", "postgresql" 또는 None)
+_fulltext_dialect = None
+
+_SQLITE_FTS_DDL = [
+    # tweets 테이블을 원본으로 하는 external content FTS5 테이블
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS tweets_fts USING fts5(
+        {", ".join(SEARCH_COLUMNS)},
+        content='tweets', content_rowid='rowid', tokenize='trigram'
+    )
+    """,
+    # insert/delete/update 훅으로 인덱스 동기화
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tweets_fts_ai AFTER INSERT ON tweets BEGIN
+        INSERT INTO tweets_fts(rowid, {", ".join(SEARCH_COLUMNS)})
+        VALUES (new.rowid, {", ".join("new." + c for c in SEARCH_COLUMNS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tweets_fts_ad AFTER DELETE ON tweets BEGIN
+        INSERT INTO tweets_fts(tweets_fts, rowid, {", ".join(SEARCH_COLUMNS)})
+        VALUES ('delete', old.rowid, {", ".join("old." + c for c in SEARCH_COLUMNS)});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS tweets_fts_au AFTER UPDATE ON tweets BEGIN
+        INSERT INTO tweets_fts(tweets_fts, rowid, {", ".join(SEARCH_COLUMNS)})
+        VALUES ('delete', old.rowid, {", ".join("old." + c for c in SEARCH_COLUMNS)});
+        INSERT INTO tweets_fts(rowid, {", ".join(SEARCH_COLUMNS)})
+        VALUES (new.rowid, {", ".join("new." + c for c in SEARCH_COLUMNS)});
+    END
+    """,
+]
+
+def _pg_document():
+    """PostgreSQL tsvector 식 (GIN 인덱스와 쿼리가 같은 식을 사용해야 인덱스를 탐)"""
+    return " || ' ' || ".join(f"coalesce({c}, '')" for c in SEARCH_COLUMNS)
+
+def setup_search_index(engine: Engine) -> None:
+    """
+    DB 종류에 맞는 전문 검색 인덱스를 생성합니다.
+
+    - SQLite: FTS5(trigram) 가상 테이블 + 동기화 트리거
+    - PostgreSQL: to_tsvector 식 기반 GIN 인덱스
+
+    인덱스를 만들 수 없으면 substring 검색으로 동작합니다.
+
+    Args:
+        engine: SQLAlchemy 엔진
+    """
+    global _fulltext_dialect
+    dialect = engine.dialect.name
+
+    try:
+        with engine.begin() as conn:
+            if dialect == "sqlite":
+                exists = conn.execute(text(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='tweets_fts'"
+                )).first()
+                for ddl in _SQLITE_FTS_DDL:
+                    conn.execute(text(ddl))
+                if not exists:
+                    # 기존 트윗으로 인덱스 채우기
+                    conn.execute(text("INSERT INTO tweets_fts(tweets_fts) VALUES ('rebuild')"))
+            elif dialect == "postgresql":
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_tweets_search ON tweets "
+                    f"USING GIN (to_tsvector('simple', {_pg_document()}))"
+                ))
+            else:
+                return
+        _fulltext_dialect = dialect
+    except Exception as e:
+        logger.warning(f"전문 검색 인덱스를 생성할 수 없어 substring 검색을 사용합니다: {e}")
+        _fulltext_dialect = None
+
+def fulltext_available() -> bool:
+    return _fulltext_dialect is not None
+
+def apply_substring_search(query, search: str):
+    """기존 ilike('%term%') 방식의 검색 (전체 테이블 스캔)"""
+    search_term = f"%{search}%"
+    return query.filter(
+        or_(
+            Tweet.comment.ilike(search_term),
+            Tweet.content_preview.ilike(search_term),
+            Tweet.tweet_url.ilike(search_term)
+        )
+    )
+
+def apply_search(query, search: str, mode: str = "fulltext", rank: bool = False):
+    """
+    트윗 쿼리에 검색 조건을 적용합니다.
+
+    전문 검색 인덱스가 없거나, mode가 substring이거나, 검색어가 너무 짧으면
+    substring 검색으로 대체합니다.
+
+    Args:
+        query: Tweet 쿼리
+        search: 검색어
+        mode: fulltext 또는 substring
+        rank: True면 관련도순으로 정렬
+
+    Returns:
+        Query: 검색 조건이 적용된 쿼리
+    """
+    if mode != "fulltext" or not fulltext_available() or len(search) < MIN_FULLTEXT_LENGTH:
+        return apply_substring_search(query, search)
+
+    if _fulltext_dialect == "sqlite":
+        # 검색어 전체를 하나의 phrase로 매칭 (trigram이므로 substring과 같은 의미)
+        phrase = '"' + search.replace('"', '""') + '"'
+        matches = select(
+            literal_column("rowid").label("rowid"),
+            literal_column("bm25(tweets_fts)").label("rank")
+        ).select_from(text("tweets_fts"))\
+            .where(text("tweets_fts MATCH :fts_query").bindparams(fts_query=phrase))\
+            .subquery()
+        query = query.join(matches, literal_column("tweets.rowid") == matches.c.rowid)
+        if rank:
+            # bm25는 값이 작을수록 관련도가 높음
+            query = query.order_by(matches.c.rank.asc())
+        return query
+
+    # PostgreSQL
+    document = func.to_tsvector(literal_column("'simple'"), literal_column(_pg_document()))
+    ts_query = func.plainto_tsquery(literal_column("'simple'"), search)
+    query = query.filter(document.op("@@")(ts_query))
+    if rank:
+        query = query.order_by(func.ts_rank(document, ts_query).desc())
+    return query
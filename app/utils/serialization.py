@@ -0,0 +1,105 @@
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
+from app.models.models import Tweet, User, Tag
+from typing import Any, List, Mapping, Optional
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Pydantic from_attributes 검증 없이 ORM 객체를 바로 dict로 변환하는 직렬화 함수들
+# 출력 필드와 순서는 app.schemas.schemas의 User / Tag / Tweet 스키마와 같습니다.
+
+def _iso(value) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+def serialize_user(user: Optional[User]) -> Optional[dict]:
+    if user is None:
+        return None
+    return {
+        "telegram_username": user.telegram_username,
+        "display_name": user.display_name,
+        "telegram_id": user.telegram_id,
+        "created_at": _iso(user.created_at),
+        "is_active": user.is_active,
+    }
+
+def serialize_tag(tag: Tag) -> dict:
+    return {
+        "name": tag.name,
+        "id": tag.id,
+        "created_at": _iso(tag.created_at),
+        "tweet_count": tag.tweet_count,
+        "is_active": tag.is_active,
+        "is_core": tag.is_core,
+    }
+
+def serialize_tweet(tweet: Tweet, relations: bool = True) -> dict:
+    """
+    트윗을 dict로 변환합니다.
+
+    Args:
+        tweet: Tweet ORM 객체
+        relations: True면 user와 tags 포함 (False면 컬럼만, 지연 로딩 없음)
+    """
+    data = {
+        "tweet_url": tweet.tweet_url,
+        "comment": tweet.comment,
+        "id": str(tweet.id),
+        "user_id": tweet.user_id,
+        "tweet_id": tweet.tweet_id,
+        "content_preview": tweet.content_preview,
+        "image_url": tweet.image_url,
+        "created_at": _iso(tweet.created_at),
+        "updated_at": _iso(tweet.updated_at),
+    }
+    if relations:
+        data["user"] = serialize_user(tweet.user)
+        data["tags"] = [serialize_tag(tag) for tag in tweet.tags]
+    return data
+
+def serialize_tweets(tweets: List[Tweet], relations: bool = True) -> List[dict]:
+    return [serialize_tweet(tweet, relations) for tweet in tweets]
+
+def serialize_tweet_row(row: Mapping[str, Any], fields: List[str]) -> dict:
+    """
+    컬럼만 선택한 트윗 Row를 dict로 변환합니다 (fields에 있는 컬럼만 포함).
+
+    Args:
+        row: 컬럼명 -> 값 매핑 (Row._mapping)
+        fields: 응답에 포함할 필드 목록
+    """
+    data = {}
+    for name in fields:
+        if name not in row:
+            continue
+        value = row[name]
+        if name == "id":
+            value = str(value)
+        elif name in ("created_at", "updated_at"):
+            value = _iso(value)
+        data[name] = value
+    return data
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
+
+def wants_msgpack(request: Optional[Request]) -> bool:
+    if request is None or msgpack is None:
+        return False
+    return MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+
+def fast_response(request: Optional[Request], content: Any) -> Response:
+    """
+    이미 직렬화된 dict/list를 Accept 헤더에 따라 msgpack 또는 orjson으로 응답합니다.
+    (response_model 검증과 기본 JSON 인코더를 거치지 않음)
+    """
+    if wants_msgpack(request):
+        return MsgPackResponse(content)
+    return ORJSONResponse(content)
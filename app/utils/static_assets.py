@@ -0,0 +1,163 @@
+from starlette.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import os
+import re
+
+# 해시가 들어간 파일명 (내용이 바뀌면 URL도 바뀌므로 영구 캐시 가능)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 해시 없는 원래 파일명 (이전 URL 호환용, 매번 ETag로 재검증)
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+HASH_LENGTH = 10
+
+def fingerprint(path: str) -> str:
+    """파일 내용의 sha256 앞부분 (HASH_LENGTH자리)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+def hashed_name(path: str, file_hash: str) -> str:
+    """css/style.css -> css/style.<hash>.css"""
+    root, ext = os.path.splitext(path)
+    return f"{root}.{file_hash}{ext}"
+
+class StaticAssets:
+    """
+    정적 파일 fingerprint 매니페스트
+
+    시작 시 디렉터리의 모든 파일을 해시해 "원래 경로 -> 해시 경로" 매핑을 만들고,
+    템플릿과 HTML의 참조를 해시 경로로 바꾸는 데 사용합니다.
+    auto_reload가 켜져 있으면 (개발 모드) 조회할 때 파일 mtime을 확인해 바뀐 파일만
+    다시 해시합니다.
+
+    Args:
+        directory: 정적 파일 디렉터리
+        url_prefix: 디렉터리가 마운트된 URL (예: /static)
+        auto_reload: 파일 변경 시 매니페스트 갱신 여부
+    """
+
+    def __init__(self, directory: str, url_prefix: str, auto_reload: bool = False):
+        self.directory = os.path.abspath(directory)
+        self.url_prefix = url_prefix.rstrip("/")
+        self.auto_reload = auto_reload
+        # 원래 경로 -> (mtime, 해시 경로)
+        self._entries: Dict[str, Tuple[float, str]] = {}
+        # 해시 경로 -> 원래 경로
+        self._reverse: Dict[str, str] = {}
+        self._lock = Lock()
+        self._html_pattern: Optional[re.Pattern] = None
+        self.build()
+
+    def build(self) -> Dict[str, str]:
+        """디렉터리 전체를 해시해 매니페스트를 (다시) 만듭니다"""
+        entries = {}
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                full_path = os.path.join(root, name)
+                path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                entries[path] = (os.path.getmtime(full_path), hashed_name(path, fingerprint(full_path)))
+        with self._lock:
+            self._entries = entries
+            self._reverse = {hashed: path for path, (_, hashed) in entries.items()}
+            self._html_pattern = None
+        return self.manifest()
+
+    def manifest(self) -> Dict[str, str]:
+        return {path: hashed for path, (_, hashed) in self._entries.items()}
+
+    def paths(self) -> List[str]:
+        """매니페스트에 있는 파일의 전체 경로 (HTML 캐시의 변경 감지용)"""
+        return [os.path.join(self.directory, path) for path in self._entries]
+
+    def _refresh(self, path: str) -> None:
+        full_path = os.path.join(self.directory, path)
+        try:
+            mtime = os.path.getmtime(full_path)
+        except OSError:
+            return
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return
+        hashed = hashed_name(path, fingerprint(full_path))
+        with self._lock:
+            if entry is not None:
+                self._reverse.pop(entry[1], None)
+            self._entries[path] = (mtime, hashed)
+            self._reverse[hashed] = path
+            self._html_pattern = None
+
+    def url(self, path: str) -> str:
+        """
+        정적 파일의 해시 URL을 반환합니다 (Jinja 템플릿의 static_url)
+
+        Args:
+            path: 디렉터리 기준 경로 (예: js/main.js)
+
+        Returns:
+            str: 해시 URL, 매니페스트에 없는 파일이면 원래 URL
+        """
+        path = path.lstrip("/")
+        if self.auto_reload:
+            self._refresh(path)
+        entry = self._entries.get(path)
+        return f"{self.url_prefix}/{entry[1] if entry else path}"
+
+    def resolve(self, hashed_path: str) -> Optional[str]:
+        """해시 경로를 원래 경로로 바꿉니다 (해시 경로가 아니면 None)"""
+        path = self._reverse.get(hashed_path.replace(os.sep, "/"))
+        if path is not None and self.auto_reload:
+            self._refresh(path)
+            # 파일이 바뀌어 해시가 달라졌으면 이전 해시 URL은 더 이상 유효하지 않음
+            if self._entries[path][1] != hashed_path.replace(os.sep, "/"):
+                return None
+        return path
+
+    def rewrite_html(self, html: str) -> str:
+        """
+        HTML 안의 "<url_prefix>/<파일>" 참조를 해시 URL로 바꿉니다.
+        Jinja 템플릿이 아닌 정적 HTML (예: lighter/static/index.html)에 사용합니다.
+        """
+        if self.auto_reload:
+            for path in list(self._entries):
+                self._refresh(path)
+        pattern = self._html_pattern
+        if pattern is None:
+            paths = sorted(self._entries, key=len, reverse=True)
+            if not paths:
+                return html
+            pattern = re.compile(
+                re.escape(self.url_prefix + "/") + "(" + "|".join(re.escape(p) for p in paths) + r")(?=[\"'?#])"
+            )
+            self._html_pattern = pattern
+        return pattern.sub(lambda m: self.url(m.group(1)), html)
+
+class HashedStaticFiles(StaticFiles):
+    """
+    StaticAssets 매니페스트의 해시 파일명을 서빙하는 StaticFiles
+
+    - style.<hash>.css 요청: 원래 파일을 immutable 캐시 헤더로 응답
+    - style.css 요청: 기존처럼 응답하되 매번 재검증 (no-cache + ETag)
+    """
+
+    def __init__(self, *, assets: StaticAssets, **kwargs):
+        super().__init__(directory=assets.directory, **kwargs)
+        self.assets = assets
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        original = self.assets.resolve(path)
+        if original is not None:
+            response = await super().get_response(os.path.normpath(original), scope)
+            if response.status_code in (200, 304):
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            return response
+
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault("Cache-Control", REVALIDATE_CACHE_CONTROL)
+        return response
@@ -0,0 +1,137 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, exists, and_, or_, false
+from app.models.models import Tweet, Tag, tweet_tags
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional
+
+# 태그명 -> 태그 ID 캐시
+# 태그는 삭제되지 않고 비활성화만 되므로 이름과 ID의 매핑은 바뀌지 않음
+TAG_ID_CACHE_SIZE = 1024
+_tag_id_cache: "OrderedDict[str, int]" = OrderedDict()
+_tag_id_cache_lock = Lock()
+
+def normalize_tag_name(name: str) -> str:
+    """
+    태그명 정규화 (소문자, 앞뒤 공백과 앞의 # 제거)
+    태그를 저장할 때와 조회/필터링할 때 모두 이 함수를 사용해야 같은 이름으로 찾을 수 있습니다.
+    """
+    return name.lower().strip().lstrip("#").strip()
+
+def normalize_tag_names(names: List[str]) -> List[str]:
+    """태그명 목록을 정규화하고 중복을 제거합니다 (순서 유지, 빈 이름 제외)"""
+    normalized = []
+    for name in names:
+        name = normalize_tag_name(name)
+        if name and name not in normalized:
+            normalized.append(name)
+    return normalized
+
+def resolve_tag_ids(db: Session, names: List[str]) -> Dict[str, int]:
+    """
+    태그명을 태그 ID로 변환합니다. 캐시에 없는 태그만 한 번의 IN 쿼리로 조회합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        names: 정규화된 태그명 목록
+
+    Returns:
+        Dict[str, int]: 존재하는 태그의 이름 -> ID (없는 태그는 제외)
+    """
+    resolved, missing = _cached_tag_ids(names)
+    if missing:
+        rows = db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(missing))).all()
+        _store_tag_ids(resolved, rows)
+    return resolved
+
+async def resolve_tag_ids_async(db: AsyncSession, names: List[str]) -> Dict[str, int]:
+    """resolve_tag_ids()의 AsyncSession 버전 (같은 캐시 사용)"""
+    resolved, missing = _cached_tag_ids(names)
+    if missing:
+        rows = (await db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(missing)))).all()
+        _store_tag_ids(resolved, rows)
+    return resolved
+
+def _cached_tag_ids(names: List[str]):
+    """캐시에 있는 태그 ID와 캐시에 없는 태그명 목록"""
+    resolved = {}
+    missing = []
+    with _tag_id_cache_lock:
+        for name in names:
+            if name in _tag_id_cache:
+                _tag_id_cache.move_to_end(name)
+                resolved[name] = _tag_id_cache[name]
+            else:
+                missing.append(name)
+    return resolved, missing
+
+def _store_tag_ids(resolved: Dict[str, int], rows) -> None:
+    """조회한 (이름, ID)를 결과와 캐시에 추가"""
+    with _tag_id_cache_lock:
+        for name, tag_id in rows:
+            resolved[name] = tag_id
+            _tag_id_cache[name] = tag_id
+        while len(_tag_id_cache) > TAG_ID_CACHE_SIZE:
+            _tag_id_cache.popitem(last=False)
+
+def clear_tag_id_cache() -> None:
+    with _tag_id_cache_lock:
+        _tag_id_cache.clear()
+
+def _has_tag_id(tag_id: int):
+    """트윗이 특정 태그를 가졌는지 확인하는 EXISTS 조건 (tweet_tags만 사용)"""
+    return exists().where(and_(
+        tweet_tags.c.tweet_id == Tweet.id,
+        tweet_tags.c.tag_id == tag_id
+    ))
+
+def _has_tag_like(name: str):
+    """트윗이 이름에 name을 포함하는 태그를 가졌는지 확인하는 EXISTS 조건"""
+    return exists().where(and_(
+        tweet_tags.c.tweet_id == Tweet.id,
+        tweet_tags.c.tag_id == Tag.id,
+        Tag.name.ilike(f"%{name}%")
+    ))
+
+def apply_tag_filter(query, db: Optional[Session], names: List[str], mode: str = "any", match: str = "partial",
+                     tag_ids: Optional[Dict[str, int]] = None):
+    """
+    트윗 쿼리에 태그 필터를 적용합니다.
+
+    JOIN 대신 EXISTS/IN 세미조인을 사용하므로 행이 태그 수만큼 늘어나지 않고
+    distinct()가 필요 없습니다.
+
+    Args:
+        query: Tweet 쿼리 (Query 또는 select(Tweet))
+        db: 데이터베이스 세션 (tag_ids를 넘기면 사용하지 않음)
+        names: 태그명 목록
+        mode: any(하나라도 포함, OR) 또는 all(모두 포함, AND)
+        match: exact(태그명 일치, 인덱스 사용) 또는 partial(태그명 부분 일치)
+        tag_ids: exact일 때 미리 조회한 태그명 -> ID (resolve_tag_ids_async 등)
+
+    Returns:
+        Query: 태그 조건이 적용된 쿼리
+    """
+    names = normalize_tag_names(names)
+    if not names:
+        return query
+
+    if match != "exact":
+        conditions = [_has_tag_like(name) for name in names]
+        return query.filter(and_(*conditions) if mode == "all" else or_(*conditions))
+
+    if tag_ids is None:
+        tag_ids = resolve_tag_ids(db, names)
+
+    if mode == "all":
+        # 존재하지 않는 태그가 하나라도 있으면 결과 없음
+        if len(tag_ids) < len(names):
+            return query.filter(false())
+        return query.filter(and_(*[_has_tag_id(tag_id) for tag_id in tag_ids.values()]))
+
+    if not tag_ids:
+        return query.filter(false())
+    return query.filter(Tweet.id.in_(
+        select(tweet_tags.c.tweet_id).where(tweet_tags.c.tag_id.in_(list(tag_ids.values())))
+    ))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+HTML 페이지 응답 벤치마크 (초당 요청 수)
+
+main.app의 실제 라우트를 TestClient로 호출해 HTMLPageCache를 끈 경우와 켠 경우를 비교합니다.
+DB는 사용하지 않습니다.
+
+- cache off: 같은 라우트에서 페이지 캐시만 매 요청 다시 렌더링하도록 교체 (기존 방식)
+- cache on: HTMLPageCache에 캐시된 페이지
+- cache on 304: 같은 라우트에 If-None-Match로 재검증 (본문 없이 304)
+
+미들웨어, 라우팅, 응답 생성까지 포함한 ASGI 앱 전체의 처리량입니다.
+압축 비용을 빼기 위해 Accept-Encoding: identity로 요청합니다.
+
+사용법:
+    python benchmark_html_pages.py --repeat 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main
+import lighter.main as lighter_main
+from app.utils.html_cache import CachedPage, HTMLPageCache
+
+URLS = ["/", "/yapper", f"/lighter/?code={lighter_main.ACCESS_CODE}", "/lighter/"]
+
+class UncachedPages(HTMLPageCache):
+    """캐시하지 않고 요청마다 render()를 호출하는 페이지 캐시 (cache off 측정용)"""
+
+    def get(self, key, render, sources=()) -> CachedPage:
+        return CachedPage(render(), ())
+
+def measure(client: TestClient, url: str, repeat: int, headers: dict) -> float:
+    """초당 요청 수"""
+    response = client.get(url, headers=headers)
+    assert response.status_code in (200, 304), response.status_code
+    started = time.perf_counter()
+    for _ in range(repeat):
+        client.get(url, headers=headers)
+    return repeat / (time.perf_counter() - started)
+
+def measure_uncached(client: TestClient, url: str, repeat: int, headers: dict) -> float:
+    """페이지 캐시를 끈 상태의 초당 요청 수"""
+    cached = (main.page_cache, lighter_main.page_cache)
+    main.page_cache = lighter_main.page_cache = UncachedPages()
+    try:
+        return measure(client, url, repeat, headers)
+    finally:
+        main.page_cache, lighter_main.page_cache = cached
+
+def main_():
+    parser = argparse.ArgumentParser(description="HTML 페이지 캐시 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000, help="URL별 요청 수")
+    args = parser.parse_args()
+
+    # lifespan(DB 초기화)은 필요 없으므로 컨텍스트 매니저 없이 사용
+    client = TestClient(main.app)
+    identity = {"Accept-Encoding": "identity"}
+
+    print(f"URL별 {args.repeat}회 요청 (req/s)")
+    print(f"  {'url':20s} {'cache off':>10s} {'cache on':>10s} {'cache on 304':>13s}")
+    for url in URLS:
+        off_rps = measure_uncached(client, url, args.repeat, identity)
+        on_rps = measure(client, url, args.repeat, identity)
+        etag = client.get(url, headers=identity).headers["etag"]
+        revalidate_rps = measure(client, url, args.repeat, {**identity, "If-None-Match": etag})
+        label = url.split("?")[0] + (" (code)" if "code=" in url else "")
+        print(f"  {label:20s} {off_rps:10.0f} {on_rps:10.0f} {revalidate_rps:13.0f}"
+              f"  x{on_rps / off_rps:.2f}")
+
+if __name__ == "__main__":
+    main_()
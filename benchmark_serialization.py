@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+목록 응답 직렬화 경로 마이크로 벤치마크
+
+트윗 한 페이지(user, tags 포함)를 다음 경로로 직렬화하는 시간을 비교합니다. DB는 사용하지 않습니다.
+
+- pydantic: TweetResponse 검증(from_attributes) + jsonable_encoder + json.dumps (기존 response_model 경로)
+- pydantic-json: TweetResponse 검증 + model_dump_json
+- orjson: app.utils.serialization 직렬화 함수 + orjson.dumps
+- msgpack: app.utils.serialization 직렬화 함수 + msgpack.packb
+
+사용법:
+    python benchmark_serialization.py --size 100 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.encoders import jsonable_encoder
+from app.models.models import Tweet, User, Tag
+from app.schemas.schemas import TweetResponse
+from app.utils.serialization import serialize_tweets
+
+def build_page(size: int) -> list:
+    """DB 없이 user와 tags가 채워진 트윗 ORM 객체 목록을 만듭니다"""
+    now = datetime.utcnow()
+    users = [
+        User(telegram_id=i, telegram_username=f"user{i}", display_name=f"User {i}", created_at=now, is_active=True)
+        for i in range(5)
+    ]
+    tags = [
+        Tag(id=i, name=f"tag{i}", created_at=now, tweet_count=i * 10, is_active=True, is_core=i < 3)
+        for i in range(10)
+    ]
+    tweets = []
+    for i in range(size):
+        tweets.append(Tweet(
+            id=uuid.uuid4(),
+            user_id=i % 5,
+            user=users[i % 5],
+            tweet_url=f"https://x.com/user/status/{1000 + i}",
+            tweet_id=str(1000 + i),
+            content_preview="미리보기 " * 10,
+            comment=f"좋은 정보 {i}",
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+            tags=[tags[i % 10], tags[(i + 3) % 10]],
+        ))
+    return tweets
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 벤치마크")
+    parser.add_argument("--size", type=int, default=100, help="페이지당 트윗 수")
+    parser.add_argument("--repeat", type=int, default=200, help="경로별 반복 횟수")
+    args = parser.parse_args()
+
+    tweets = build_page(args.size)
+
+    def pydantic_path():
+        response = TweetResponse(tweets=tweets, total=None, page=1, size=args.size)
+        # FastAPI JSONResponse.render와 같은 옵션
+        return json.dumps(jsonable_encoder(response), ensure_ascii=False, separators=(",", ":")).encode()
+
+    def pydantic_json_path():
+        response = TweetResponse(tweets=tweets, total=None, page=1, size=args.size)
+        return response.model_dump_json().encode()
+
+    def payload():
+        return {"tweets": serialize_tweets(tweets), "total": None, "page": 1, "size": args.size, "next_cursor": None}
+
+    paths = {"pydantic": pydantic_path, "pydantic-json": pydantic_json_path}
+    try:
+        import orjson
+        paths["orjson"] = lambda: orjson.dumps(payload())
+    except ImportError:
+        print("orjson이 설치되지 않아 건너뜁니다")
+    try:
+        import msgpack
+        paths["msgpack"] = lambda: msgpack.packb(payload(), use_bin_type=True)
+    except ImportError:
+        print("msgpack이 설치되지 않아 건너뜁니다")
+
+    print(f"트윗 {args.size}개 페이지, {args.repeat}회 반복")
+    baseline = None
+    for name, func in paths.items():
+        size = len(func())
+        elapsed = timeit.timeit(func, number=args.repeat) / args.repeat * 1000
+        baseline = baseline or elapsed
+        print(f"  {name:14s} {elapsed:8.3f} ms/페이지  {size:7d} bytes  x{baseline / elapsed:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+트윗 목록 로딩 전략 벤치마크
+
+임시 SQLite DB에 대량의 트윗(기본 100,000개)을 넣고 같은 페이지를 두 가지 방식으로 읽어 비교합니다.
+
+- joinedload: db.query(Tweet).options(joinedload(user), joinedload(tags)).offset().limit()
+  (서브쿼리로 감싸고 태그 수만큼 행이 늘어남, 기존 방식)
+- id-page + selectinload: app.utils.loaders.load_tweet_page()
+  (id만 페이징한 뒤 IN 쿼리로 엔티티, user, tags를 일괄 로딩)
+
+전체 목록, 사용자별, 태그별 쿼리를 첫 페이지와 깊은 offset에서 측정합니다.
+
+사용법:
+    python benchmark_tweet_loading.py --tweets 100000 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import sessionmaker, joinedload
+
+from app.db.database import run_migrations, apply_sqlite_tuning
+from app.models.models import Tweet, User, Tag, tweet_tags
+from app.utils.loaders import load_tweet_page
+
+def seed(engine, tweets: int, users: int, tags: int):
+    """ORM을 거치지 않고 Core insert로 대량 데이터를 넣습니다"""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"telegram_id": i, "telegram_username": f"user{i}", "display_name": f"User {i}", "created_at": now, "is_active": True}
+            for i in range(1, users + 1)
+        ])
+        conn.execute(insert(Tag), [
+            {"id": i, "name": f"tag{i}", "created_at": now, "tweet_count": 0, "is_active": True, "is_core": False}
+            for i in range(1, tags + 1)
+        ])
+        for start in range(0, tweets, 10000):
+            rows, links = [], []
+            for i in range(start, min(start + 10000, tweets)):
+                tweet_id = uuid.uuid4()
+                created_at = now - timedelta(seconds=tweets - i)
+                rows.append({
+                    "id": tweet_id, "user_id": rng.randint(1, users),
+                    "tweet_url": f"https://x.com/bench/status/{i}", "tweet_id": str(i),
+                    "comment": f"benchmark tweet {i}", "content_preview": "",
+                    "created_at": created_at, "updated_at": created_at,
+                })
+                for tag_id in rng.sample(range(1, tags + 1), rng.randint(1, 4)):
+                    links.append({"tweet_id": tweet_id, "tag_id": tag_id})
+            conn.execute(insert(Tweet), rows)
+            conn.execute(insert(tweet_tags), links)
+        conn.execute(text("ANALYZE"))
+
+def joinedload_page(db, query):
+    return query.options(joinedload(Tweet.user), joinedload(Tweet.tags)).all()
+
+def touch(tweets):
+    """직렬화와 같이 user/tags에 접근 (지연 로딩이 있으면 여기서 발생)"""
+    return sum(len(t.tags) + (1 if t.user else 0) for t in tweets)
+
+def measure(Session, build_query, loader, repeat):
+    timings = []
+    for _ in range(repeat):
+        db = Session()
+        try:
+            started = time.perf_counter()
+            touch(loader(db, build_query(db)))
+            timings.append(time.perf_counter() - started)
+        finally:
+            db.close()
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="트윗 목록 로딩 전략 벤치마크")
+    parser.add_argument("--tweets", type=int, default=100000, help="생성할 트윗 수")
+    parser.add_argument("--users", type=int, default=500, help="사용자 수")
+    parser.add_argument("--tags", type=int, default=200, help="태그 수")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--repeat", type=int, default=20, help="케이스별 반복 횟수 (중앙값 출력)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        apply_sqlite_tuning(engine)
+        run_migrations(bind=engine)
+
+        started = time.perf_counter()
+        seed(engine, args.tweets, args.users, args.tags)
+        print(f"트윗 {args.tweets:,}개 생성: {time.perf_counter() - started:.1f}s")
+
+        Session = sessionmaker(bind=engine)
+        newest = (Tweet.created_at.desc(), Tweet.id.desc())
+        deep = args.tweets // 2
+
+        def by_tag(db):
+            return db.query(Tweet).filter(Tweet.id.in_(
+                select(tweet_tags.c.tweet_id).where(tweet_tags.c.tag_id == 7)
+            ))
+
+        cases = {
+            "tweets (첫 페이지)": lambda db: db.query(Tweet).order_by(*newest).limit(args.limit),
+            f"tweets (offset {deep:,})": lambda db: db.query(Tweet).order_by(*newest).offset(deep).limit(args.limit),
+            "user tweets": lambda db: db.query(Tweet).filter(Tweet.user_id == 7).order_by(*newest).limit(args.limit),
+            "tag tweets": lambda db: by_tag(db).order_by(*newest).limit(args.limit),
+            "tag tweets (offset 1,000)": lambda db: by_tag(db).order_by(*newest).offset(1000).limit(args.limit),
+        }
+
+        print(f"{'케이스':28s} {'joinedload':>12s} {'id+selectin':>12s}")
+        for name, build_query in cases.items():
+            joined = measure(Session, build_query, joinedload_page, args.repeat)
+            selectin = measure(Session, build_query, load_tweet_page, args.repeat)
+            print(f"{name:28s} {joined:9.2f} ms {selectin:9.2f} ms  x{joined / selectin:.2f}")
+        engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -312,14 +312,20 @@ class TwitterBot:
         skip = (page - 1) * limit
         
         logger.info(f"Fetching tweets for user {user_id}, page {page}")
-        api_url = f"{API_BASE_URL}/users/{user_id}/tweets"
+        api_url = f"{API_BASE_URL}/tweets"
         
         try:
             async with httpx.AsyncClient(timeout=30.0) as client:
                 # 사용자의 포스팅 목록 조회
                 response = await client.get(
                     api_url,
-                    params={"skip": skip, "limit": limit}
+                    params={
+                        "user_id": user_id,
+                        "skip": skip,
+                        "limit": limit,
+                        # 메시지에 표시하는 필드만 조회
+                        "fields": "id,tweet_url,comment,created_at,tags"
+                    }
                 )
                 
                 logger.info(f"MyTweets API Response Status: {response.status_code}")
@@ -438,43 +444,17 @@ class TwitterBot:
         logger.info(f"Attempting to delete tweet with short ID: {short_id} for user: {user_id}")
         
         try:
-            # 먼저 사용자의 모든 포스팅을 가져와서 짧은 ID로 매칭
+            # 서버에서 짧은 ID를 찾아 바로 삭제 (포스팅 수와 관계없이 요청 한 번)
             async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{API_BASE_URL}/users/{user_id}/tweets?limit=100")
-                
-                if response.status_code != 200:
-                    await update.message.reply_text("❌ 포스팅 목록을 가져올 수 없습니다.")
-                    return
-                
-                data = response.json()
-                tweets = data.get("tweets", [])
-                
-                # 짧은 ID로 포스팅 찾기
-                target_tweet = None
-                for tweet in tweets:
-                    tweet_full_id = tweet.get("id", "")
-                    if tweet_full_id.startswith(short_id):
-                        target_tweet = tweet
-                        break
-                
-                if not target_tweet:
-                    await update.message.reply_text(
-                        f"❌ 짧은 ID '{short_id}'에 해당하는 포스팅을 찾을 수 없습니다.\n"
-                        "💡 /mytweets 명령어로 올바른 ID를 확인하세요."
-                    )
-                    return
-                
-                # 포스팅 삭제 API 호출
-                full_tweet_id = target_tweet.get("id")
                 delete_response = await client.delete(
-                    f"{API_BASE_URL}/tweets/{full_tweet_id}",
+                    f"{API_BASE_URL}/tweets/resolve/{short_id}",
                     params={"user_id": user_id}
                 )
                 
                 logger.info(f"Delete response: {delete_response.status_code} - {delete_response.text}")
                 
                 if delete_response.status_code == 200:
-                    tweet_url = target_tweet.get("tweet_url", "")
+                    tweet_url = delete_response.json().get("tweet_url", "")
                     await update.message.reply_text(
                         f"✅ 포스팅이 성공적으로 삭제되었습니다!\n"
                         f"🔗 {tweet_url}"
@@ -482,7 +462,15 @@ class TwitterBot:
                 elif delete_response.status_code == 403:
                     await update.message.reply_text("❌ 본인이 작성한 포스팅만 삭제할 수 있습니다.")
                 elif delete_response.status_code == 404:
-                    await update.message.reply_text("❌ 포스팅을 찾을 수 없습니다.")
+                    await update.message.reply_text(
+                        f"❌ 짧은 ID '{short_id}'에 해당하는 포스팅을 찾을 수 없습니다.\n"
+                        "💡 /mytweets 명령어로 올바른 ID를 확인하세요."
+                    )
+                elif delete_response.status_code == 409:
+                    await update.message.reply_text(
+                        f"❌ 짧은 ID '{short_id}'에 해당하는 포스팅이 여러 개입니다.\n"
+                        "💡 ID를 더 길게 입력해주세요."
+                    )
                 else:
                     await update.message.reply_text(f"❌ 삭제 실패 (코드: {delete_response.status_code})")
                     
@@ -12,12 +12,48 @@ class Settings(BaseSettings):
     twitter_api_secret: str = ""
     twitter_access_token: str = ""
     twitter_access_token_secret: str = ""
+    twitter_bearer_token: str = ""  # 있으면 앱 인증으로 미리보기 조회 (한도가 더 큼)
     
     rate_limit_per_hour: int = 10
     max_tweets_per_page: int = 100
     
     debug: bool = False
     
+    # 비동기 DB 레이어 (aiosqlite / asyncpg) 사용 여부
+    async_db: bool = False
+    
+    # SQLite 튜닝 프로필 (연결마다 PRAGMA로 적용, 빈 값이면 해당 PRAGMA 생략)
+    sqlite_journal_mode: str = "WAL"  # 읽기와 쓰기가 서로 막지 않음
+    sqlite_synchronous: str = "NORMAL"  # WAL에서는 NORMAL로도 손상 없음
+    sqlite_mmap_size: int = 268435456  # 256MB
+    sqlite_cache_size: int = -65536  # 음수는 KiB 단위 (64MB)
+    sqlite_busy_timeout: int = 5000  # ms, "database is locked" 대신 대기
+    sqlite_temp_store: str = "MEMORY"
+    sqlite_read_pool: bool = False  # GET 라우트용 읽기 전용(mode=ro) 커넥션 풀 사용
+    
+    # PostgreSQL 등 서버 DB 커넥션 풀 설정
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # 초, 풀에서 커넥션을 기다리는 최대 시간
+    db_pool_recycle: int = 1800  # 초, 오래된 커넥션 재생성
+    db_pool_pre_ping: bool = True  # 끊긴 커넥션을 사용 전에 감지
+    database_read_url: str = ""  # GET 라우트용 읽기 복제본 (비어 있으면 기본 DB 사용)
+    database_read_connect_timeout: int = 2  # 초, 읽기 복제본 연결 제한 시간
+    database_read_retry_interval: float = 30.0  # 초, 읽기 복제본 연결 실패 후 기본 DB만 사용하는 시간
+    
+    # 요청별 SQL 수 / DB 시간 계측 (X-DB-Query-Count, X-DB-Time-Ms 헤더와 로그)
+    sql_instrumentation: bool = True
+    
+    # 응답 압축 (gzip, brotli 모듈이 있으면 br) - 이보다 작은 응답은 압축하지 않음 (바이트)
+    compression_minimum_size: int = 500
+    
+    # 트윗 미리보기 수집 워커 (enrichment_queue를 백그라운드에서 처리)
+    enrichment_provider: str = ""  # twitter, fake 또는 빈 값 (워커 비활성화, 대기열만 쌓임)
+    enrichment_batch_size: int = 100  # 조회 한 번에 보낼 최대 트윗 수 (X API 최대 100)
+    enrichment_requests_per_window: int = 300  # 제공자 요청 한도 (창당 요청 수)
+    enrichment_window_seconds: int = 900  # 요청 한도 창 (X API는 15분)
+    enrichment_poll_interval: float = 5.0  # 대기열이 비었을 때 다시 확인하는 간격 (초)
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
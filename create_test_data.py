@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app.db.database import SessionLocal, create_tables
 from app.models.models import User, Tweet, Tag
 from app.utils.database_utils import get_or_create_user, get_or_create_tag
+from app.utils.counters import rebuild_counters
 
 # 샘플 데이터
 SAMPLE_USERS = [
@@ -115,8 +116,9 @@ def create_test_data():
                 db.add(tweet)
                 tweet_count += 1
         
-        # 커밋
+        # 커밋 (트윗을 직접 추가했으므로 통계 카운터 재계산)
         db.commit()
+        rebuild_counters(db)
         print(f"\n✅ 총 {tweet_count}개의 트윗이 생성되었습니다!")
         
         # 4. 통계 출력
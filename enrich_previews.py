@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+트윗 미리보기 수집 스크립트
+enrichment_queue에 쌓인 트윗의 content_preview / image_url을 제공자에서 가져와 채웁니다.
+API 서버에서 ENRICHMENT_PROVIDER를 설정하면 같은 작업이 백그라운드로 실행되므로,
+이 스크립트는 기존 트윗 백필이나 서버 밖에서 한 번 비울 때 사용합니다.
+
+사용법:
+    python enrich_previews.py --enqueue-missing   # 미리보기가 빈 기존 트윗을 대기열에 추가
+    python enrich_previews.py --provider twitter  # 대기열을 비울 때까지 처리
+    python enrich_previews.py --stats
+"""
+
+import argparse
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.database import SessionLocal, create_tables
+from app.utils.enrichment import create_worker, enqueue_missing, queue_stats
+from config import settings
+
+def main():
+    parser = argparse.ArgumentParser(description="트윗 미리보기 수집")
+    parser.add_argument("--provider", default=settings.enrichment_provider or "twitter",
+                        help="미리보기 제공자 (twitter, fake)")
+    parser.add_argument("--enqueue-missing", action="store_true",
+                        help="미리보기가 빈 기존 트윗을 대기열에 추가만 함")
+    parser.add_argument("--stats", action="store_true", help="대기열 상태만 출력")
+    args = parser.parse_args()
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        if args.enqueue_missing:
+            added = enqueue_missing(db)
+            print(f"✅ {added}개 트윗을 대기열에 추가했습니다")
+        if args.stats or args.enqueue_missing:
+            stats = queue_stats(db)
+            print(f"📋 대기 {stats['pending']}개, 실패 {stats['failed']}개")
+            return
+    finally:
+        db.close()
+
+    settings.enrichment_provider = args.provider
+    try:
+        worker = create_worker(settings, SessionLocal)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"🔄 미리보기 수집 시작 (provider={args.provider}, batch={worker.batch_size})")
+    try:
+        processed = worker.run_once()
+    except KeyboardInterrupt:
+        processed = worker.processed
+        print("\n⏹️ 중단됨 (처리 중이던 작업은 임대 만료 후 다시 처리됩니다)")
+    print(f"✅ {processed}개 처리, {worker.enriched}개 미리보기 저장")
+
+if __name__ == "__main__":
+    main()
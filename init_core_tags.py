@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from app.db.database import SessionLocal
 from app.models.models import Tag
+from app.utils import counters
 
 load_dotenv()
 
@@ -37,6 +38,7 @@ def init_core_tags():
                     created_by=None  # 시스템 생성
                 )
                 db.add(new_tag)
+                counters.on_tag_created(db)
                 print(f"✅ 핵심 태그 '{tag_name}' 추가됨")
             else:
                 # 기존 태그를 핵심 태그로 업데이트
@@ -15,15 +15,18 @@ from sqlalchemy.orm import sessionmaker
 # 프로젝트 루트를 Python path에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.models.models import Base, User, Tweet, Tag
-from app.db.database import DATABASE_URL, engine
+from app.models.models import User
+from app.db.database import DATABASE_URL, engine, create_tables as prepare_database
 from config import settings
 
 def create_tables():
-    """데이터베이스 테이블을 생성합니다."""
+    """
+    데이터베이스 테이블을 생성합니다.
+    서버 시작 시와 같이 마이그레이션을 적용하므로 alembic_version도 기록됩니다.
+    """
     try:
         print("🔧 데이터베이스 테이블 생성 중...")
-        Base.metadata.create_all(bind=engine)
+        prepare_database()
         print("✅ 테이블 생성 완료!")
         return True
     except Exception as e:
@@ -65,7 +68,9 @@ def create_sample_data():
         # 사용자가 이미 존재하는지 확인
         existing_user = db.query(User).filter(User.telegram_id == 12345678).first()
         if not existing_user:
+            from app.utils import counters
             db.add(sample_user)
+            counters.on_user_created(db)
             db.commit()
             print("✅ 샘플 사용자 생성됨: @sample_user")
         else:
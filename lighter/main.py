@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, Request, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, validator
 from typing import List, Dict, Any
@@ -15,6 +15,20 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 import hashlib
 
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+try:
+    # 메인 앱과 같은 압축 / 정적 파일 fingerprint 유틸 (저장소 루트에서 실행할 때)
+    from app.utils.compression import CompressionMiddleware
+    from app.utils.static_assets import StaticAssets, HashedStaticFiles
+    from app.utils.html_cache import HTMLPageCache
+except ImportError:  # 단독 실행: gzip만 사용하고 해시 파일명 / HTML 캐시 없이 서빙
+    from starlette.middleware.gzip import GZipMiddleware as CompressionMiddleware
+    StaticAssets = HashedStaticFiles = HTMLPageCache = None
+
 # 로깅 설정
 current_dir = os.path.dirname(os.path.abspath(__file__))
 log_file = os.path.join(current_dir, 'wallet_search_log.txt')
@@ -26,6 +40,12 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# 개발 모드 (정적 파일 / HTML 변경 시 다시 해시, 다시 렌더링)
+LIGHTER_DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true")
+
+# 페이지 HTML 메모리 캐시 (index.html, 로그인 폼)
+page_cache = HTMLPageCache(auto_reload=LIGHTER_DEBUG) if HTMLPageCache else None
+
 # 접근 코드 설정 (환경변수 또는 기본값)
 ACCESS_CODE = os.getenv("LIGHTER_ACCESS_CODE", "1point500$")  # 원하는 코드로 변경 가능
 
@@ -43,11 +63,19 @@ app.add_middleware(
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=500)
 
 # API 설정
 API_BASE_URL = "https://mainnet.zklighter.elliot.ai/api/v1/account"
 ORDERBOOK_API_URL = "https://mainnet.zklighter.elliot.ai/api/v1/orderBookDetails"
 WALLET_ADDRESS_REGEX = re.compile(r'^0x[a-fA-F0-9]{40}$')
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+def negotiated_response(request: Request, content: Any) -> Response:
+    """Accept 헤더가 msgpack을 요청하면 msgpack, 아니면 orjson으로 응답합니다."""
+    if msgpack is not None and MSGPACK_MEDIA_TYPE in request.headers.get("accept", ""):
+        return Response(msgpack.packb(content, use_bin_type=True), media_type=MSGPACK_MEDIA_TYPE)
+    return ORJSONResponse(content)
 
 def to_checksum_address_fallback(address: str) -> str:
     """
@@ -280,11 +308,11 @@ async def fetch_accounts(wallet_request: WalletRequest, request: Request):
 
                     pos["liquidation_percent"] = round(liquidation_percent, 2)
 
-    return {
+    return negotiated_response(request, {
         "accounts": accounts_data,
         "position_summary": position_summary,
         "market_prices": market_prices
-    }
+    })
 
 @app.get("/api/market_prices")
 @limiter.limit("30/minute")
@@ -312,25 +340,42 @@ async def get_market_prices(request: Request):
                         "volume": float(market.get("daily_base_token_volume", 0))
                     }
 
-            return {"market_prices": market_prices}
+            return negotiated_response(request, {"market_prices": market_prices})
     except Exception as e:
         logging.error(f"Error fetching market prices: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to fetch market prices")
 
+def html_page(request: Request, key, render, sources=(), cache_control: str = "no-cache") -> Response:
+    """메모리에 캐시한 HTML로 응답합니다 (공용 유틸이 없으면 매번 렌더링)"""
+    if page_cache is None:
+        return HTMLResponse(render())
+    return page_cache.response(request, key, render, sources, cache_control=cache_control)
+
+def render_index_page() -> str:
+    html_path = os.path.join(current_dir, "static", "index.html")
+    with open(html_path, "r", encoding="utf-8") as f:
+        html = f.read()
+    # /lighter/static/script.js -> /lighter/static/script.<hash>.js
+    return lighter_assets.rewrite_html(html) if lighter_assets else html
+
 @app.get("/", response_class=HTMLResponse)
 async def read_index(request: Request, code: str = None):
     """메인 페이지를 반환합니다. 코드가 필요한 경우 입력 폼 표시"""
 
     # 코드가 제공되고 올바른 경우 메인 페이지 반환
     if code and check_access_code(code):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        html_path = os.path.join(current_dir, "static", "index.html")
-        with open(html_path, "r", encoding="utf-8") as f:
-            return f.read()
+        sources = [os.path.join(current_dir, "static", "index.html")]
+        if lighter_assets:
+            sources += lighter_assets.paths()
+        # 접근 코드가 필요한 페이지이므로 공유 캐시(프록시)에는 저장하지 않음
+        return html_page(request, "index", render_index_page, sources, cache_control="private, no-cache")
 
-    # 코드가 없거나 틀린 경우 로그인 폼 표시
+    # 코드가 없거나 틀린 경우 로그인 폼 표시 (에러 메시지 유무에 따라 두 가지)
     error_msg = "잘못된 접근 코드입니다." if code else ""
+    return html_page(request, ("login", error_msg), lambda: render_login_page(error_msg))
 
+def render_login_page(error_msg: str) -> str:
+    """접근 코드 입력 폼 HTML"""
     return f"""
     <!DOCTYPE html>
     <html lang="ko">
@@ -461,10 +506,15 @@ async def read_index(request: Request, code: str = None):
     </html>
     """
 
-# Static 파일 서빙
+# Static 파일 서빙 (해시 파일명은 immutable 캐시)
 current_dir = os.path.dirname(os.path.abspath(__file__))
 static_dir = os.path.join(current_dir, "static")
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+if StaticAssets is not None:
+    lighter_assets = StaticAssets(static_dir, "/lighter/static", auto_reload=LIGHTER_DEBUG)
+    app.mount("/static", HashedStaticFiles(assets=lighter_assets), name="static")
+else:
+    lighter_assets = None
+    app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 if __name__ == "__main__":
     import uvicorn
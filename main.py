@@ -1,15 +1,30 @@
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from contextlib import asynccontextmanager
-from app.db.database import create_tables
+from fastapi.responses import StreamingResponse, Response
+from contextlib import asynccontextmanager, contextmanager
+from starlette.concurrency import run_in_threadpool
+from app.db.database import create_tables, SessionLocal, get_read_db
+from app.db.instrumentation import install_query_instrumentation, track_queries
+from app.utils.events import hub
+from app.utils.cache import request_data_version, data_version
+from app.utils import counters
+from app.utils.serialization import wants_msgpack
+from app.utils.compression import CompressionMiddleware
+from app.utils.static_assets import StaticAssets, HashedStaticFiles
+from app.utils.html_cache import HTMLPageCache
+from app.utils.enrichment import create_worker
+from datetime import date
 from app.routers import tweets, users, tags, stats
+from config import settings
 import uvicorn
+import asyncio
+import logging
 import sys
 import os
 
+logger = logging.getLogger("app.sql")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작시 실행
@@ -20,9 +35,23 @@ async def lifespan(app: FastAPI):
         print(f"⚠️ 데이터베이스 초기화 중 오류: {e}")
         print("💡 데이터베이스 연결을 확인하고 init_db.py를 실행해보세요.")
     
+    # 트윗 미리보기 수집 워커 (ENRICHMENT_PROVIDER가 설정된 경우)
+    worker = None
+    if settings.enrichment_provider:
+        try:
+            worker = create_worker(settings, SessionLocal)
+            worker.start()
+        except Exception as e:
+            print(f"⚠️ 미리보기 수집 워커를 시작할 수 없습니다: {e}")
+    
     yield
     
     # 종료시 실행 (필요시 정리 작업)
+    if worker is not None:
+        await worker.stop()
+    if settings.async_db:
+        from app.db.async_database import dispose_async_engine
+        await dispose_async_engine()
     print("🛑 서버 종료")
 
 app = FastAPI(
@@ -40,27 +69,168 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# 데이터 버전 기반 조건부 GET을 적용하는 읽기 API
+CONDITIONAL_GET_PREFIXES = ("/api/tweets", "/api/tags", "/api/stats", "/api/users")
+# ETag를 붙이지 않는 경로 (쓰기가 없어도 시간에 따라 결과가 바뀌는 최근 N일/시간 창, 실시간 경로)
+CONDITIONAL_GET_EXCLUDED = (
+    "/api/tags/popular", "/api/users/stats/top-contributors",
+    "/api/stats/timeseries", "/api/stats/cache", "/api/stats/enrichment",
+)
+
+def read_data_version(request: Request) -> str:
+    """읽기 DB에서 현재 데이터 버전을 읽습니다 (get_read_db와 같은 DB, 테스트 override 포함)"""
+    dependency = request.app.dependency_overrides.get(get_read_db, get_read_db)
+    with contextmanager(dependency)() as db:
+        return counters.get_data_version(db)
+
+async def current_data_version(request: Request) -> str:
+    """프로세스 내 데이터 버전 (TTL이 지났을 때만 읽기 DB에서 다시 읽음)"""
+    version = data_version.current()
+    if version is None:
+        ticket = data_version.begin_refresh()
+        version = data_version.finish_refresh(ticket, await run_in_threadpool(read_data_version, request))
+    return version
+
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """
+    읽기 API에 약한 ETag를 붙이고, If-None-Match가 현재 ETag와 같으면 엔드포인트의
+    DB 조회와 직렬화 없이 304로 응답합니다.
+    
+    ETag는 데이터 버전(쓰기 트랜잭션마다 증가하는 카운터 + 최신 트윗 시각) +
+    날짜(tweets_today 변경) + 응답 형식입니다. 데이터 버전은 프로세스 내 사본
+    (cache.data_version)을 사용해, 이 프로세스의 쓰기는 즉시 반영하고 다른 프로세스의
+    쓰기는 짧은 TTL마다 읽기 DB에서 다시 읽어 반영합니다. TTL 안의 304 응답은 DB를
+    조회하지 않습니다. DB 버전은 응답 전에 읽으므로 복제 지연이 있어도 본문보다 새로운
+    ETag가 붙지 않습니다. 같은 버전을 응답/개수 캐시 키에도 사용합니다.
+    """
+    path = request.url.path
+    if request.method != "GET" or not path.startswith(CONDITIONAL_GET_PREFIXES):
+        return await call_next(request)
+    
+    version = await current_data_version(request)
+    token = request_data_version.set(version)
+    try:
+        if path.startswith(CONDITIONAL_GET_EXCLUDED):
+            return await call_next(request)
+        
+        variant = date.today().isoformat() + ("-msgpack" if wants_msgpack(request) else "")
+        etag = f'W/"{version}-{variant}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",  # 캐시하되 매번 ETag로 재검증
+        }
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return Response(status_code=304, headers=headers)
+        
+        response = await call_next(request)
+        if response.status_code == 200:
+            response.headers.update(headers)
+        return response
+    finally:
+        request_data_version.reset(token)
+
+if settings.sql_instrumentation:
+    install_query_instrumentation()
+
+    @app.middleware("http")
+    async def sql_instrumentation(request: Request, call_next):
+        """요청마다 실행된 SQL 수와 DB 시간을 응답 헤더와 로그로 남깁니다 (N+1 확인용)"""
+        with track_queries() as stats:
+            response = await call_next(request)
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Time-Ms"] = str(stats.duration_ms)
+        if stats.count:
+            logger.info(
+                f"{request.method} {request.url.path} - {stats.count} queries, {stats.duration_ms} ms"
+            )
+        return response
+
+# 가장 바깥 미들웨어: 다른 미들웨어가 붙인 헤더까지 끝난 응답을 압축
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+
+# 정적 파일은 내용 해시가 들어간 이름(style.<hash>.css)으로 참조하고 영구 캐시
+# 템플릿에서는 {{ static_url('css/style.css') }}로 해시 URL을 얻음
+static_assets = StaticAssets("static", "/static", auto_reload=settings.debug)
+app.mount("/static", HashedStaticFiles(assets=static_assets), name="static")
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["static_url"] = static_assets.url
 
 # Lighter 앱 설정
 sys.path.insert(0, os.path.dirname(__file__))
-from lighter.main import app as lighter_app
-app.mount("/lighter/static", StaticFiles(directory="lighter/static"), name="lighter_static")
+from lighter.main import app as lighter_app, lighter_assets
+app.mount("/lighter/static", HashedStaticFiles(assets=lighter_assets), name="lighter_static")
 app.mount("/lighter", lighter_app)
 
-app.include_router(tweets.router, prefix="/api", tags=["tweets"])
-app.include_router(users.router, prefix="/api", tags=["users"])
-app.include_router(tags.router, prefix="/api", tags=["tags"])
-app.include_router(stats.router, prefix="/api", tags=["stats"])
+if settings.async_db:
+    # 비동기 DB 레이어: 목록/통계 GET은 AsyncSession으로, 나머지 라우트는 스레드풀에서 실행하는 async 엔드포인트로 제공
+    from app.routers import async_routers
+    app.include_router(async_routers.tweets_router, prefix="/api", tags=["tweets"])
+    app.include_router(async_routers.users_router, prefix="/api", tags=["users"])
+    app.include_router(async_routers.tags_router, prefix="/api", tags=["tags"])
+    app.include_router(async_routers.stats_router, prefix="/api", tags=["stats"])
+else:
+    app.include_router(tweets.router, prefix="/api", tags=["tweets"])
+    app.include_router(users.router, prefix="/api", tags=["users"])
+    app.include_router(tags.router, prefix="/api", tags=["tags"])
+    app.include_router(stats.router, prefix="/api", tags=["stats"])
+
+# 템플릿은 요청과 무관하므로 한 번만 렌더링해 메모리에 보관 (ETag로 재검증)
+# 개발 모드에서는 템플릿/정적 파일의 mtime이 바뀌면 다시 렌더링
+page_cache = HTMLPageCache(auto_reload=settings.debug)
+
+def template_page(request: Request, name: str) -> Response:
+    """캐시된 템플릿 페이지로 응답합니다"""
+    return page_cache.response(
+        request, name,
+        render=lambda: templates.get_template(name).render(),
+        sources=[os.path.join("templates", name), *static_assets.paths()]
+    )
 
 @app.get("/")
 async def root(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return template_page(request, "index.html")
 
 @app.get("/yapper")
 async def yapper_dashboard(request: Request):
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+    return template_page(request, "dashboard.html")
+
+# SSE 연결 유지용 주석 메시지 간격 (초) - 프록시의 유휴 연결 종료 방지
+EVENTS_HEARTBEAT_SECONDS = 15
+
+@app.get("/api/events")
+async def event_stream(request: Request):
+    """
+    대시보드 실시간 피드 (Server-Sent Events)
+    
+    트윗 생성/삭제가 commit되면 다음 이벤트를 보냅니다.
+    - tweet_created: {"tweet", "stats", "tags"}
+    - tweet_deleted: {"id", "tweet_id", "stats", "tags"}
+    - stats: {"stats"} (벌크 등록 후)
+    - resync: 메시지가 밀려 델타를 버린 경우, 전체 데이터를 다시 불러와야 함
+    """
+    async def stream():
+        queue = hub.subscribe()
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=EVENTS_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": ping\n\n"
+                    continue
+                yield message
+        finally:
+            hub.unsubscribe(queue)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 @app.get("/health")
 async def health_check():
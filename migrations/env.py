@@ -0,0 +1,54 @@
+"""
+Alembic 마이그레이션 환경
+
+DB URL은 app.db.database.DATABASE_URL(환경변수 DATABASE_URL)을 사용하고,
+app.db.database.run_migrations()에서 호출될 때는 전달받은 커넥션을 그대로 사용합니다.
+"""
+
+from alembic import context
+from sqlalchemy import Uuid
+from app.db.database import engine
+from app.models.models import Base
+from app.models.types import CompactUUID
+
+target_metadata = Base.metadata
+
+def compare_type(context, inspected_column, metadata_column, inspected_type, metadata_type):
+    # SQLite는 UUID 컬럼을 NUMERIC으로 리플렉션하므로 타입 변경으로 보지 않음
+    if context.dialect.name == "sqlite" and isinstance(metadata_type, (Uuid, CompactUUID)):
+        return False
+    return None
+
+def run_migrations_offline():
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=engine.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    connection = context.config.attributes.get("connection")
+    if connection is not None:
+        _run(connection)
+        return
+    with engine.connect() as connection:
+        _run(connection)
+
+def _run(connection):
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=compare_type,
+        # SQLite는 ALTER TABLE 지원이 제한적이므로 batch 모드 사용
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
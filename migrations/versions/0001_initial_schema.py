@@ -0,0 +1,106 @@
+"""initial schema
+
+기존에 Base.metadata.create_all로 만들어진 DB도 그대로 업그레이드할 수 있도록
+이미 있는 테이블과 인덱스는 건너뜁니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def _create_index_if_missing(name, table, columns, unique=False):
+    existing = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+    if name not in existing:
+        op.create_index(name, table, columns, unique=unique)
+
+def upgrade():
+    tables = _existing_tables()
+
+    if "users" not in tables:
+        op.create_table(
+            "users",
+            sa.Column("telegram_id", sa.Integer(), primary_key=True),
+            sa.Column("telegram_username", sa.String(255)),
+            sa.Column("display_name", sa.String(255)),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("is_active", sa.Boolean()),
+        )
+    _create_index_if_missing("ix_users_telegram_id", "users", ["telegram_id"])
+    _create_index_if_missing("ix_users_telegram_username", "users", ["telegram_username"], unique=True)
+
+    if "tweets" not in tables:
+        op.create_table(
+            "tweets",
+            sa.Column("id", UUID(as_uuid=True), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.telegram_id")),
+            sa.Column("tweet_url", sa.String(500), nullable=False),
+            sa.Column("tweet_id", sa.String(50)),
+            sa.Column("content_preview", sa.Text()),
+            sa.Column("image_url", sa.String(500)),
+            sa.Column("comment", sa.Text()),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("updated_at", sa.DateTime()),
+        )
+    _create_index_if_missing("ix_tweets_id", "tweets", ["id"])
+    _create_index_if_missing("ix_tweets_user_id", "tweets", ["user_id"])
+    _create_index_if_missing("ix_tweets_tweet_id", "tweets", ["tweet_id"], unique=True)
+
+    if "tags" not in tables:
+        op.create_table(
+            "tags",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100)),
+            sa.Column("created_at", sa.DateTime()),
+            sa.Column("tweet_count", sa.Integer()),
+            sa.Column("is_active", sa.Boolean()),
+            sa.Column("is_core", sa.Boolean()),
+            sa.Column("created_by", sa.Integer(), sa.ForeignKey("users.telegram_id"), nullable=True),
+        )
+    _create_index_if_missing("ix_tags_id", "tags", ["id"])
+    _create_index_if_missing("ix_tags_name", "tags", ["name"], unique=True)
+    _create_index_if_missing("ix_tags_active_tweet_count", "tags", ["is_active", "tweet_count"])
+
+    if "tweet_tags" not in tables:
+        op.create_table(
+            "tweet_tags",
+            sa.Column("tweet_id", UUID(as_uuid=True), sa.ForeignKey("tweets.id"), primary_key=True),
+            sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id"), primary_key=True),
+        )
+
+    if "stat_counters" not in tables:
+        op.create_table(
+            "stat_counters",
+            sa.Column("name", sa.String(50), primary_key=True),
+            sa.Column("value", sa.Integer(), nullable=False),
+        )
+
+    if "daily_tweet_counts" not in tables:
+        op.create_table(
+            "daily_tweet_counts",
+            sa.Column("day", sa.Date(), primary_key=True),
+            sa.Column("tweet_count", sa.Integer(), nullable=False),
+        )
+
+    if "user_tweet_counts" not in tables:
+        op.create_table(
+            "user_tweet_counts",
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.telegram_id"), primary_key=True),
+            sa.Column("tweet_count", sa.Integer(), nullable=False),
+        )
+    _create_index_if_missing("ix_user_tweet_counts_tweet_count", "user_tweet_counts", ["tweet_count"])
+
+def downgrade():
+    for table in ("user_tweet_counts", "daily_tweet_counts", "stat_counters",
+                  "tweet_tags", "tags", "tweets", "users"):
+        op.drop_table(table)
@@ -0,0 +1,35 @@
+"""composite indexes for hot list queries
+
+- tweets(created_at, id): /api/tweets 최신순/오래된순 + keyset 커서
+- tweets(user_id, created_at, id): 사용자별 트윗 목록
+- tweet_tags(tag_id, tweet_id): 태그별 트윗 목록, 태그 필터 세미조인
+  (기본키 (tweet_id, tag_id)는 tweet_id로 시작하는 조회만 지원)
+
+Base.metadata.create_all로 이미 인덱스가 만들어진 DB는 건너뜁니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+def _create_index_if_missing(name, table, columns, unique=False):
+    existing = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+    if name not in existing:
+        op.create_index(name, table, columns, unique=unique)
+
+def upgrade():
+    _create_index_if_missing("ix_tweets_created_at_id", "tweets", ["created_at", "id"])
+    _create_index_if_missing("ix_tweets_user_id_created_at", "tweets", ["user_id", "created_at", "id"])
+    _create_index_if_missing("ix_tweet_tags_tag_id_tweet_id", "tweet_tags", ["tag_id", "tweet_id"])
+
+def downgrade():
+    op.drop_index("ix_tweet_tags_tag_id_tweet_id", table_name="tweet_tags")
+    op.drop_index("ix_tweets_user_id_created_at", table_name="tweets")
+    op.drop_index("ix_tweets_created_at_id", table_name="tweets")
@@ -0,0 +1,42 @@
+"""store tweet ids as 16-byte blobs on SQLite
+
+tweets.id와 tweet_tags.tweet_id의 32자 hex 문자열을 16바이트 BLOB으로 변환합니다.
+(app.models.types.CompactUUID) 컬럼 선언과 rowid는 그대로이므로 FTS 인덱스는
+영향받지 않습니다. PostgreSQL은 이미 네이티브 UUID이므로 변경 없음.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+import uuid
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+ID_COLUMNS = (("tweets", "id"), ("tweet_tags", "tweet_id"))
+
+def _convert(to_blob: bool):
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    source_type = "text" if to_blob else "blob"
+    for table, column in ID_COLUMNS:
+        rows = bind.exec_driver_sql(
+            f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = '{source_type}'"
+        ).fetchall()
+        if not rows:
+            continue
+        if to_blob:
+            params = [(uuid.UUID(value).bytes, rowid) for rowid, value in rows]
+        else:
+            params = [(uuid.UUID(bytes=bytes(value)).hex, rowid) for rowid, value in rows]
+        bind.exec_driver_sql(f"UPDATE {table} SET {column} = ? WHERE rowid = ?", params)
+
+def upgrade():
+    _convert(to_blob=True)
+
+def downgrade():
+    _convert(to_blob=False)
@@ -0,0 +1,56 @@
+"""hourly/daily activity rollups per tag and user
+
+- tag_rollups(period, bucket, tag_id): 기간별 인기 태그, 태그 타임시리즈
+- user_rollups(period, bucket, user_id): 기간별 상위 기여자, 사용자 타임시리즈
+
+기존 트윗에 대한 값은 앱 시작 시 ensure_counters()가 채웁니다.
+Base.metadata.create_all로 이미 만들어진 테이블과 인덱스는 건너뜁니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def _create_index_if_missing(name, table, columns, unique=False):
+    existing = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+    if name not in existing:
+        op.create_index(name, table, columns, unique=unique)
+
+def upgrade():
+    tables = _existing_tables()
+
+    if "tag_rollups" not in tables:
+        op.create_table(
+            "tag_rollups",
+            sa.Column("period", sa.String(8), primary_key=True),
+            sa.Column("bucket", sa.DateTime(), primary_key=True),
+            sa.Column("tag_id", sa.Integer(), sa.ForeignKey("tags.id"), primary_key=True),
+            sa.Column("tweet_count", sa.Integer(), nullable=False),
+        )
+    _create_index_if_missing("ix_tag_rollups_tag_id_period_bucket", "tag_rollups", ["tag_id", "period", "bucket"])
+
+    if "user_rollups" not in tables:
+        op.create_table(
+            "user_rollups",
+            sa.Column("period", sa.String(8), primary_key=True),
+            sa.Column("bucket", sa.DateTime(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.telegram_id"), primary_key=True),
+            sa.Column("tweet_count", sa.Integer(), nullable=False),
+        )
+    _create_index_if_missing("ix_user_rollups_user_id_period_bucket", "user_rollups", ["user_id", "period", "bucket"])
+
+def downgrade():
+    op.drop_index("ix_user_rollups_user_id_period_bucket", table_name="user_rollups")
+    op.drop_table("user_rollups")
+    op.drop_index("ix_tag_rollups_tag_id_period_bucket", table_name="tag_rollups")
+    op.drop_table("tag_rollups")
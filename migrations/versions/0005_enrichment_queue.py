@@ -0,0 +1,43 @@
+"""durable queue for background tweet preview enrichment
+
+- enrichment_queue(tweet_id): 미리보기를 아직 가져오지 않은 트윗 (트윗 등록 시 추가)
+
+기존 트윗은 enrich_previews.py --enqueue-missing으로 대기열에 넣습니다.
+Base.metadata.create_all로 이미 만들어진 테이블과 인덱스는 건너뜁니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def _existing_tables():
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def _create_index_if_missing(name, table, columns, unique=False):
+    existing = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+    if name not in existing:
+        op.create_index(name, table, columns, unique=unique)
+
+def upgrade():
+    if "enrichment_queue" not in _existing_tables():
+        op.create_table(
+            "enrichment_queue",
+            sa.Column("tweet_id", sa.String(50), primary_key=True),
+            sa.Column("status", sa.String(16), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("available_at", sa.DateTime(), nullable=False),
+            sa.Column("last_error", sa.Text()),
+            sa.Column("created_at", sa.DateTime()),
+        )
+    _create_index_if_missing("ix_enrichment_queue_status_available_at", "enrichment_queue", ["status", "available_at"])
+
+def downgrade():
+    op.drop_index("ix_enrichment_queue_status_available_at", table_name="enrichment_queue")
+    op.drop_table("enrichment_queue")
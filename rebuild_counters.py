@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+통계 카운터 재계산 스크립트
+stat_counters / daily_tweet_counts / user_tweet_counts와 Tag.tweet_count를
+원본 테이블에서 다시 계산합니다.
+DB에 직접 데이터를 넣었거나 /api/stats, /api/tags 값이 실제와 다를 때 실행합니다.
+"""
+
+import os
+import sys
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.db.database import SessionLocal, create_tables
+from app.utils.counters import rebuild_counters, reconcile_tag_counts
+
+def main():
+    create_tables()
+    db = SessionLocal()
+    try:
+        totals = rebuild_counters(db)
+        print("✅ 통계 카운터 재계산 완료")
+        for name, value in totals.items():
+            print(f"   - {name}: {value}")
+        
+        fixed = reconcile_tag_counts(db)
+        print(f"✅ 태그 tweet_count 보정 완료 ({fixed}개 수정)")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,10 @@ class Dashboard {
         // 현재 로드된 포스팅 데이터 (모달 네비게이션용)
         this.currentTweetsData = [];
         this.currentModalTweetIndex = -1;
+        this.currentTotal = 0;
+        
+        // 실시간 피드 (Server-Sent Events)
+        this.eventSource = null;
         
         this.init();
     }
@@ -44,9 +48,69 @@ class Dashboard {
         console.log('📡 초기 데이터 로드 시작...');
         await this.loadInitialData();
         
+        // 새 공유/삭제는 다시 조회하지 않고 서버가 보내는 델타로 반영
+        this.connectLiveFeed();
+        
         console.log('✅ Dashboard 초기화 완료');
     }
 
+    connectLiveFeed() {
+        if (!window.EventSource || this.eventSource) return;
+        
+        this.eventSource = new EventSource(`${this.apiBaseUrl}/events`);
+        this.eventSource.addEventListener('tweet_created', (e) => this.applyTweetCreated(JSON.parse(e.data)));
+        this.eventSource.addEventListener('tweet_deleted', (e) => this.applyTweetDeleted(JSON.parse(e.data)));
+        this.eventSource.addEventListener('stats', (e) => this.updateStats(JSON.parse(e.data).stats));
+        // 서버에서 델타가 밀려 버려진 경우에만 전체 다시 조회
+        this.eventSource.addEventListener('resync', () => this.loadInitialData());
+        // 연결이 끊기면 EventSource가 retry 간격 후 자동으로 재연결
+    }
+
+    isLiveView() {
+        // 필터 없이 최신순 첫 페이지를 보고 있을 때만 목록에 새 포스팅을 바로 추가
+        const f = this.filters;
+        return this.currentPage === 1 && (f.sort_by || 'newest') === 'newest' &&
+            !f.search && !f.user_id && !f.username && !f.tag && f.tags.length === 0 &&
+            !f.date_from && !f.date_to;
+    }
+
+    applyTweetCreated(data) {
+        this.updateStats(data.stats);
+        this.updateTagCounts(data.tags);
+        
+        if (!this.isLiveView()) return;
+        this.currentTotal += 1;
+        const tweets = [data.tweet, ...this.currentTweetsData].slice(0, this.tweetsPerPage);
+        this.renderTweets({ tweets });
+        this.renderPagination({ total: this.currentTotal });
+    }
+
+    applyTweetDeleted(data) {
+        this.updateStats(data.stats);
+        this.updateTagCounts(data.tags);
+        
+        const remaining = this.currentTweetsData.filter(tweet => 
+            this.extractTweetId(tweet.tweet_url) !== data.tweet_id
+        );
+        if (remaining.length === this.currentTweetsData.length) return;
+        this.currentTotal = Math.max(0, this.currentTotal - 1);
+        this.currentTweetsData = remaining;
+        this.renderTweets({ tweets: remaining });
+        this.renderPagination({ total: this.currentTotal });
+    }
+
+    updateTagCounts(counts) {
+        if (!this.contentElements.popularTags || !counts) return;
+        
+        Object.entries(counts).forEach(([name, count]) => {
+            const tagElement = this.contentElements.popularTags.querySelector(`.tag-item[data-tag="${CSS.escape(name)}"]`);
+            if (!tagElement) return;
+            const countElement = tagElement.querySelector('.tag-count');
+            if (countElement) countElement.textContent = count;
+            tagElement.classList.toggle('tag-inactive', !(count > 0));
+        });
+    }
+
     cacheElements() {
         // 통계 요소
         this.statsElements = {
@@ -150,6 +214,18 @@ class Dashboard {
             this.filterElements.resetBtn.addEventListener('click', this.resetFilters.bind(this));
         }
 
+        // 태그 클릭 이벤트 (태그 목록은 다시 렌더링되므로 컨테이너에 한 번만 위임)
+        if (this.contentElements.popularTags) {
+            this.contentElements.popularTags.addEventListener('click', (e) => {
+                e.preventDefault();
+                const tagElement = e.target.closest('.tag-item');
+                if (tagElement && !tagElement.classList.contains('tag-inactive')) {
+                    const tagName = tagElement.getAttribute('data-tag');
+                    this.filterByTag(tagName);
+                }
+            });
+        }
+
         // 포스팅 수 변경
         if (this.contentElements.tweetsPerPageSelect) {
             this.contentElements.tweetsPerPageSelect.addEventListener('change', (e) => {
@@ -340,16 +416,6 @@ class Dashboard {
         }).join('');
 
         this.contentElements.popularTags.innerHTML = tagsHtml;
-
-        // 태그 클릭 이벤트
-        this.contentElements.popularTags.addEventListener('click', (e) => {
-            e.preventDefault();
-            const tagElement = e.target.closest('.tag-item');
-            if (tagElement && !tagElement.classList.contains('tag-inactive')) {
-                const tagName = tagElement.getAttribute('data-tag');
-                this.filterByTag(tagName);
-            }
-        });
     }
 
     renderPopularTags(tags) {
@@ -373,6 +439,7 @@ class Dashboard {
             if (!response.ok) throw new Error('포스팅 로드 실패');
             
             const data = await response.json();
+            this.currentTotal = data.total || 0;
             this.renderTweets(data);
             this.renderPagination(data);
             
@@ -390,12 +457,17 @@ class Dashboard {
         // 페이징
         params.append('skip', ((this.currentPage - 1) * this.tweetsPerPage).toString());
         params.append('limit', this.tweetsPerPage.toString());
+        // 카드 렌더링에 필요한 필드만 요청
+        params.append('fields', 'tweet_url,comment,created_at,user,tags');
         
         // 필터
         if (this.filters.search) params.append('search', this.filters.search);
         if (this.filters.user_id) params.append('user_id', this.filters.user_id);
         if (this.filters.username) params.append('username', this.filters.username);
-        if (this.filters.tag) params.append('tag', this.filters.tag);
+        if (this.filters.tag) {
+            params.append('tag', this.filters.tag);
+            params.append('tag_match', 'exact');
+        }
         if (this.filters.date_from) params.append('date_from', this.filters.date_from);
         if (this.filters.date_to) params.append('date_to', this.filters.date_to);
         if (this.filters.sort_by) params.append('sort_by', this.filters.sort_by);
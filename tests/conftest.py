@@ -0,0 +1,83 @@
+"""
+API 테스트 공통 fixture
+
+임시 SQLite DB를 서버 시작 시와 같이 준비(마이그레이션, 전문 검색 인덱스, 카운터)하고, main.app의 get_db / get_read_db를
+그 DB의 세션으로 바꾼 TestClient를 제공합니다. ASYNC_DB=true의 get_async_read_db도 같은 DB의 aiosqlite 세션으로 바꿉니다. 종료 시 의존성 교체를 되돌리고 엔진을 정리합니다.
+
+    python -m pytest tests -q
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import get_db, get_read_db, create_tables
+from app.db.async_database import get_async_read_db
+from app.utils.cache import data_version
+from app.utils.tag_filters import clear_tag_id_cache
+import main
+
+@contextmanager
+def api_client(db_path):
+    """
+    임시 DB를 사용하는 TestClient
+
+    Args:
+        db_path: SQLite DB 파일 경로
+
+    Yields:
+        (TestClient, Engine, sessionmaker): 클라이언트, 임시 DB 엔진, 세션 팩토리
+    """
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    create_tables(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # TestClient는 요청마다 이벤트 루프가 달라질 수 있으므로 비동기 커넥션은 풀링하지 않음
+    AsyncSessionLocal = async_sessionmaker(
+        create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool),
+        class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def async_override():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    # 이전 테스트 DB에서 읽은 데이터 버전과 태그 ID를 쓰지 않도록 비움
+    data_version.reset()
+    clear_tag_id_cache()
+    main.app.dependency_overrides[get_db] = override
+    main.app.dependency_overrides[get_read_db] = override
+    main.app.dependency_overrides[get_async_read_db] = async_override
+    try:
+        yield TestClient(main.app), engine, Session
+    finally:
+        main.app.dependency_overrides.clear()
+        engine.dispose()
+
+@pytest.fixture(scope="module")
+def module_api(request, tmp_path_factory):
+    """테스트 모듈 하나가 공유하는 임시 DB + TestClient (데이터를 한 번만 준비할 때)"""
+    with api_client(tmp_path_factory.mktemp(request.module.__name__) / "test.db") as api:
+        yield api
+
+@pytest.fixture
+def api(tmp_path):
+    """테스트마다 새로 만드는 임시 DB + TestClient"""
+    with api_client(tmp_path / "test.db") as api:
+        yield api
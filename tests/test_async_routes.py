@@ -0,0 +1,81 @@
+"""
+비동기 DB 레이어(ASYNC_DB=true) 라우트 테스트
+
+async_routers의 라우터만 포함한 앱에 conftest의 의존성 교체(get_async_read_db는 같은 임시 DB의 aiosqlite 세션)를
+그대로 적용하고, 목록/통계 GET(AsyncSession 경로)과 나머지 라우트(스레드풀 경로)의 응답이 동기 라우트와 같은지 비교합니다.
+
+    python -m pytest tests/test_async_routes.py -q
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import async_routers
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts
+
+@pytest.fixture(scope="module")
+def clients(module_api):
+    client, _, _ = module_api
+    for user_id in range(1, 4):
+        client.post("/api/users", json={"telegram_id": user_id, "telegram_username": f"async{user_id}", "display_name": f"Async {user_id}"})
+    client.post("/api/tweets/bulk", json=[
+        {
+            "tweet_url": f"https://x.com/async{i % 3 + 1}/status/{7000 + i}",
+            "comment": f"async layer comment {i}",
+            "user_id": i % 3 + 1,
+            "tags": ["eth", "defi"] if i % 2 else ["ethena"]
+        }
+        for i in range(25)
+    ])
+
+    app = FastAPI()
+    for router in (async_routers.tweets_router, async_routers.users_router, async_routers.tags_router, async_routers.stats_router):
+        app.include_router(router, prefix="/api")
+    app.dependency_overrides.update(client.app.dependency_overrides)
+    yield client, TestClient(app)
+
+def fetch(client, path):
+    # 캐시를 비워 두 앱 모두 실제로 DB를 조회하도록 함
+    invalidate_responses()
+    invalidate_tweet_counts()
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+@pytest.mark.parametrize("path", [
+    "/api/tweets",
+    "/api/tweets?limit=5&skip=5",
+    "/api/tweets?sort_by=oldest&limit=7",
+    "/api/tweets?tag=eth&tag_match=exact",
+    "/api/tweets?tags=eth&tags=defi&tag_mode=all&tag_match=exact",
+    "/api/tweets?tags=eth&tags=missing&tag_mode=all&tag_match=exact",
+    "/api/tweets?tag=eth",
+    "/api/tweets?user_id=2&include_total=false",
+    "/api/tweets?username=async3",
+    "/api/tweets?search=comment%201&sort_by=relevance",
+    "/api/tweets?search=comment&search_mode=substring",
+    "/api/tweets?fields=tweet_url,comment,user,tags",
+    "/api/tags",
+    "/api/tags?sort_by=alphabetical&search=e",
+    "/api/stats",
+    "/api/users",
+])
+def test_async_routes_match_sync(clients, path):
+    client, async_client = clients
+    assert fetch(async_client, path) == fetch(client, path)
+
+def test_async_cursor_pages_match_sync(clients):
+    client, async_client = clients
+    sync_page = fetch(client, "/api/tweets?limit=10")
+    async_page = fetch(async_client, "/api/tweets?limit=10")
+    for _ in range(3):
+        assert async_page == sync_page
+        if not sync_page["next_cursor"]:
+            break
+        sync_page = fetch(client, f"/api/tweets?limit=10&cursor={sync_page['next_cursor']}")
+        async_page = fetch(async_client, f"/api/tweets?limit=10&cursor={async_page['next_cursor']}")
+
+def test_async_routes_reject_bad_cursor(clients):
+    _, async_client = clients
+    assert async_client.get("/api/tweets?cursor=not-a-cursor").status_code == 400
@@ -0,0 +1,81 @@
+"""
+트윗 일괄 등록 테스트 (POST /api/tweets/bulk)
+
+항목별 상태(created, duplicate, invalid)와 합계, 배치 단위 저장, BULK_MAX_ITEMS 제한을 확인합니다.
+
+    python -m pytest tests/test_bulk.py -q
+"""
+
+import pytest
+
+from app.routers import tweets
+
+@pytest.fixture
+def bulk_client(api):
+    client, _, _ = api
+    client.post("/api/users", json={"telegram_id": 1, "telegram_username": "bulk", "display_name": "Bulk"})
+    client.post("/api/tweets", json={"tweet_url": "https://x.com/bulk/status/100", "user_id": 1})
+    return client
+
+def test_bulk_per_item_statuses(bulk_client, monkeypatch):
+    # 여러 배치로 나뉘어 저장되도록 배치 크기를 줄임
+    monkeypatch.setattr(tweets, "BULK_BATCH_SIZE", 2)
+    response = bulk_client.post("/api/tweets/bulk", json=[
+        {"tweet_url": "https://x.com/bulk/status/101", "user_id": 1, "tags": ["eth", "#DeFi"]},
+        {"tweet_url": "https://x.com/bulk/status/100", "user_id": 1},
+        {"tweet_url": "https://twitter.com/bulk/status/101?s=20", "user_id": 1},
+        {"tweet_url": "https://example.com/bulk/status/102", "user_id": 1},
+        {"tweet_url": "https://x.com/bulk/status/103", "user_id": 999},
+        {"tweet_url": "https://x.com/bulk/status/104", "user_id": 1, "tags": ["eth"]},
+        {"tweet_url": "https://x.com/bulk/status/105", "user_id": 1, "comment": "third batch"},
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    results = body["results"]
+    assert [result["index"] for result in results] == list(range(7))
+    assert [result["status"] for result in results] == [
+        "created", "duplicate", "duplicate", "invalid", "invalid", "created", "created"
+    ]
+    assert results[1]["detail"] == "이미 등록된 트윗입니다."
+    assert results[2]["detail"] == "요청 안에서 중복된 트윗입니다."
+    assert results[3]["detail"] == "유효하지 않은 트위터 URL입니다."
+    assert results[4]["detail"] == "사용자를 찾을 수 없습니다."
+    assert [results[i]["tweet_id"] for i in (0, 1, 2, 4, 5, 6)] == ["101", "100", "101", "103", "104", "105"]
+    assert all(results[i]["id"] for i in (0, 5, 6))
+    assert (body["created"], body["duplicates"], body["invalid"]) == (3, 2, 2)
+
+    # 저장된 트윗과 태그, 카운터
+    created = bulk_client.get(f"/api/tweets/{results[0]['id']}").json()
+    assert sorted(tag["name"] for tag in created["tags"]) == ["defi", "eth"]
+    assert bulk_client.get("/api/tweets/" + results[6]["id"]).json()["comment"] == "third batch"
+    stats = bulk_client.get("/api/stats").json()
+    assert stats["total_tweets"] == 4
+    assert stats["total_tags"] == 2
+
+def test_bulk_repeated_request_is_all_duplicates(bulk_client):
+    items = [{"tweet_url": f"https://x.com/bulk/status/{200 + i}", "user_id": 1} for i in range(3)]
+    assert bulk_client.post("/api/tweets/bulk", json=items).json()["created"] == 3
+
+    body = bulk_client.post("/api/tweets/bulk", json=items).json()
+    assert (body["created"], body["duplicates"], body["invalid"]) == (0, 3, 0)
+    assert bulk_client.get("/api/stats").json()["total_tweets"] == 4
+
+def test_bulk_max_items(bulk_client, monkeypatch):
+    monkeypatch.setattr(tweets, "BULK_MAX_ITEMS", 3)
+    items = [{"tweet_url": f"https://x.com/bulk/status/{300 + i}", "user_id": 1} for i in range(4)]
+
+    response = bulk_client.post("/api/tweets/bulk", json=items)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "한 번에 최대 3개까지 등록할 수 있습니다."
+    # 제한을 넘으면 아무것도 저장하지 않음
+    assert bulk_client.get("/api/stats").json()["total_tweets"] == 1
+
+    # 제한과 같은 개수는 허용
+    response = bulk_client.post("/api/tweets/bulk", json=items[:3])
+    assert response.status_code == 200
+    assert response.json()["created"] == 3
+
+def test_bulk_empty_request(bulk_client):
+    body = bulk_client.post("/api/tweets/bulk", json=[]).json()
+    assert body == {"results": [], "created": 0, "duplicates": 0, "invalid": 0}
@@ -0,0 +1,55 @@
+"""
+app/utils/database_utils 테스트
+
+    python -m pytest tests/test_database_utils.py -q
+"""
+
+from sqlalchemy import event
+
+from app.models.models import Tag
+from app.utils import counters
+from app.utils.database_utils import get_or_create_tags
+
+def capture_statements(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    return statements
+
+def test_get_or_create_tags_inserts_only_missing_names(api):
+    _, engine, Session = api
+    db = Session()
+    get_or_create_tags(db, ["eth", "defi"])
+    db.commit()
+    eth_id = db.query(Tag.id).filter(Tag.name == "eth").scalar()
+
+    statements = capture_statements(engine)
+    tags = get_or_create_tags(db, ["#ETH", "defi", "ethena", "eth"])
+    db.commit()
+
+    assert [tag.name for tag in tags] == ["eth", "defi", "ethena"]
+    assert tags[0].id == eth_id
+    # SELECT ... IN 한 번 + 없는 이름만 INSERT 한 번
+    inserts = [(statement, parameters) for statement, parameters in statements if statement.lstrip().upper().startswith("INSERT INTO TAGS")]
+    assert len(inserts) == 1
+    assert "ethena" in str(inserts[0][1]) and "defi" not in str(inserts[0][1])
+    assert counters.get_stats_snapshot(db)["total_tags"] == 3
+    db.close()
+
+def test_get_or_create_tags_skips_insert_when_all_exist(api):
+    _, engine, Session = api
+    db = Session()
+    get_or_create_tags(db, ["eth", "defi"])
+    db.commit()
+
+    statements = capture_statements(engine)
+    tags = get_or_create_tags(db, ["defi", "eth"])
+    db.commit()
+
+    assert [tag.name for tag in tags] == ["defi", "eth"]
+    assert not [statement for statement, _ in statements if "INSERT" in statement.upper()]
+    assert counters.get_stats_snapshot(db)["total_tags"] == 2
+    db.close()
@@ -0,0 +1,156 @@
+"""
+트윗 미리보기 수집 파이프라인 테스트
+
+임시 SQLite DB에 API로 트윗을 등록해 대기열에 쌓이는지 확인하고, 로컬 FakePreviewProvider로
+워커를 실행해 100개 단위 배치 조회, 미리보기 백필, 실패 재시도, 한도 초과 처리를 검사합니다.
+
+    python -m pytest tests/test_enrichment.py -q
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.models import Tweet, EnrichmentJob
+from app.utils.enrichment import (
+    EnrichmentWorker, TokenBucket, enqueue_missing, queue_stats,
+    MAX_ATTEMPTS, STATUS_FAILED,
+)
+from app.utils.preview_providers import FakePreviewProvider
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+@pytest.fixture
+def env(api):
+    client, _, Session = api
+    client.post("/api/users", json={"telegram_id": 1, "telegram_username": "enrich", "display_name": "Enrich"})
+    return client, Session
+
+def share(client, count, start=1000):
+    response = client.post("/api/tweets/bulk", json=[
+        {"user_id": 1, "tweet_url": f"https://x.com/enrich/status/{start + i}", "comment": f"share {i}"}
+        for i in range(count)
+    ])
+    assert response.status_code == 200, response.text
+
+def make_worker(Session, provider, clock=None, batch_size=100):
+    clock = clock or FakeClock()
+    return EnrichmentWorker(Session, provider, TokenBucket(rate=1.0, capacity=100, clock=clock), batch_size=batch_size)
+
+def test_share_enqueues_and_worker_backfills_in_batches(env):
+    client, Session = env
+    share(client, 250)
+    response = client.post("/api/tweets", json={"user_id": 1, "tweet_url": "https://x.com/enrich/status/99", "comment": "single"})
+    assert response.status_code == 200
+    assert response.json()["content_preview"] == ""
+
+    db = Session()
+    assert queue_stats(db) == {"pending": 251, "failed": 0}
+    db.close()
+    search = {"search": "미리보기", "search_mode": "substring", "limit": 1}
+    assert client.get("/api/tweets", params=search).json()["total"] == 0
+
+    provider = FakePreviewProvider()
+    worker = make_worker(Session, provider)
+    assert worker.run_once() == 251
+    assert [len(call) for call in provider.calls] == [100, 100, 51]
+
+    db = Session()
+    assert queue_stats(db) == {"pending": 0, "failed": 0}
+    tweet = db.query(Tweet).filter(Tweet.tweet_id == "1042").one()
+    assert tweet.content_preview == "미리보기 1042"
+    assert tweet.image_url.endswith("/1042.jpg")
+    db.close()
+
+    # 백필된 내용이 API 응답에도 반영됨 (응답 캐시 무효화)
+    page = client.get("/api/tweets", params={"limit": 1, "fields": "tweet_id,content_preview"}).json()
+    assert page["tweets"][0]["content_preview"].startswith("미리보기")
+    # 미리보기가 검색 대상이 되므로 검색 개수도 갱신됨 (개수 캐시 무효화)
+    assert client.get("/api/tweets", params=search).json()["total"] == 251
+
+def test_missing_tweets_are_not_retried(env):
+    client, Session = env
+    share(client, 5)
+    provider = FakePreviewProvider(missing={"1001", "1003"})
+    assert make_worker(Session, provider).run_once() == 5
+
+    db = Session()
+    assert queue_stats(db) == {"pending": 0, "failed": 2}
+    assert db.get(EnrichmentJob, "1001").last_error == "not found"
+    # 실패로 남은 작업은 다시 대기열에 넣지 않음
+    assert enqueue_missing(db) == 0
+    db.close()
+
+def test_provider_errors_back_off_then_fail(env):
+    client, Session = env
+    share(client, 3)
+    provider = FakePreviewProvider(fail_times=MAX_ATTEMPTS)
+    worker = make_worker(Session, provider)
+    assert worker.run_once() == 3
+    assert len(provider.calls) == 1
+
+    db = Session()
+    job = db.get(EnrichmentJob, "1000")
+    assert job.attempts == 1 and job.status == "pending"
+    assert job.available_at > datetime.utcnow() + timedelta(seconds=30)
+
+    # 재시도 시각을 앞당겨 MAX_ATTEMPTS까지 실패시킴
+    for _ in range(MAX_ATTEMPTS - 1):
+        db.query(EnrichmentJob).update({EnrichmentJob.available_at: datetime.utcnow() - timedelta(seconds=1)})
+        db.commit()
+        worker.run_once()
+    db.expire_all()
+    job = db.get(EnrichmentJob, "1000")
+    assert job.status == STATUS_FAILED and job.attempts == MAX_ATTEMPTS
+    db.close()
+
+def test_rate_limit_pauses_bucket_and_releases_jobs(env):
+    client, Session = env
+    share(client, 150)
+    clock = FakeClock()
+    provider = FakePreviewProvider(rate_limit_after=1, retry_after=120)
+    worker = make_worker(Session, provider, clock)
+
+    assert worker.process_batch() == 100
+    assert worker.process_batch() == 50  # 한도 초과: 작업은 시도 횟수 없이 반환
+    assert worker.process_batch() is None
+    assert worker.bucket.wait_time() == pytest.approx(121, abs=1)
+
+    db = Session()
+    assert queue_stats(db) == {"pending": 50, "failed": 0}
+    released = db.get(EnrichmentJob, "1100")
+    assert released.attempts == 0 and released.available_at > datetime.utcnow()
+    db.close()
+
+def test_enqueue_missing_backfills_existing_tweets(env):
+    client, Session = env
+    share(client, 3)
+    db = Session()
+    db.query(EnrichmentJob).delete()
+    db.commit()
+    assert enqueue_missing(db, batch_size=2) == 3
+    assert enqueue_missing(db) == 0
+    assert queue_stats(db)["pending"] == 3
+    db.close()
+
+def test_token_bucket_limits_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.5, capacity=2, clock=clock)
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.wait_time() == pytest.approx(2.0)
+    clock.sleep(2.0)
+    assert bucket.try_acquire()
+
+    bucket.pause(10)
+    assert bucket.wait_time() == pytest.approx(12.0)
+    clock.sleep(12.0)
+    assert bucket.try_acquire()
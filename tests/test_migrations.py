@@ -0,0 +1,104 @@
+"""
+마이그레이션 테스트
+
+- Base.metadata.create_all로 만든 기존 DB(alembic_version 없음)에서 서버 시작 준비가 성공하는지
+- 0003: tweets.id / tweet_tags.tweet_id의 hex 문자열 <-> 16바이트 BLOB 변환
+
+    python -m pytest tests/test_migrations.py -q
+"""
+
+import os
+import uuid
+
+from conftest import api_client
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker, selectinload
+
+from app.db.database import PROJECT_ROOT, run_migrations
+from app.models.models import Base, User, Tweet, Tag
+
+def downgrade(engine, revision):
+    config = Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PROJECT_ROOT, "migrations"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.downgrade(config, revision)
+
+def test_app_starts_on_create_all_database(tmp_path):
+    db_path = tmp_path / "legacy.db"
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([User(telegram_id=1, telegram_username="legacy", display_name="Legacy"),
+                User(telegram_id=2, telegram_username="legacy2", display_name="Legacy 2")])
+    tag = Tag(name="eth", tweet_count=0, is_active=True)
+    for i in range(3):
+        db.add(Tweet(user_id=1 + i % 2, tweet_url=f"https://x.com/legacy/status/{i}", tweet_id=str(i),
+                     comment=f"legacy comment {i}", tags=[tag]))
+    db.commit()
+    db.close()
+    engine.dispose()
+
+    with api_client(db_path) as (client, engine, _):
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT version_num FROM alembic_version")).scalar() == "0005"
+        stats = client.get("/api/stats").json()
+        assert stats["total_tweets"] == 3
+        assert stats["total_users"] == 2
+        # 기존 트윗으로 전문 검색 인덱스가 채워짐
+        assert client.get("/api/tweets", params={"search": "legacy comment"}).json()["total"] == 3
+        assert client.get("/api/tags/eth/tweets").json()["tag"]["tweet_count"] == 3
+
+def test_0003_converts_hex_ids_to_blobs_and_back(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ids.db'}")
+    run_migrations("0002", bind=engine)
+
+    # 0002까지의 DB: UUID를 32자 hex 문자열로 저장
+    ids = [uuid.uuid4() for _ in range(3)]
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO users (telegram_id, telegram_username) VALUES (1, 'ids')"))
+        conn.execute(text("INSERT INTO tags (id, name, tweet_count, is_active) VALUES (1, 'eth', 2, 1), (2, 'defi', 1, 1)"))
+        for i, tweet_id in enumerate(ids):
+            conn.execute(text(
+                "INSERT INTO tweets (id, user_id, tweet_url, tweet_id) VALUES (:id, 1, :url, :tweet_id)"
+            ), {"id": tweet_id.hex, "url": f"https://x.com/ids/status/{i}", "tweet_id": str(i)})
+        conn.execute(text("INSERT INTO tweet_tags (tweet_id, tag_id) VALUES (:a, 1), (:b, 1), (:b, 2)"),
+                     {"a": ids[0].hex, "b": ids[1].hex})
+
+    def column_types(conn):
+        return (
+            {row[0] for row in conn.execute(text("SELECT typeof(id) FROM tweets"))},
+            {row[0] for row in conn.execute(text("SELECT typeof(tweet_id) FROM tweet_tags"))},
+        )
+
+    run_migrations("0003", bind=engine)
+    with engine.connect() as conn:
+        assert column_types(conn) == ({"blob"}, {"blob"})
+        assert conn.execute(text("SELECT id FROM tweets WHERE tweet_id = '1'")).scalar() == ids[1].bytes
+        # tweet_tags가 변환된 id로 그대로 조인됨
+        joined = conn.execute(text(
+            "SELECT count(*) FROM tweet_tags JOIN tweets ON tweets.id = tweet_tags.tweet_id"
+        )).scalar()
+        assert joined == 3
+
+    # 모델(CompactUUID)로 조회한 id와 태그 관계
+    db = sessionmaker(bind=engine)()
+    tweets = {tweet.id: tweet for tweet in db.query(Tweet).options(selectinload(Tweet.tags))}
+    assert set(tweets) == set(ids)
+    assert sorted(tag.name for tag in tweets[ids[1]].tags) == ["defi", "eth"]
+    assert [tag.name for tag in tweets[ids[0]].tags] == ["eth"]
+    assert tweets[ids[2]].tags == []
+    db.close()
+
+    # downgrade: 다시 32자 hex 문자열
+    downgrade(engine, "0002")
+    with engine.connect() as conn:
+        assert column_types(conn) == ({"text"}, {"text"})
+        assert sorted(row[0] for row in conn.execute(text("SELECT id FROM tweets"))) == sorted(i.hex for i in ids)
+        assert conn.execute(text(
+            "SELECT count(*) FROM tweet_tags JOIN tweets ON tweets.id = tweet_tags.tweet_id"
+        )).scalar() == 3
+    engine.dispose()
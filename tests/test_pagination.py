@@ -0,0 +1,97 @@
+"""
+커서(keyset) 페이징 테스트 (/api/tweets?cursor=)
+
+최신순/오래된순으로 next_cursor를 따라 끝까지 읽었을 때 (created_at, id) 순서 그대로
+중복이나 누락이 없는지, created_at이 같은 트윗이 페이지 경계에 걸려도 id로 이어지는지,
+잘못된 커서는 400인지 확인합니다.
+
+    python -m pytest tests/test_pagination.py -q
+"""
+
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.models import Tweet
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts
+
+TWEETS = 11
+
+@pytest.fixture(scope="module")
+def page_api(module_api):
+    client, _, Session = module_api
+    client.post("/api/users", json={"telegram_id": 1, "telegram_username": "pages", "display_name": "Pages"})
+    client.post("/api/tweets/bulk", json=[
+        {"user_id": 1, "tweet_url": f"https://x.com/pages/status/{i}"} for i in range(TWEETS)
+    ])
+
+    # 같은 created_at을 가진 트윗 묶음 (페이지 크기 3보다 크게 만들어 경계에 걸리도록)
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    db = Session()
+    for i, tweet in enumerate(db.query(Tweet).order_by(Tweet.tweet_id)):
+        tweet.created_at = base + timedelta(minutes=i // 5)
+    db.commit()
+    expected = sorted(((tweet.created_at, tweet.id) for tweet in db.query(Tweet)), reverse=True)
+    db.close()
+    invalidate_responses()
+    invalidate_tweet_counts()
+    return client, [str(tweet_id) for _, tweet_id in expected]
+
+def walk(client, **params):
+    """next_cursor를 따라 모든 페이지를 읽고 트윗 id 목록을 반환합니다"""
+    ids = []
+    cursor = None
+    for _ in range(TWEETS + 1):
+        response = client.get("/api/tweets", params={"limit": 3, "include_total": "false", **params,
+                                                     **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        page = response.json()
+        ids += [tweet["id"] for tweet in page["tweets"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            return ids
+    pytest.fail("next_cursor가 끝나지 않음")
+
+def test_walk_newest_pages(page_api):
+    client, expected = page_api
+    ids = walk(client)
+    assert ids == expected
+    assert len(set(ids)) == TWEETS
+
+def test_walk_oldest_pages(page_api):
+    client, expected = page_api
+    assert walk(client, sort_by="oldest") == expected[::-1]
+
+def test_cursor_continues_inside_created_at_ties(page_api):
+    client, expected = page_api
+    # 첫 페이지 마지막 트윗과 같은 created_at인 트윗이 다음 페이지에 이어서 나옴
+    first = client.get("/api/tweets", params={"limit": 3}).json()
+    second = client.get("/api/tweets", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    assert first["tweets"][-1]["created_at"] == second["tweets"][0]["created_at"]
+    assert [tweet["id"] for tweet in first["tweets"] + second["tweets"]] == expected[:6]
+
+def test_last_page_has_no_cursor(page_api):
+    client, expected = page_api
+    page = client.get("/api/tweets", params={"limit": TWEETS + 1}).json()
+    assert [tweet["id"] for tweet in page["tweets"]] == expected
+    assert page["next_cursor"] is None
+
+def encode(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+@pytest.mark.parametrize("cursor", [
+    "not-a-cursor",
+    "%%%",
+    encode({"created_at": "2026-01-01"}),
+    encode(["2026-01-01T12:00:00"]),
+    encode([1, 2]),
+    encode(["yesterday", "00000000-0000-0000-0000-000000000000"]),
+    encode(["2026-01-01T12:00:00", "not-a-uuid"]),
+])
+def test_malformed_cursor_returns_400(page_api, cursor):
+    client, _ = page_api
+    response = client.get("/api/tweets", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "유효하지 않은 커서입니다."
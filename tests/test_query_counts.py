@@ -0,0 +1,133 @@
+"""
+엔드포인트별 SQL 쿼리 수 상한 테스트
+
+임시 SQLite DB에 여러 사용자/태그의 트윗을 만들고 각 엔드포인트가 실행한 쿼리 수
+(X-DB-Query-Count 헤더)가 상한을 넘지 않는지 검사합니다. 목록은 id 페이지 + 엔티티 +
+selectinload(user, tags) + count로 페이지 크기와 무관하게 일정하며, 지연 로딩(N+1)이
+생기면 페이지 크기만큼 쿼리가 늘어나 실패합니다.
+/api 읽기 경로는 conditional_get 미들웨어의 데이터 버전 조회 1회(TTL이 지났을 때)가 상한에 포함됩니다.
+
+    python -m pytest tests/test_query_counts.py -q
+"""
+
+import pytest
+
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts, data_version, DataVersion
+from app.utils import counters
+from app.models.models import Tweet
+
+def assert_max_queries(client, path, max_queries, method="GET"):
+    """
+    요청 하나가 실행한 SQL 수가 max_queries 이하인지 확인합니다.
+    캐시를 비운 뒤 요청하므로 캐시되지 않은 경로의 쿼리 수를 검사합니다.
+
+    Returns:
+        Response: 요청 응답
+    """
+    invalidate_responses()
+    invalidate_tweet_counts()
+    response = client.request(method, path)
+    assert response.status_code < 400, response.text
+    count = int(response.headers["X-DB-Query-Count"])
+    assert count <= max_queries, f"{method} {path}: {count} queries (max {max_queries})"
+    return response
+
+@pytest.fixture(scope="module")
+def count_client(module_api):
+    client, _, Session = module_api
+    for user_id in range(1, 6):
+        client.post("/api/users", json={"telegram_id": user_id, "telegram_username": f"count{user_id}", "display_name": f"Count {user_id}"})
+    client.post("/api/tweets/bulk", json=[
+        {"user_id": 1 + i % 5, "tweet_url": f"https://x.com/count/status/{i}", "tags": [f"tag{i % 7}", "common"]}
+        for i in range(100)
+    ])
+
+    return client, Session
+
+@pytest.mark.parametrize("path, max_queries", [
+    ("/api/tweets?limit=20", 6),
+    ("/api/tweets?limit=20&include_total=false", 5),
+    ("/api/tweets?limit=20&tags=tag3&tags=common&tag_mode=all&tag_match=exact", 7),
+    ("/api/tweets?limit=20&fields=tweet_url,comment,created_at,user,tags", 5),
+    ("/api/users", 2),
+    ("/api/users/1", 2),
+    ("/api/users/1/tweets?limit=20", 7),
+    ("/api/tags", 2),
+    ("/api/tags/popular", 2),
+    ("/api/tags/tag3/tweets?limit=20", 7),
+    ("/api/stats", 2),
+    ("/api/stats/timeseries?tag=tag3", 3),
+    ("/api/users/stats/top-contributors", 2),
+    ("/api/users?sort_by=active", 2),
+])
+def test_endpoint_query_budget(count_client, path, max_queries):
+    client, _ = count_client
+    assert_max_queries(client, path, max_queries)
+
+def test_tweet_detail_query_budget(count_client):
+    client, _ = count_client
+    tweet_id = client.get("/api/tweets?limit=1").json()["tweets"][0]["id"]
+    response = assert_max_queries(client, f"/api/tweets/{tweet_id}", 2)
+    assert response.json()["user"] is not None
+    assert len(response.json()["tags"]) == 2
+
+def test_conditional_get_skips_database(count_client):
+    client, _ = count_client
+    etag = client.get("/api/tweets?limit=20").headers["ETag"]
+    response = client.get("/api/tweets?limit=20", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    # 데이터 버전은 프로세스 내 사본을 사용하므로 DB 조회 없음
+    assert response.headers["X-DB-Query-Count"] == "0"
+
+def test_conditional_get_sees_writes_from_other_processes(count_client, monkeypatch):
+    client, Session = count_client
+    # TTL이 지난 상황 - 매 요청 DB의 데이터 버전을 다시 읽음
+    monkeypatch.setattr(data_version, "ttl", 0)
+    data_version.reset()
+    first = client.get("/api/tweets?limit=1")
+    tweet_id = first.json()["tweets"][0]["tweet_id"]
+
+    # API를 거치지 않은 쓰기 (스크립트 등 다른 프로세스와 같은 경우) - 응답 캐시는 비워지지 않음
+    db = Session()
+    db.query(Tweet).filter(Tweet.tweet_id == tweet_id).update({Tweet.comment: "outside write"})
+    counters.bump_data_version(db)
+    db.commit()
+    db.close()
+
+    response = client.get("/api/tweets?limit=1", headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert response.json()["tweets"][0]["comment"] == "outside write"
+
+def test_conditional_get_sees_local_writes_immediately(count_client):
+    client, _ = count_client
+    first = client.get("/api/tweets?limit=1")
+    created = client.post("/api/tweets", json={
+        "tweet_url": "https://x.com/count1/status/990001", "comment": "local write", "user_id": 1
+    })
+    assert created.status_code == 200, created.text
+
+    # TTL 안이어도 이 프로세스의 쓰기는 바로 새 ETag
+    response = client.get("/api/tweets?limit=1", headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+    assert response.json()["tweets"][0]["comment"] == "local write"
+
+def test_data_version_ignores_stale_refresh():
+    clock = [0.0]
+    version = DataVersion(ttl=2.0, clock=lambda: clock[0])
+    assert version.current() is None
+
+    older = version.begin_refresh()
+    newer = version.begin_refresh()
+    assert version.finish_refresh(newer, "7") == "7"
+    # 먼저 시작해 늦게 끝난 조회는 더 오래된 값이므로 무시
+    assert version.finish_refresh(older, "6") == "7"
+
+    # 조회 중에 끝난 이 프로세스의 쓰기는 새로 읽은 값에 더해짐
+    clock[0] = 5.0
+    ticket = version.begin_refresh()
+    version.bump()
+    refreshed = version.finish_refresh(ticket, "8")
+    assert refreshed not in ("7", "8")
+    assert version.current() == refreshed
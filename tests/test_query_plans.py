@@ -0,0 +1,87 @@
+"""
+목록 API 쿼리 플랜 테스트
+
+임시 SQLite DB에 마이그레이션을 적용하고 각 목록 엔드포인트가 실행한 SELECT를
+EXPLAIN QUERY PLAN으로 확인해 tweets / tweet_tags / tags를 인덱스 없이
+전체 스캔하지 않는지 검사합니다.
+
+    python -m pytest tests/test_query_plans.py -q
+"""
+
+import re
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts
+
+# 인덱스 없이 테이블 전체를 읽는 플랜 (예: "SCAN tweets")
+FULL_SCAN = re.compile(r"^SCAN (tweets|tweet_tags|tags)\b(?!.*USING)")
+
+@pytest.fixture(scope="module")
+def plan_client(module_api):
+    client, engine, _ = module_api
+    client.post("/api/users", json={"telegram_id": 1, "telegram_username": "plan", "display_name": "Plan"})
+    client.post("/api/users", json={"telegram_id": 2, "telegram_username": "plan2", "display_name": "Plan 2"})
+    client.post("/api/tweets/bulk", json=[
+        {"user_id": 1 + i % 2, "tweet_url": f"https://x.com/plan/status/{i}", "tags": [f"tag{i % 10}", "common"]}
+        for i in range(500)
+    ])
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+
+    statements = []
+
+    # 같은 DB 파일의 모든 엔진 (ASYNC_DB=true의 aiosqlite 엔진 포함)에서 실행된 SELECT 수집
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if conn.engine.url.database != engine.url.database:
+            return
+        if statement.lstrip().upper().startswith("SELECT") and not statement.startswith("EXPLAIN"):
+            statements.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    yield client, engine, statements
+    event.remove(Engine, "before_cursor_execute", capture)
+
+def full_scans(engine, statements):
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            scans += [(row[3], statement) for row in plan if FULL_SCAN.match(row[3])]
+    return scans
+
+def cursor_for(client, path):
+    return client.get(path).json()["next_cursor"]
+
+@pytest.mark.parametrize("path", [
+    "/api/tweets?limit=20",
+    "/api/tweets?limit=20&sort_by=oldest",
+    "/api/tweets?limit=20&skip=100",
+    "/api/tweets?limit=20&user_id=1",
+    "/api/tweets?limit=20&tag=tag3&tag_match=exact",
+    "/api/tweets?limit=20&tags=tag3&tags=common&tag_mode=all&tag_match=exact",
+    "/api/tweets?limit=20&cursor={cursor}",
+    "/api/tweets?limit=20&fields=tweet_url,comment,created_at,user,tags",
+    "/api/users/1/tweets?limit=20",
+    "/api/users/1/tweets?limit=20&cursor={cursor}",
+    "/api/tags/tag3/tweets?limit=20",
+    "/api/tags?sort_by=popular",
+    "/api/tags/popular",
+    "/api/users/stats/top-contributors",
+    "/api/stats/timeseries?tag=tag3&period=hour&days=2",
+])
+def test_list_endpoint_uses_index(plan_client, path):
+    client, engine, statements = plan_client
+    if "{cursor}" in path:
+        path = path.format(cursor=cursor_for(client, path.split("cursor=")[0] + "include_total=false"))
+
+    invalidate_responses()
+    invalidate_tweet_counts()
+    statements.clear()
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert statements
+
+    assert full_scans(engine, statements) == []
@@ -0,0 +1,101 @@
+"""
+트윗 검색 테스트 (/api/tweets?search=)
+
+SQLite FTS5(trigram) 인덱스 매칭, 관련도순 정렬, 트리거를 통한 인덱스 동기화(수정/삭제),
+짧은 검색어와 search_mode=substring의 substring 대체를 확인합니다.
+
+    python -m pytest tests/test_search.py -q
+"""
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.models.models import Tweet
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts
+
+COMMENTS = {
+    9001: "bitcoin",
+    9002: "a long note that mentions bitcoin once among many other words about markets, charts and macro news",
+    9003: "ethereum staking yields",
+    9004: "ok",
+}
+
+@pytest.fixture
+def search_api(api):
+    client, engine, Session = api
+    client.post("/api/users", json={"telegram_id": 1, "telegram_username": "search", "display_name": "Search"})
+    for status_id, comment in COMMENTS.items():
+        response = client.post("/api/tweets", json={
+            "tweet_url": f"https://x.com/search/status/{status_id}", "comment": comment, "user_id": 1
+        })
+        assert response.status_code == 200, response.text
+
+    statements = []
+
+    # 같은 DB 파일의 모든 엔진 (ASYNC_DB=true의 aiosqlite 엔진 포함)에서 실행된 SQL 수집
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if conn.engine.url.database == engine.url.database:
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    yield client, Session, statements
+    event.remove(Engine, "before_cursor_execute", capture)
+
+def search(client, query, **params):
+    invalidate_responses()
+    invalidate_tweet_counts()
+    response = client.get("/api/tweets", params={"search": query, **params})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def comments(page):
+    return [tweet["comment"] for tweet in page["tweets"]]
+
+def test_fulltext_search_uses_index(search_api):
+    client, _, statements = search_api
+    page = search(client, "bitcoin")
+    assert sorted(comments(page)) == sorted([COMMENTS[9001], COMMENTS[9002]])
+    assert page["total"] == 2
+    assert any("tweets_fts MATCH" in statement for statement in statements)
+
+    # 단어 중간 부분 문자열도 trigram으로 매칭
+    assert comments(search(client, "ereum")) == [COMMENTS[9003]]
+    assert search(client, "dogecoin")["tweets"] == []
+
+def test_relevance_ordering(search_api):
+    client, _, _ = search_api
+    page = search(client, "bitcoin", sort_by="relevance")
+    # bm25 - 같은 횟수면 짧은 문서가 더 관련도가 높음
+    assert comments(page) == [COMMENTS[9001], COMMENTS[9002]]
+    assert page["next_cursor"] is None
+
+def test_index_follows_update_and_delete(search_api):
+    client, Session, _ = search_api
+    assert comments(search(client, "staking")) == [COMMENTS[9003]]
+
+    # API를 거치지 않은 수정도 UPDATE 트리거로 인덱스에 반영
+    db = Session()
+    db.query(Tweet).filter(Tweet.tweet_id == "9003").update({Tweet.comment: "solana restaking"})
+    db.commit()
+    db.close()
+    assert comments(search(client, "solana")) == ["solana restaking"]
+    assert search(client, "ethereum")["tweets"] == []
+
+    # 삭제 후에는 검색되지 않음 (DELETE 트리거)
+    tweet = search(client, "solana")["tweets"][0]
+    response = client.delete(f"/api/tweets/{tweet['id']}", params={"user_id": 1})
+    assert response.status_code == 200, response.text
+    page = search(client, "solana")
+    assert page["tweets"] == [] and page["total"] == 0
+
+def test_short_query_falls_back_to_substring(search_api):
+    client, _, statements = search_api
+    statements.clear()
+    # trigram은 3글자 미만을 매칭할 수 없으므로 ilike 검색
+    assert comments(search(client, "ok")) == [COMMENTS[9004]]
+    assert not any("tweets_fts" in statement for statement in statements)
+
+    statements.clear()
+    assert sorted(comments(search(client, "bitcoin", search_mode="substring"))) == sorted([COMMENTS[9001], COMMENTS[9002]])
+    assert not any("tweets_fts" in statement for statement in statements)
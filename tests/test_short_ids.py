@@ -0,0 +1,82 @@
+"""
+짧은 ID 조회/삭제 테스트 (GET/DELETE /api/tweets/resolve/{short_id})
+
+UUID 앞부분으로 사용자의 트윗을 찾고 삭제하는 경로에서 404(없음, 형식 오류),
+409(여러 트윗이 일치), 다른 사용자의 트윗(404, 삭제되지 않음)을 확인합니다.
+
+    python -m pytest tests/test_short_ids.py -q
+"""
+
+from uuid import UUID
+
+import pytest
+
+from app.models.models import Tweet
+from app.utils import counters
+
+# 앞 8자리가 같은 두 트윗 (모호한 짧은 ID) + 다른 사용자의 트윗
+OWNED = [UUID("abcd1234-0000-4000-8000-000000000001"), UUID("abcd1234-ffff-4000-8000-000000000002")]
+OTHER = UUID("9f9f0000-0000-4000-8000-000000000003")
+
+@pytest.fixture
+def short_id_client(api):
+    client, _, Session = api
+    for user_id in (1, 2):
+        client.post("/api/users", json={"telegram_id": user_id, "telegram_username": f"short{user_id}", "display_name": f"Short {user_id}"})
+    db = Session()
+    new_tweets = [
+        Tweet(id=tweet_id, user_id=user_id, tweet_url=f"https://x.com/short/status/{i}", tweet_id=str(i))
+        for i, (tweet_id, user_id) in enumerate([(OWNED[0], 1), (OWNED[1], 1), (OTHER, 2)])
+    ]
+    db.add_all(new_tweets)
+    db.flush()
+    counters.on_tweets_created(db, new_tweets)
+    db.commit()
+    db.close()
+    return client
+
+def test_resolve_unique_prefix(short_id_client):
+    response = short_id_client.get("/api/tweets/resolve/abcd1234-0", params={"user_id": 1})
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == str(OWNED[0])
+
+    # 대소문자 무시, 하이픈 없이도 같은 트윗
+    assert short_id_client.get("/api/tweets/resolve/ABCD1234F", params={"user_id": 1}).json()["id"] == str(OWNED[1])
+
+@pytest.mark.parametrize("short_id", ["0000", "abc", "xyz12345", "abcd1234-0000-4000-8000-000000000009"])
+def test_resolve_not_found(short_id_client, short_id):
+    response = short_id_client.get(f"/api/tweets/resolve/{short_id}", params={"user_id": 1})
+    assert response.status_code == 404
+
+def test_ambiguous_prefix_conflicts(short_id_client):
+    response = short_id_client.get("/api/tweets/resolve/abcd1234", params={"user_id": 1})
+    assert response.status_code == 409
+
+    response = short_id_client.delete("/api/tweets/resolve/abcd1234", params={"user_id": 1})
+    assert response.status_code == 409
+    # 아무것도 삭제되지 않음
+    assert short_id_client.get("/api/stats").json()["total_tweets"] == 3
+
+def test_other_users_tweet_is_not_resolved_or_deleted(short_id_client):
+    # 짧은 ID는 요청한 사용자의 트윗 안에서만 찾음
+    assert short_id_client.get("/api/tweets/resolve/9f9f0000", params={"user_id": 1}).status_code == 404
+    assert short_id_client.delete("/api/tweets/resolve/9f9f0000", params={"user_id": 1}).status_code == 404
+    assert short_id_client.get(f"/api/tweets/{OTHER}").status_code == 200
+
+    # 짧은 ID 대신 전체 ID로 삭제해도 본인 트윗이 아니면 거부
+    response = short_id_client.delete(f"/api/tweets/{OTHER}", params={"user_id": 1})
+    assert response.status_code == 403
+    assert short_id_client.get(f"/api/tweets/{OTHER}").status_code == 200
+
+def test_delete_by_short_id(short_id_client):
+    response = short_id_client.delete("/api/tweets/resolve/abcd1234-f", params={"user_id": 1})
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == str(OWNED[1])
+    assert response.json()["tweet_url"] == "https://x.com/short/status/1"
+
+    assert short_id_client.get(f"/api/tweets/{OWNED[1]}").status_code == 404
+    assert short_id_client.get("/api/stats").json()["total_tweets"] == 2
+    # 남은 한 트윗만 일치하므로 이제 모호하지 않음
+    assert short_id_client.get("/api/tweets/resolve/abcd1234", params={"user_id": 1}).json()["id"] == str(OWNED[0])
+    assert short_id_client.delete("/api/tweets/resolve/abcd1234", params={"user_id": 1}).status_code == 200
+    assert short_id_client.get("/api/tweets/resolve/abcd1234", params={"user_id": 1}).status_code == 404
@@ -0,0 +1,73 @@
+"""
+태그 필터 테스트 (/api/tweets?tag=, tags=, tag_mode=, tag_match=)
+
+tag_mode(any/all) x tag_match(exact/partial) 조합과 단일 tag 필터를 확인합니다.
+exact는 태그명이 정확히 같아야 하고 (eth가 ethena에 매칭되지 않음), all은 모든 태그를 가진 트윗만 반환합니다.
+
+    python -m pytest tests/test_tag_filters.py -q
+"""
+
+import pytest
+
+from app.utils.cache import invalidate_responses, invalidate_tweet_counts
+
+# 트윗(status id) -> 태그
+TWEET_TAGS = {
+    "1": ["eth"],
+    "2": ["ethena"],
+    "3": ["eth", "defi"],
+    "4": ["ethena", "defi"],
+    "5": ["btc"],
+    "6": [],
+}
+
+@pytest.fixture(scope="module")
+def tag_client(module_api):
+    client, _, _ = module_api
+    client.post("/api/users", json={"telegram_id": 1, "telegram_username": "tags", "display_name": "Tags"})
+    response = client.post("/api/tweets/bulk", json=[
+        {"user_id": 1, "tweet_url": f"https://x.com/tags/status/{status_id}", "tags": tags}
+        for status_id, tags in TWEET_TAGS.items()
+    ])
+    assert response.status_code == 200, response.text
+    return client
+
+def matching(client, **params):
+    """필터에 맞는 트윗의 status id 집합 (total도 같은지 확인)"""
+    invalidate_responses()
+    invalidate_tweet_counts()
+    response = client.get("/api/tweets", params={"limit": 100, **params})
+    assert response.status_code == 200, response.text
+    page = response.json()
+    assert page["total"] == len(page["tweets"])
+    return {tweet["tweet_id"] for tweet in page["tweets"]}
+
+@pytest.mark.parametrize("tags, mode, match, expected", [
+    (["eth"], "any", "exact", {"1", "3"}),
+    (["eth"], "any", "partial", {"1", "2", "3", "4"}),
+    (["eth", "btc"], "any", "exact", {"1", "3", "5"}),
+    (["eth", "btc"], "any", "partial", {"1", "2", "3", "4", "5"}),
+    (["eth", "defi"], "all", "exact", {"3"}),
+    (["eth", "defi"], "all", "partial", {"3", "4"}),
+    (["eth", "btc"], "all", "exact", set()),
+    (["eth", "missing"], "all", "exact", set()),
+    (["eth", "missing"], "any", "exact", {"1", "3"}),
+    (["missing"], "any", "exact", set()),
+])
+def test_tag_mode_and_match(tag_client, tags, mode, match, expected):
+    assert matching(tag_client, tags=tags, tag_mode=mode, tag_match=match) == expected
+
+@pytest.mark.parametrize("match, expected", [
+    ("exact", {"1", "3"}),
+    ("partial", {"1", "2", "3", "4"}),
+])
+def test_single_tag(tag_client, match, expected):
+    assert matching(tag_client, tag="eth", tag_match=match) == expected
+
+def test_tag_names_are_normalized(tag_client):
+    # 대소문자, 앞의 #, 공백은 저장할 때와 같이 정규화
+    assert matching(tag_client, tags=["#ETH ", "Defi"], tag_mode="all", tag_match="exact") == {"3"}
+
+def test_single_tag_ignores_tag_mode(tag_client):
+    # tag_mode는 tags(여러 태그)에만 적용
+    assert matching(tag_client, tag="eth", tag_mode="all", tag_match="exact") == {"1", "3"}